@@ -1 +1,2 @@
 from .host import NetworkHost, CTERAHost, authenticated  # noqa: E402, F401
+from .async_host import AsyncCTERAHost  # noqa: E402, F401
@@ -0,0 +1,118 @@
+from .http import ContentType, HTTPException, geturi
+from .async_http import AsyncHTTPClient
+from .cteraclient import CTERAClient
+from ..convert import toxmlstr
+from ..exception import CTERAClientException
+from ..lib import Command
+from ..common import Object
+
+
+class AsyncCTERAClient:  # pylint: disable=too-many-public-methods
+
+    def __init__(self, session_id_key):
+        self.http_client = AsyncHTTPClient(session_id_key)
+
+    async def get(self, baseurl, path, params=None):
+        function = Command(AsyncHTTPClient.get, self.http_client, geturi(baseurl, path), params if params else {})
+        return await self._execute(function)
+
+    async def download(self, baseurl, path, params):
+        function = Command(AsyncHTTPClient.get, self.http_client, geturi(baseurl, path), params, None, True)
+        return await self._execute(function, return_function=CTERAClient.file_descriptor)
+
+    async def download_zip(self, baseurl, path, form_data):
+        function = Command(AsyncHTTPClient.post, self.http_client, geturi(baseurl, path), ContentType.urlencoded, form_data,
+                           urlencode=True, idempotent=self.http_client.retry_policy.is_safe(path))
+        return await self._execute(function, return_function=CTERAClient.file_descriptor)
+
+    async def get_multi(self, baseurl, path, paths):
+        return await self.db(baseurl, path, "get-multi", paths)
+
+    async def put(self, baseurl, path, data):
+        function = Command(AsyncHTTPClient.put, self.http_client, geturi(baseurl, path), ContentType.textplain, toxmlstr(data),
+                           compress=True)
+        return await self._execute(function)
+
+    async def post(self, baseurl, path, data):
+        function = Command(AsyncHTTPClient.post, self.http_client, geturi(baseurl, path), ContentType.textplain, toxmlstr(data),
+                           compress=True)
+        return await self._execute(function)
+
+    async def form_data(self, baseurl, path, form_data):
+        function = Command(AsyncHTTPClient.post, self.http_client, geturi(baseurl, path), ContentType.urlencoded, form_data,
+                           urlencode=True, idempotent=self.http_client.retry_policy.is_safe(path))
+        return await self._execute(function)
+
+    async def execute(self, baseurl, path, name, param=None):
+        return await self._ctera_exec(baseurl, path, 'user-defined', name, param)
+
+    async def delete(self, baseurl, path):
+        function = Command(AsyncHTTPClient.delete, self.http_client, geturi(baseurl, path))
+        return await self._execute(function)
+
+    async def mkcol(self, baseurl, path):
+        function = Command(AsyncHTTPClient.mkcol, self.http_client, geturi(baseurl, path))
+        return await self._execute(function)
+
+    async def copy(self, baseurl, src, dest, overwrite):
+        function = Command(AsyncHTTPClient.copy, self.http_client, geturi(baseurl, src), geturi(baseurl, dest), overwrite)
+        return await self._execute(function)
+
+    async def move(self, baseurl, src, dest, overwrite):
+        function = Command(AsyncHTTPClient.move, self.http_client, geturi(baseurl, src), geturi(baseurl, dest), overwrite)
+        return await self._execute(function)
+
+    async def db(self, baseurl, path, name, param):
+        return await self._ctera_exec(baseurl, path, 'db', name, param)
+
+    async def multipart(self, baseurl, path, form_data):
+        function = Command(AsyncHTTPClient.multipart, self.http_client, geturi(baseurl, path), form_data)
+        return await self._execute(function)
+
+    async def upload(self, baseurl, path, form_data):
+        function = Command(AsyncHTTPClient.upload, self.http_client, geturi(baseurl, path), form_data)
+        return await self._execute(function)
+
+    async def _ctera_exec(self, baseurl, path, exec_type, name, param):
+        obj = Object()
+        obj.type = exec_type
+        obj.name = name
+        obj.param = param
+        function = Command(AsyncHTTPClient.post, self.http_client, geturi(baseurl, path), ContentType.textplain, toxmlstr(obj),
+                           idempotent=self.http_client.retry_policy.is_safe(name), compress=True, name=name)
+        return await self._execute(function)
+
+    def get_session_id(self):
+        return self.http_client.get_session_id()
+
+    def set_session_id(self, session_id):
+        self.http_client.set_session_id(session_id)
+
+    def compression_stats(self):
+        return self.http_client.compression_stats()
+
+    def metrics(self):
+        return self.http_client.metrics()
+
+    def add_request_hook(self, hook):
+        self.http_client.instrumentation.add_hook(hook)
+
+    def remove_request_hook(self, hook):
+        self.http_client.instrumentation.remove_hook(hook)
+
+    def set_authorization_headers(self, headers):
+        self.http_client.set_custom_headers(headers)
+
+    async def close(self):
+        await self.http_client.close()
+
+    @staticmethod
+    async def _execute(function, return_function=None):
+        return_function = return_function or CTERAClient.fromxmlstr
+        try:
+            request, response = await function()
+            return return_function(request, response)
+        except HTTPException as http_error:
+            client_error = CTERAClientException()
+            client_error.__dict__ = http_error.__dict__.copy()
+            raise client_error
@@ -0,0 +1,200 @@
+import logging
+
+from ..convert import LazyJSON
+from .host import NetworkHost, authenticated
+from .async_cteraclient import AsyncCTERAClient
+
+
+class AsyncCTERAHost(NetworkHost):  # pylint: disable=too-many-public-methods
+    """
+    Asynchronous counterpart of :py:class:`cterasdk.client.host.CTERAHost`.
+
+    Every request method is a coroutine, allowing many requests to be kept in flight from a single event loop
+    """
+
+    def __init__(self, host, port, https):
+        super().__init__(host, port, https)
+        self._ctera_client = AsyncCTERAClient(self._session_id_key)
+        self._session = None
+
+    @property
+    def _omit_fields(self):
+        return super()._omit_fields + [
+            'login',
+            'logout'
+        ]
+
+    @property
+    def base_api_url(self):
+        raise NotImplementedError("Implementing class must implement the base_api_url property")
+
+    @property
+    def base_file_url(self):
+        raise NotImplementedError("Implementing class must implement the base_api_url property")
+
+    @property
+    def _session_id_key(self):
+        raise NotImplementedError("Implementing class must implement the _session_id_key property")
+
+    def _is_authenticated(self, function, *args, **kwargs):
+        raise NotImplementedError("Implementing class must implement the _is_authenticated method")
+
+    async def _login(self, username, password):
+        raise NotImplementedError("Implementing class must implement the _login method")
+
+    async def _logout(self):
+        raise NotImplementedError("Implementing class must implement the _logout method")
+
+    async def login(self, username, password):
+        """
+        Log in
+
+        :param str username: User name to log in
+        :param str password: User password
+        """
+        await self._login(username, password)
+        await self._session.async_start_local_session(self)
+
+    async def logout(self):
+        """ Log out """
+        await self._logout()
+        self._session.terminate()
+
+    async def close(self):
+        """ Close the connections held by this object """
+        await self._ctera_client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def session(self):
+        return self._session
+
+    def register_session(self, session):
+        self._session = session
+
+    async def default_class(self, name):
+        return await self.get('/defaults/' + name)
+
+    @authenticated
+    async def get(self, path, params=None, use_file_url=False):
+        """ Retrieve a schema object as a Python object. """
+        return await self._ctera_client.get(self.base_file_url if use_file_url else self.base_api_url, path, params or {})
+
+    @authenticated
+    async def openfile(self, path, params=None, use_file_url=False):
+        return await self._ctera_client.download(self.base_file_url if use_file_url else self.base_api_url, path, params or {})
+
+    @authenticated
+    async def download_zip(self, path, form_data, use_file_url=False):
+        return await self._ctera_client.download_zip(self.base_file_url if use_file_url else self.base_api_url, path, form_data)
+
+    @authenticated
+    async def get_multi(self, path, paths, use_file_url=False):
+        """ Retrieve one or more schema objects as a Python object. """
+        return await self._ctera_client.get_multi(self.base_file_url if use_file_url else self.base_api_url, path, paths)
+
+    @authenticated
+    async def put(self, path, value, use_file_url=False):
+        """ Update a schema object or attribute. """
+        response = await self._ctera_client.put(self.base_file_url if use_file_url else self.base_api_url, path, value)
+        logging.getLogger().debug('Configuration changed. %s', {'url': path, 'value': LazyJSON(value, pretty_print=False)})
+        return response
+
+    @authenticated
+    async def post(self, path, value, use_file_url=False):
+        response = await self._ctera_client.post(self.base_file_url if use_file_url else self.base_api_url, path, value)
+        logging.getLogger().debug('Added. %s', {'url': path, 'value': LazyJSON(value, pretty_print=False)})
+        return response
+
+    async def form_data(self, path, form_data, use_file_url=False):
+        return await self._ctera_client.form_data(self.base_file_url if use_file_url else self.base_api_url, path, form_data)
+
+    @authenticated
+    async def db(self, path, name, param, use_file_url=False):
+        response = await self._ctera_client.db(self.base_file_url if use_file_url else self.base_api_url, path, name, param)
+        logging.getLogger().debug(
+            'Database method executed. %s',
+            {'url': path, 'name': name, 'param': LazyJSON(param, pretty_print=False)}
+        )
+        return response
+
+    @authenticated
+    async def execute(self, path, name, param=None, use_file_url=False):
+        """ Execute a schema object method. """
+        response = await self._ctera_client.execute(self.base_file_url if use_file_url else self.base_api_url, path, name, param)
+        logging.getLogger().debug(
+            'User-defined method executed. %s',
+            {'url': path, 'name': name, 'param': LazyJSON(param, pretty_print=False)}
+        )
+        return response
+
+    @authenticated
+    async def add(self, path, param, use_file_url=False):
+        """ Add a schema object. """
+        return await self.db(path, 'add', param, use_file_url=use_file_url)
+
+    @authenticated
+    async def delete(self, path, use_file_url=False):
+        """ Delete a schema object. """
+        response = await self._ctera_client.delete(self.base_file_url if use_file_url else self.base_api_url, path)
+        logging.getLogger().debug('Deleted. %s', {'url': path})
+        return response
+
+    @authenticated
+    async def mkcol(self, path, use_file_url=False):
+        return await self._ctera_client.mkcol(self.base_file_url if use_file_url else self.base_api_url, path)
+
+    @authenticated
+    async def copy(self, src, dest, overwrite, use_file_url=False):
+        return await self._ctera_client.copy(self.base_file_url if use_file_url else self.base_api_url, src, dest, overwrite)
+
+    @authenticated
+    async def move(self, src, dest, overwrite, use_file_url=False):
+        return await self._ctera_client.move(self.base_file_url if use_file_url else self.base_api_url, src, dest, overwrite)
+
+    @authenticated
+    async def multipart(self, path, form_data, use_file_url=False):
+        return await self._ctera_client.multipart(self.base_file_url if use_file_url else self.base_api_url, path, form_data)
+
+    @authenticated
+    async def upload(self, path, form_data, use_file_url=False):
+        return await self._ctera_client.upload(self.base_file_url if use_file_url else self.base_api_url, path, form_data)
+
+    def get_session_id(self):
+        """
+        Get the id of the current session
+
+        :return str: Current session id
+        """
+        return self._ctera_client.get_session_id()
+
+    async def set_session_id(self, session_id):
+        """
+        Start a session with the session id instead of logging in
+
+        :param str session_id: Session id for the new session
+        """
+        self._ctera_client.set_session_id(session_id)
+        await self._session.async_start_local_session(self)
+
+    async def set_authorization_headers(self, headers):
+        """
+        Start a session using authorization headers id instead of logging in
+
+        :param dict headers: the authorization headers, represented as a key-value str dict
+        """
+        self._ctera_client.set_authorization_headers(headers)
+        self._session.local_auth = True  # pylint: disable=protected-access
+        await self._session.async_start_local_session(self)
+
+    def whoami(self):
+        """
+        Return the name of the logged in user.
+
+        :return str: The name of the logged in user
+        """
+        return self._session.whoami()
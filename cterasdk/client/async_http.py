@@ -0,0 +1,266 @@
+import asyncio
+import urllib.parse
+import logging
+
+from .http import HTTPException, HttpClientRequestGet, HttpClientRequestPost, HttpClientRequestPut, HttpClientRequestDelete, \
+    HttpClientRequestMkcol, HttpClientRequestCopy, HttpClientRequestMove
+from ..common import Object
+from .. import config
+from ..exception import CTERAException, SSLException, HostUnreachable, ConnectionTimeout, ExhaustedException
+from ..lib import ask
+from .retry import RetryPolicy
+from .breaker import circuit
+from .instrumentation import Instrumentation
+from .compression import RequestCompression
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+
+class AsyncHTTPRequest:
+    """ A record of a dispatched request, compatible with the transcript and the HTTP exception parser """
+
+    def __init__(self, method, url, headers, body):
+        self.method = method
+        self.url = url
+        self.headers = headers
+        self.body = body.encode('utf-8') if isinstance(body, str) else body if isinstance(body, bytes) else None
+
+
+class AsyncHTTPResponse:
+    """ A fully read response, exposing the same attributes as a ``requests`` response """
+
+    def __init__(self, response, text):
+        self.url = str(response.url)
+        self.status_code = response.status
+        self.reason = response.reason
+        self.headers = response.headers
+        self.text = text
+
+
+class AsyncHTTPError(Exception):
+
+    def __init__(self, request, response):
+        super().__init__()
+        self.request = request
+        self.response = response
+
+
+class AsyncHttpClientBase():  # pylint: disable=too-many-instance-attributes
+    def __init__(self, session_id_key, retry_policy=None):
+        if aiohttp is None:
+            raise CTERAException('Asyncio support requires the aiohttp package')
+        self.timeout = config.http['timeout']
+        self.retry_policy = retry_policy or config.http['retry_policy'] or RetryPolicy()
+        self.retries = self.retry_policy.retries
+        self.ssl_error_handling = config.http['ssl']
+        self.verify = self.ssl_error_handling != 'Trust'
+        self.headers = {'Accept-Encoding': config.http['accept_encoding']}
+        self.cookies = {}
+        self.compression = RequestCompression()
+        self.instrumentation = Instrumentation()
+        self.session = None
+        self._session_id_key = session_id_key
+
+    def _get_session(self):
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=config.http['pool_connections'] * config.http['pool_maxsize'],
+                limit_per_host=config.http['pool_maxsize'],
+                force_close=not config.http['keep_alive']
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                cookie_jar=aiohttp.CookieJar(unsafe=True),
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self.session.cookie_jar.update_cookies(self.cookies)
+        return self.session
+
+    async def dispatch(self, ctera_request):
+        self.compression.compress(ctera_request)
+        with circuit(ctera_request.url):
+            if not self.instrumentation.enabled():
+                return await self._dispatch(ctera_request)
+            return await self._instrumented_dispatch(ctera_request)
+
+    async def _instrumented_dispatch(self, ctera_request):
+        record = self.instrumentation.start(ctera_request)
+        try:
+            request, response = await self._dispatch(ctera_request)
+        except Exception as error:
+            self.instrumentation.finish(record, ctera_request, error=error)
+            raise
+        self.instrumentation.finish(record, ctera_request, response)
+        return (request, response)
+
+    async def _dispatch(self, ctera_request):
+        attempt = 0
+        while True:
+            ctera_request.attempts = ctera_request.attempts + 1
+            try:
+                return await self._do_dispatch(ctera_request)
+            except AsyncHTTPError as error:
+                if self.compression.rejected(ctera_request, error.response.status_code):
+                    attempt, delay = -1, 0
+                else:
+                    delay = self.retry_policy.delay(ctera_request, attempt, error.response)
+                    if delay is None:
+                        raise HTTPException(error)
+            except asyncio.TimeoutError:
+                self.on_timeout(attempt)
+                delay = self.retry_policy.delay(ctera_request, attempt)
+                if delay is None:
+                    break
+            except aiohttp.ClientSSLError:
+                await self.on_ssl_error(ctera_request.url)
+                attempt, delay = -1, 0
+            except aiohttp.ClientConnectionError as error:
+                self._on_unreachable(ctera_request.url, error)
+            except aiohttp.ClientError as error:
+                logging.getLogger().warning(error)
+                delay = self.retry_policy.delay(ctera_request, attempt)
+                if delay is None:
+                    break
+            attempt = attempt + 1
+            await asyncio.sleep(delay)
+        return self._on_exhausted(ctera_request, attempt)
+
+    def _on_exhausted(self, ctera_request, attempt):
+        if not ctera_request.idempotent:
+            logging.getLogger().error('Request failed and is not safe to retry. %s', {'method': ctera_request.method,
+                                                                                      'url': ctera_request.url})
+            raise ConnectionTimeout('Request failed and is not safe to retry', self.timeout)
+        logging.getLogger().error('Reached maximum number of retries. %s', {'retries': attempt + 1, 'timeout': self.timeout})
+        raise ExhaustedException(attempt + 1, self.timeout)
+
+    async def _do_dispatch(self, ctera_request):
+        kwargs = dict(ctera_request.kwargs)
+        stream = kwargs.pop('stream', None)
+        if not self.verify:
+            kwargs['ssl'] = False
+        response = await self._get_session().request(ctera_request.method, ctera_request.url, **kwargs)
+        request = AsyncHTTPRequest(ctera_request.method, str(response.request_info.url), response.request_info.headers,
+                                   kwargs.get('data'))
+        if response.status >= 400:
+            text = await response.text()
+            response.release()
+            raise AsyncHTTPError(request, AsyncHTTPResponse(response, text))
+        if stream:
+            return (request, response)
+        body = await response.read()
+        text = await response.text()
+        response.release()
+        self.compression.on_response(ctera_request, response.headers, len(body), response.content_length)
+        return (request, AsyncHTTPResponse(response, text))
+
+    @staticmethod
+    def _on_unreachable(url, error):
+        parsed_url = urllib.parse.urlparse(url)
+        logging.getLogger().error('Cannot reach target host. %s', {'host': parsed_url.hostname, 'port': parsed_url.port})
+        socket_error = Object()
+        socket_error.message = str(error)
+        raise HostUnreachable(socket_error, parsed_url.hostname, parsed_url.port, parsed_url.scheme.upper())
+
+    @staticmethod
+    def on_timeout(attempt):
+        logging.getLogger().warning('Request timed out. %s', {'attempt': (attempt + 1)})
+
+    async def on_ssl_error(self, url):
+        parsed_url = urllib.parse.urlparse(url)
+        if await self.should_trust(parsed_url.hostname, parsed_url.port):
+            self.trust(parsed_url.hostname, parsed_url.port)
+        else:
+            raise SSLException(parsed_url.hostname, parsed_url.port, 'Cancelled by user')
+
+    async def should_trust(self, host, port):
+        if self.ssl_error_handling == 'Consent':
+            # prompt on an executor thread, so that other tasks keep running while waiting for the user
+            return await asyncio.get_running_loop().run_in_executor(None, ask, 'Proceed to ' + host + ':' + str(port) + '?')
+        raise SSLException(host, port, 'Configuration file requires the use of trusted certificates')
+
+    def trust(self, _host, _port):
+        self.verify = False
+
+    def get_session_id(self):
+        if self.session is not None:
+            for cookie in self.session.cookie_jar:
+                if cookie.key == self._session_id_key:
+                    return cookie.value
+        return self.cookies.get(self._session_id_key)
+
+    def set_session_id(self, session_id):
+        self.cookies[self._session_id_key] = session_id
+        if self.session is not None:
+            self.session.cookie_jar.update_cookies({self._session_id_key: session_id})
+
+    def set_custom_headers(self, headers):
+        """
+        Add custom headers that will be included in every http request.
+
+        :param dict headers: the headers, represented as a key-value str dict
+        """
+        self.headers.update(headers)
+        if self.session is not None:
+            self.session.headers.update(headers)
+
+    def compression_stats(self):
+        return self.compression.statistics.snapshot()
+
+    def metrics(self):
+        return self.instrumentation.aggregator.snapshot()
+
+    async def close(self):
+        """ Close the underlying client session and release its connections """
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+
+class AsyncHTTPClient(AsyncHttpClientBase):
+
+    async def get(self, url, params=None, headers=None, stream=None):
+        return await self.dispatch(HttpClientRequestGet(url, params=params, headers=headers, stream=stream))
+
+    async def post(self, url, headers=None, data='', urlencode=False,  # pylint: disable=too-many-arguments
+                   idempotent=False, compress=False, name=None):
+        if urlencode:
+            data = urllib.parse.urlencode(data).encode('utf-8')
+        return await self.dispatch(HttpClientRequestPost(url, headers=headers, data=data, idempotent=idempotent, compress=compress,
+                                                         name=name))
+
+    async def put(self, url, headers=None, data='', compress=False):
+        return await self.dispatch(HttpClientRequestPut(url, headers=headers, data=data, compress=compress))
+
+    async def delete(self, url, headers=None):
+        return await self.dispatch(HttpClientRequestDelete(url, headers=headers))
+
+    async def mkcol(self, url, headers=None):
+        return await self.dispatch(HttpClientRequestMkcol(url, headers=headers))
+
+    async def copy(self, src, dest, overwrite, headers=None):
+        return await self.dispatch(HttpClientRequestCopy(src, dest, overwrite, headers=headers))
+
+    async def move(self, src, dest, overwrite, headers=None):
+        return await self.dispatch(HttpClientRequestMove(src, dest, overwrite, headers=headers))
+
+    async def multipart(self, url, form_data):
+        return await self.dispatch(HttpClientRequestPost(url, data=AsyncHTTPClient._make_form(form_data)))
+
+    async def upload(self, url, form_data):
+        logging.getLogger().info('Uploading. %s', {'url': url})
+        return await self.multipart(url, form_data)
+
+    @staticmethod
+    def _make_form(form_data):
+        form = aiohttp.FormData()
+        for name, value in form_data.items():
+            if isinstance(value, tuple):
+                filename, fd, content_type = value
+                form.add_field(name, fd, filename=filename, content_type=content_type)
+            else:
+                form.add_field(name, str(value))
+        return form
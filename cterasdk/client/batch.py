@@ -0,0 +1,105 @@
+import logging
+import posixpath
+
+from ..exception import CTERAException
+
+
+class Deferred:
+    """
+    Result of a batched request, available once the batch was flushed
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.done = False
+        self._value = None
+        self._error = None
+
+    def resolve(self, value):
+        self._value = value
+        self.done = True
+
+    def reject(self, error):
+        self._error = error
+        self.done = True
+
+    @property
+    def value(self):
+        """
+        The result of the request
+
+        :raises: cterasdk.exception.CTERAException, if the batch was not flushed or if the request failed
+        """
+        if not self.done:
+            raise CTERAException('Batch was not flushed', None, path=self.path)
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+
+class Batch:
+    """
+    Collect ``get`` requests into deferred results, retrieved using a ``get-multi`` request per parent path.
+
+    Requests are sent when the batch is flushed, or when leaving its context:
+
+    .. code-block:: python
+
+       with gateway.batch() as batch:
+           services = batch.get('/status/services')
+           sync = batch.get('/status/sync')
+       print(services.value, sync.value)
+
+    :param cterasdk.client.host.CTERAHost host: Host
+    """
+
+    def __init__(self, host):
+        self._host = host
+        self._pending = []
+
+    def get(self, path, use_file_url=False):
+        """
+        Add a request to the batch
+
+        :param str path: Path of the schema object
+        :param bool,optional use_file_url: Use the file url of the host, defaults to ``False``
+        :return cterasdk.client.batch.Deferred: Deferred result
+        """
+        deferred = Deferred(path)
+        self._pending.append((use_file_url, deferred))
+        return deferred
+
+    def flush(self):
+        """
+        Send the pending requests, resolving their deferred results
+        """
+        groups = {}
+        for use_file_url, deferred in self._pending:
+            parent, name = posixpath.split(posixpath.normpath('/' + deferred.path.strip('/')))
+            groups.setdefault((use_file_url, parent), []).append((name, deferred))
+        logging.getLogger().debug('Flushing batch. %s', {'requests': len(self._pending), 'round_trips': len(groups)})
+        self._pending = []
+        for (use_file_url, parent), requests in groups.items():
+            self._send(parent, requests, use_file_url)
+
+    def _send(self, parent, requests, use_file_url):
+        try:
+            if len(requests) == 1:
+                name, deferred = requests[0]
+                deferred.resolve(self._host.get(posixpath.join(parent, name), use_file_url=use_file_url))
+                return
+            response = self._host.get_multi(parent, list({'/' + name: None for name, _deferred in requests}),
+                                            use_file_url=use_file_url)
+            for name, deferred in requests:
+                deferred.resolve(getattr(response, name, None))
+        except CTERAException as error:
+            for _name, deferred in requests:
+                if not deferred.done:
+                    deferred.reject(error)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
@@ -0,0 +1,193 @@
+import contextlib
+import logging
+import re
+import threading
+import time
+import urllib.parse
+
+from .. import config
+from ..common import Object
+from ..exception import HostUnreachable, ConnectionTimeout
+
+
+class CircuitState:
+    Closed = 'closed'
+    Open = 'open'
+    HalfOpen = 'half-open'
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of a single host.
+
+    The circuit opens after a number of consecutive failures, failing requests fast instead of waiting for a timeout.
+    Once the recovery timeout elapses, the circuit is half-open, allowing a single trial request.
+    A successful trial closes the circuit, while a failure opens it again.
+
+    :param int failure_threshold: Number of consecutive failures that open the circuit
+    :param float recovery_timeout: Number of seconds to wait before allowing a trial request
+    """
+
+    def __init__(self, failure_threshold, recovery_timeout):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._lock = threading.Lock()
+        self._state = CircuitState.Closed
+        self._failures = 0
+        self._opened_at = None
+        self._trial = False
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._state == CircuitState.Open and self._recovered():
+                return CircuitState.HalfOpen
+            return self._state
+
+    def allow(self):
+        """
+        Check if a request may be sent to the host
+
+        :return bool: ``True`` if the circuit is closed, or if this is the trial request of a half-open circuit
+        """
+        with self._lock:
+            if self._state == CircuitState.Closed:
+                return True
+            if self._state == CircuitState.Open and self._recovered():
+                self._state = CircuitState.HalfOpen
+                self._trial = False
+            if self._state == CircuitState.HalfOpen and not self._trial:
+                self._trial = True
+                return True
+            return False
+
+    def on_success(self):
+        with self._lock:
+            self._state = CircuitState.Closed
+            self._failures = 0
+            self._trial = False
+
+    def release(self):
+        """ Allow another trial request, after a trial request that failed without a response from the host """
+        with self._lock:
+            self._trial = False
+
+    def on_failure(self):
+        with self._lock:
+            self._failures = self._failures + 1
+            if self._state == CircuitState.HalfOpen or self._failures >= self.failure_threshold:
+                self._state = CircuitState.Open
+                self._opened_at = time.monotonic()
+                self._trial = False
+
+    def _recovered(self):
+        return time.monotonic() - self._opened_at >= self.recovery_timeout
+
+
+class CircuitBreakerRegistry:
+    """
+    Process-wide registry of circuit breakers, keyed by scheme, host and port.
+
+    Client objects targeting the same host share a circuit breaker. Remote gateways, reached through the Portal,
+    have a circuit breaker of their own, keyed by their path on the Portal
+    """
+
+    gateway_errors = (502, 503, 504)  # responses of the Portal to requests to a remote gateway it cannot reach
+
+    _remote_device = re.compile(r'^/[^/]+/(devicecmdnew/[^/]+/[^/]+|devices/[^/]+)(?:/|$)')
+
+    __instance = None
+    __lock = threading.Lock()
+
+    @staticmethod
+    def instance():
+        with CircuitBreakerRegistry.__lock:
+            if CircuitBreakerRegistry.__instance is None:
+                CircuitBreakerRegistry()
+        return CircuitBreakerRegistry.__instance
+
+    def __init__(self):
+        if CircuitBreakerRegistry.__instance is not None:
+            raise Exception("CircuitBreakerRegistry is a singleton class.")
+        self._lock = threading.Lock()
+        self._breakers = {}
+        CircuitBreakerRegistry.__instance = self
+
+    @staticmethod
+    def key(url):
+        parsed_url = urllib.parse.urlparse(url)
+        remote_device = CircuitBreakerRegistry._remote_device.match(parsed_url.path)
+        return (parsed_url.scheme, parsed_url.hostname, parsed_url.port, remote_device.group(1) if remote_device else None)
+
+    def get(self, url):
+        """
+        Get the circuit breaker of the host, or of the remote gateway, of a URL
+
+        :param str url: Request URL
+        :return cterasdk.client.breaker.CircuitBreaker: Circuit breaker
+        """
+        key = CircuitBreakerRegistry.key(url)
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(config.http['circuit_failure_threshold'], config.http['circuit_recovery_timeout'])
+                self._breakers[key] = breaker
+            return breaker
+
+    def reset(self, url=None):
+        """
+        Remove the circuit breaker of a host, or of all hosts
+
+        :param str,optional url: URL of the host, defaults to all hosts
+        """
+        with self._lock:
+            if url is None:
+                self._breakers.clear()
+            else:
+                self._breakers.pop(CircuitBreakerRegistry.key(url), None)
+        logging.getLogger().debug('Reset circuit breakers. %s', {'url': url})
+
+
+@contextlib.contextmanager
+def circuit(url):
+    """
+    Guard a request with the circuit breaker of its host.
+
+    Raises ``HostUnreachable`` without sending the request if the circuit is open.
+    Connection failures and timeouts are recorded as failures, while any response from the host closes the circuit,
+    except for gateway errors of the Portal to requests to a remote gateway, which are recorded as failures of the gateway.
+    Errors raised without a response from the host, such as rate limiting or certificate errors, are not recorded
+
+    :param str url: Request URL
+    """
+    if not config.http['circuit_breaker']:
+        yield
+        return
+    breaker = CircuitBreakerRegistry.instance().get(url)
+    if not breaker.allow():
+        parsed_url = urllib.parse.urlparse(url)
+        logging.getLogger().debug('Circuit is open. %s', {'host': parsed_url.hostname, 'port': parsed_url.port})
+        error = Object()
+        error.reason = 'Circuit breaker is open'
+        raise HostUnreachable(error, parsed_url.hostname, parsed_url.port, parsed_url.scheme.upper())
+    try:
+        yield
+    except (HostUnreachable, ConnectionTimeout):
+        breaker.on_failure()
+        raise
+    except BaseException as error:
+        _on_error(breaker, url, error)
+        raise
+    breaker.on_success()
+
+
+def _on_error(breaker, url, error):
+    """ Record an error by the response it was raised for, such as the response of an ``HTTPException`` """
+    response = getattr(error, 'response', None)
+    code = getattr(response, 'code', None)
+    if code is None:
+        breaker.release()
+    elif code in CircuitBreakerRegistry.gateway_errors and CircuitBreakerRegistry.key(url)[3] is not None:
+        breaker.on_failure()
+    else:
+        breaker.on_success()
@@ -0,0 +1,155 @@
+import collections
+import gzip
+import logging
+import threading
+import urllib.parse
+
+from .. import config
+from ..common import Object
+
+
+def body_text(headers, body):
+    """
+    Decode a request body, decompressing it if it was sent compressed
+
+    :param dict headers: Request headers
+    :param bytes body: Request body
+    :return str: The decoded body
+    """
+    if not isinstance(body, (bytes, str)):
+        return '(streamed)'
+    if isinstance(body, str):
+        return body
+    if headers and headers.get('Content-Encoding') == 'gzip':
+        body = gzip.decompress(body)
+    return body.decode('utf-8')
+
+
+def _ratio(size, compressed_size):
+    return round(size / compressed_size, 2) if compressed_size else None
+
+
+class CompressionStatistics:
+    """ Thread-safe record of request and response compression """
+
+    def __init__(self, history=100):
+        self._lock = threading.Lock()
+        self._calls = collections.deque(maxlen=history)
+        self._sent = self._sent_compressed = 0
+        self._received = self._received_compressed = 0
+
+    def on_request(self, ctera_request, size, compressed_size):
+        with self._lock:
+            self._sent = self._sent + size
+            self._sent_compressed = self._sent_compressed + compressed_size
+            self._calls.append(CompressionStatistics._call(ctera_request, 'request', size, compressed_size))
+
+    def on_response(self, ctera_request, size, compressed_size):
+        with self._lock:
+            self._received = self._received + size
+            self._received_compressed = self._received_compressed + compressed_size
+            self._calls.append(CompressionStatistics._call(ctera_request, 'response', size, compressed_size))
+
+    @staticmethod
+    def _call(ctera_request, direction, size, compressed_size):
+        call = Object()
+        call.method = ctera_request.method
+        call.url = ctera_request.url
+        call.direction = direction
+        call.size = size
+        call.compressed_size = compressed_size
+        call.ratio = _ratio(size, compressed_size)
+        return call
+
+    def snapshot(self):
+        """
+        Return the current compression statistics
+
+        :return: Object holding the number of bytes sent and received before and after compression,
+         the overall compression ratios and the most recent compressed calls
+        :rtype: cterasdk.common.object.Object
+        """
+        with self._lock:
+            stats = Object()
+            stats.bytes_sent = self._sent
+            stats.bytes_sent_compressed = self._sent_compressed
+            stats.request_ratio = _ratio(self._sent, self._sent_compressed)
+            stats.bytes_received = self._received
+            stats.bytes_received_compressed = self._received_compressed
+            stats.response_ratio = _ratio(self._received, self._received_compressed)
+            stats.calls = list(self._calls)
+            return stats
+
+    def reset(self):
+        with self._lock:
+            self._calls.clear()
+            self._sent = self._sent_compressed = 0
+            self._received = self._received_compressed = 0
+
+
+class RequestCompression:
+    """
+    Compress request bodies using gzip.
+
+    Request bodies are compressed if ``config.http['compression']`` is enabled and the body is at least
+    ``config.http['compression_threshold']`` bytes long. A host that rejects a compressed request with
+    ``415 Unsupported Media Type`` is sent uncompressed requests from then on.
+    """
+
+    def __init__(self):
+        self.statistics = CompressionStatistics()
+        self._lock = threading.Lock()
+        self._unsupported = set()
+
+    def compress(self, ctera_request):
+        """
+        Compress the body of a request, if eligible
+
+        :param cterasdk.client.http.HttpClientRequest ctera_request: Request
+        """
+        data = ctera_request.kwargs.get('data')
+        if not (ctera_request.compress and config.http['compression'] and isinstance(data, (str, bytes))):
+            return
+        body = data.encode('utf-8') if isinstance(data, str) else data
+        if len(body) < config.http['compression_threshold'] or self._host(ctera_request) in self._unsupported:
+            return
+        compressed = gzip.compress(body, compresslevel=config.http['compression_level'])
+        ctera_request.uncompressed = (ctera_request.kwargs.get('headers'), data)
+        ctera_request.kwargs['headers'] = dict(ctera_request.kwargs.get('headers') or {}, **{'Content-Encoding': 'gzip'})
+        ctera_request.kwargs['data'] = compressed
+        self.statistics.on_request(ctera_request, len(body), len(compressed))
+
+    def rejected(self, ctera_request, status_code):
+        """
+        Handle the rejection of a compressed request, restoring its uncompressed body
+
+        :param cterasdk.client.http.HttpClientRequest ctera_request: Request
+        :param int status_code: Response status code
+        :return bool: ``True`` if the request must be sent again uncompressed
+        """
+        if status_code != 415 or ctera_request.uncompressed is None:
+            return False
+        host = self._host(ctera_request)
+        logging.getLogger().warning('Host does not support compressed requests. %s', {'host': host})
+        with self._lock:
+            self._unsupported.add(host)
+        ctera_request.kwargs['headers'], ctera_request.kwargs['data'] = ctera_request.uncompressed
+        ctera_request.uncompressed = None
+        return True
+
+    def on_response(self, ctera_request, headers, size, compressed_size):
+        """
+        Record the compression of a response
+
+        :param cterasdk.client.http.HttpClientRequest ctera_request: Request
+        :param dict headers: Response headers
+        :param int size: Decoded size of the response body
+        :param int compressed_size: Size of the response body, as received
+        """
+        if headers.get('Content-Encoding') in ['gzip', 'deflate'] and compressed_size:
+            self.statistics.on_response(ctera_request, size, compressed_size)
+
+    @staticmethod
+    def _host(ctera_request):
+        parsed_url = urllib.parse.urlparse(ctera_request.url)
+        return (parsed_url.hostname, parsed_url.port)
@@ -1,5 +1,6 @@
 from .http import HTTPClient, ContentType, HTTPException, HTTPResponse, geturi
-from ..convert import fromxmlstr, toxmlstr
+from .singleflight import SingleFlight
+from ..convert import fromxmlstr, toxmlstr, XMLStream, XMLBody
 from ..exception import CTERAClientException
 from ..lib import Command
 from ..common import Object
@@ -7,13 +8,17 @@ from ..transcript import transcribe
 from .. import config
 
 
-class CTERAClient:
+class CTERAClient:  # pylint: disable=too-many-public-methods
 
     def __init__(self, session_id_key):
         self.http_client = HTTPClient(session_id_key)
+        self.single_flight = SingleFlight()
 
     def get(self, baseurl, path, params=None):
-        function = Command(HTTPClient.get, self.http_client, geturi(baseurl, path), params if params else {})
+        url, params = geturi(baseurl, path), params if params else {}
+        function = Command(HTTPClient.get, self.http_client, url, params)
+        if config.http['single_flight']:
+            return self.single_flight.do((url, repr(sorted(params.items()))), Command(CTERAClient._execute, function))
         return self._execute(function)
 
     def download(self, baseurl, path, params):
@@ -21,27 +26,34 @@ class CTERAClient:
         return self._execute(function, return_function=CTERAClient.file_descriptor)
 
     def download_zip(self, baseurl, path, form_data):
-        function = Command(HTTPClient.post, self.http_client, geturi(baseurl, path), ContentType.urlencoded, form_data, True)
+        function = Command(HTTPClient.post, self.http_client, geturi(baseurl, path), ContentType.urlencoded, form_data,
+                           urlencode=True, idempotent=self.http_client.retry_policy.is_safe(path))
         return self._execute(function, return_function=CTERAClient.file_descriptor)
 
     def get_multi(self, baseurl, path, paths):
         return self.db(baseurl, path, "get-multi", paths)
 
     def put(self, baseurl, path, data):
-        function = Command(HTTPClient.put, self.http_client, geturi(baseurl, path), ContentType.textplain, toxmlstr(data))
+        function = Command(HTTPClient.put, self.http_client, geturi(baseurl, path), ContentType.textplain, CTERAClient._body(data),
+                           compress=True)
         return self._execute(function)
 
     def post(self, baseurl, path, data):
-        function = Command(HTTPClient.post, self.http_client, geturi(baseurl, path), ContentType.textplain, toxmlstr(data))
+        function = Command(HTTPClient.post, self.http_client, geturi(baseurl, path), ContentType.textplain, CTERAClient._body(data),
+                           compress=True)
         return self._execute(function)
 
     def form_data(self, baseurl, path, form_data):
-        function = Command(HTTPClient.post, self.http_client, geturi(baseurl, path), ContentType.urlencoded, form_data, True)
+        function = Command(HTTPClient.post, self.http_client, geturi(baseurl, path), ContentType.urlencoded, form_data,
+                           urlencode=True, idempotent=self.http_client.retry_policy.is_safe(path))
         return self._execute(function)
 
     def execute(self, baseurl, path, name, param=None):
         return self._ctera_exec(baseurl, path, 'user-defined', name, param)
 
+    def execute_stream(self, baseurl, path, name, param, members):
+        return self._ctera_exec(baseurl, path, 'user-defined', name, param, members)
+
     def delete(self, baseurl, path):
         function = Command(HTTPClient.delete, self.http_client, geturi(baseurl, path))
         return self._execute(function)
@@ -61,6 +73,9 @@ class CTERAClient:
     def db(self, baseurl, path, name, param):
         return self._ctera_exec(baseurl, path, 'db', name, param)
 
+    def db_stream(self, baseurl, path, name, param, members):
+        return self._ctera_exec(baseurl, path, 'db', name, param, members)
+
     def multipart(self, baseurl, path, form_data):
         function = Command(HTTPClient.multipart, self.http_client, geturi(baseurl, path), form_data)
         return self._execute(function)
@@ -69,13 +84,15 @@ class CTERAClient:
         function = Command(HTTPClient.upload, self.http_client, geturi(baseurl, path), form_data)
         return self._execute(function)
 
-    def _ctera_exec(self, baseurl, path, exec_type, name, param):
+    def _ctera_exec(self, baseurl, path, exec_type, name, param, members=None):  # pylint: disable=too-many-arguments
         obj = Object()
         obj.type = exec_type
         obj.name = name
         obj.param = param
-        function = Command(HTTPClient.post, self.http_client, geturi(baseurl, path), ContentType.textplain, toxmlstr(obj))
-        return self._execute(function)
+        stream = members is not None
+        function = Command(HTTPClient.post, self.http_client, geturi(baseurl, path), ContentType.textplain, CTERAClient._body(obj),
+                           idempotent=self.http_client.retry_policy.is_safe(name), compress=True, stream=stream, name=name)
+        return self._execute(function, return_function=Command(CTERAClient.fromxmlstream, members) if stream else None)
 
     def get_session_id(self):
         return self.http_client.get_session_id()
@@ -83,9 +100,33 @@ class CTERAClient:
     def set_session_id(self, session_id):
         self.http_client.set_session_id(session_id)
 
+    def connection_stats(self):
+        return self.http_client.connection_stats()
+
+    def compression_stats(self):
+        return self.http_client.compression_stats()
+
+    def single_flight_stats(self):
+        return self.single_flight.snapshot()
+
+    def metrics(self):
+        return self.http_client.metrics()
+
+    def add_request_hook(self, hook):
+        self.http_client.instrumentation.add_hook(hook)
+
+    def remove_request_hook(self, hook):
+        self.http_client.instrumentation.remove_hook(hook)
+
     def set_authorization_headers(self, headers):
         self.http_client.set_custom_headers(headers)
 
+    @staticmethod
+    def _body(data):
+        if config.http['stream_requests'] and data is not None:
+            return XMLBody(data)
+        return toxmlstr(data)
+
     @staticmethod
     def fromxmlstr(request, response):
         if not config.transcript['disabled']:
@@ -93,6 +134,13 @@ class CTERAClient:
             transcribe.transcribe(request, response)
         return fromxmlstr(response.text)
 
+    @staticmethod
+    def fromxmlstream(members, request, response):
+        if not config.transcript['disabled']:
+            transcribe.transcribe(request)
+        response.raw.decode_content = True
+        return XMLStream(response.raw, members, response.close)
+
     @staticmethod
     def file_descriptor(request, response):
         if not config.transcript['disabled']:
@@ -1,19 +1,57 @@
+import asyncio
 import functools
+import inspect
 import logging
 import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
+from .. import config
 from ..common import Object
-from ..convert import tojsonstr
+from ..convert import tojsonstr, LazyJSON
 from ..exception import HostUnreachable
 from .cteraclient import CTERAClient
-from ..exception import CTERAException
+from .batch import Batch
+from ..exception import CTERAException, CTERAClientException
+from ..lib.session_base import SessionUser
+from .session_cache import SessionCache
+from .ratelimit import RateLimiterRegistry, RequestFamily, request_family
+
+
+def _request_family(function):
+    parameters = list(inspect.signature(function).parameters)
+    index = parameters.index('use_file_url') - 1 if 'use_file_url' in parameters else None
+
+    def family(args, kwargs):
+        use_file_url = kwargs.get('use_file_url', args[index] if index is not None and len(args) > index else False)
+        return RequestFamily.Files if use_file_url else RequestFamily.API
+
+    return family
 
 
 def authenticated(function):
+    if asyncio.iscoroutinefunction(function):
+        @functools.wraps(function)
+        async def check_authenticated_and_await(self, *args, **kwargs):
+            if self._is_authenticated(function, *args, **kwargs):  # pylint: disable=protected-access
+                return await function(self, *args, **kwargs)
+            logging.getLogger().error('Not logged in.')
+            raise CTERAException('Not logged in')
+
+        return check_authenticated_and_await
+
+    family = _request_family(function)
+
     @functools.wraps(function)
     def check_authenticated_and_call(self, *args, **kwargs):
         if self._is_authenticated(function, *args, **kwargs):  # pylint: disable=protected-access
-            return function(self, *args, **kwargs)
+            with request_family(family(args, kwargs)):
+                try:
+                    return function(self, *args, **kwargs)
+                except CTERAClientException as error:
+                    if not self._on_cached_session_expired(error):  # pylint: disable=protected-access
+                        raise
+                return function(self, *args, **kwargs)
         logging.getLogger().error('Not logged in.')
         raise CTERAException('Not logged in')
 
@@ -23,7 +61,7 @@ def authenticated(function):
 class NetworkHost:
     def __init__(self, host, port, https):
         self._host = host
-        self._port = port or 443 if https else 80
+        self._port = port or (443 if https else 80)
         self._https = https
 
     @property
@@ -68,11 +106,22 @@ class NetworkHost:
 
 
 class CTERAHost(NetworkHost):  # pylint: disable=too-many-public-methods
+    """
+    Base class for CTERA hosts.
+
+    A single object may be shared by multiple threads. Requests are dispatched over a thread-safe connection pool,
+    while changes to the session state, such as logging in or browsing a tenant, are serialized.
+    Browsing a tenant changes the context of the entire session. To work on several tenants concurrently,
+    use a separate object for each tenant.
+    """
 
     def __init__(self, host, port, https):
         super().__init__(host, port, https)
         self._ctera_client = CTERAClient(self._session_id_key)
         self._session = None
+        self._session_lock = threading.RLock()
+        self._username = None
+        self._credentials = None
 
     @property
     def _omit_fields(self):
@@ -109,13 +158,53 @@ class CTERAHost(NetworkHost):  # pylint: disable=too-many-public-methods
         :param str username: User name to log in
         :param str password: User password
         """
-        self._login_object.login(username, password)
-        self._session.start_local_session(self)
+        with self._session_lock:
+            self._username = username
+            if SessionCache.enabled() and self._resume_cached_session(username, password):
+                return
+            self._login_object.login(username, password)
+            self._session.start_local_session(self)
+            self._cache_session(username, password)
 
     def logout(self):
         """ Log out """
-        self._login_object.logout()
-        self._session.terminate()
+        with self._session_lock:
+            self._credentials = None
+            if SessionCache.enabled() and self._username is not None:
+                SessionCache.instance().remove(self.base_api_url, self._username)
+            self._login_object.logout()
+            self._session.terminate()
+
+    def _resume_cached_session(self, username, password):
+        cached_session = SessionCache.instance().load(self.base_api_url, username, password)
+        if cached_session is None:
+            return False
+        self._ctera_client.set_session_id(cached_session.session_id)
+        self._session.resume_local_session(SessionUser(**cached_session.user))
+        self._credentials = (username, password)
+        logging.getLogger().info("Resumed cached session. %s", {'host': self.host(), 'user': username})
+        return True
+
+    def _cache_session(self, username, password):
+        if SessionCache.enabled():
+            SessionCache.instance().save(self.base_api_url, username, password, self._ctera_client.get_session_id(), self._session.user)
+
+    def _on_cached_session_expired(self, error):
+        response = getattr(error, 'response', None)
+        if self._credentials is None or response is None or response.code != 401:
+            return False
+        with self._session_lock:
+            if self._credentials is None:
+                return True  # another thread logged in
+            username, password = self._credentials
+            self._credentials = None
+            logging.getLogger().info("Cached session expired. Logging in. %s", {'host': self.host(), 'user': username})
+            SessionCache.instance().remove(self.base_api_url, username)
+            self._session.terminate()
+            self._login_object.login(username, password)
+            self._session.start_local_session(self)
+            self._cache_session(username, password)
+        return True
 
     def session(self):
         return self._session
@@ -158,13 +247,13 @@ class CTERAHost(NetworkHost):  # pylint: disable=too-many-public-methods
     def put(self, path, value, use_file_url=False):
         """ Update a schema object or attribute. """
         response = self._ctera_client.put(self.base_file_url if use_file_url else self.base_api_url, path, value)
-        logging.getLogger().debug('Configuration changed. %s', {'url': path, 'value': tojsonstr(value, pretty_print=False)})
+        logging.getLogger().debug('Configuration changed. %s', {'url': path, 'value': LazyJSON(value, pretty_print=False)})
         return response
 
     @authenticated
     def post(self, path, value, use_file_url=False):
         response = self._ctera_client.post(self.base_file_url if use_file_url else self.base_api_url, path, value)
-        logging.getLogger().debug('Added. %s', {'url': path, 'value': tojsonstr(value, pretty_print=False)})
+        logging.getLogger().debug('Added. %s', {'url': path, 'value': LazyJSON(value, pretty_print=False)})
         return response
 
     def form_data(self, path, form_data, use_file_url=False):
@@ -175,7 +264,7 @@ class CTERAHost(NetworkHost):  # pylint: disable=too-many-public-methods
         response = self._ctera_client.db(self.base_file_url if use_file_url else self.base_api_url, path, name, param)
         logging.getLogger().debug(
             'Database method executed. %s',
-            {'url': path, 'name': name, 'param': tojsonstr(param, pretty_print=False)}
+            {'url': path, 'name': name, 'param': LazyJSON(param, pretty_print=False)}
         )
         return response
 
@@ -185,7 +274,44 @@ class CTERAHost(NetworkHost):  # pylint: disable=too-many-public-methods
         response = self._ctera_client.execute(self.base_file_url if use_file_url else self.base_api_url, path, name, param)
         logging.getLogger().debug(
             'User-defined method executed. %s',
-            {'url': path, 'name': name, 'param': tojsonstr(param, pretty_print=False)}
+            {'url': path, 'name': name, 'param': LazyJSON(param, pretty_print=False)}
+        )
+        return response
+
+    @authenticated
+    def db_stream(self, path, name, param, members, use_file_url=False):  # pylint: disable=too-many-arguments
+        """
+        Execute a database method, parsing the response incrementally as it is received
+
+        :param str path: Path
+        :param str name: Method name
+        :param object param: Method parameter
+        :param list[str] members: Names of the list attributes of the response to yield one by one
+        :return cterasdk.convert.parse.XMLStream: Stream of list members. The rest of the response is available using its value
+        """
+        response = self._ctera_client.db_stream(self.base_file_url if use_file_url else self.base_api_url, path, name, param, members)
+        logging.getLogger().debug(
+            'Database method executed. %s',
+            {'url': path, 'name': name, 'param': LazyJSON(param, pretty_print=False)}
+        )
+        return response
+
+    @authenticated
+    def execute_stream(self, path, name, param, members, use_file_url=False):  # pylint: disable=too-many-arguments
+        """
+        Execute a schema object method, parsing the response incrementally as it is received
+
+        :param str path: Path
+        :param str name: Method name
+        :param object param: Method parameter
+        :param list[str] members: Names of the list attributes of the response to yield one by one
+        :return cterasdk.convert.parse.XMLStream: Stream of list members. The rest of the response is available using its value
+        """
+        response = self._ctera_client.execute_stream(self.base_file_url if use_file_url else self.base_api_url, path, name, param,
+                                                     members)
+        logging.getLogger().debug(
+            'User-defined method executed. %s',
+            {'url': path, 'name': name, 'param': LazyJSON(param, pretty_print=False)}
         )
         return response
 
@@ -236,8 +362,9 @@ class CTERAHost(NetworkHost):  # pylint: disable=too-many-public-methods
 
         :param str session_id: Session id for the new session
         """
-        self._ctera_client.set_session_id(session_id)
-        self._session.start_local_session(self)
+        with self._session_lock:
+            self._ctera_client.set_session_id(session_id)
+            self._session.start_local_session(self)
 
     def set_authorization_headers(self, headers):
         """
@@ -245,9 +372,94 @@ class CTERAHost(NetworkHost):  # pylint: disable=too-many-public-methods
 
         :param dict headers: the authorization headers, represented as a key-value str dict
         """
-        self._ctera_client.set_authorization_headers(headers)
-        self._session.local_auth = True  # pylint: disable=protected-access
-        self._session.start_local_session(self)
+        with self._session_lock:
+            self._ctera_client.set_authorization_headers(headers)
+            self._session.local_auth = True  # pylint: disable=protected-access
+            self._session.start_local_session(self)
+
+    def batch(self):
+        """
+        Create a batch, collecting ``get`` requests into ``get-multi`` round trips
+
+        :return cterasdk.client.batch.Batch: Batch, to be used as a context manager
+        """
+        return Batch(self)
+
+    def map(self, function, iterable, max_workers=None):
+        """
+        Apply a function to every item of an iterable, using a pool of threads sharing this object
+
+        :param callable function: Function to call with every item
+        :param iterable iterable: Items to process
+        :param int,optional max_workers: Number of threads, defaults to ``config.http['pool_maxsize']``
+        :return list: The return values, in the order of the items
+        """
+        with ThreadPoolExecutor(max_workers=max_workers or config.http['pool_maxsize']) as executor:
+            return list(executor.map(function, iterable))
+
+    def connection_stats(self):
+        """
+        Get the connection pool statistics of the underlying http client
+
+        :return: Object holding the number of requests, new and reused connections and the time spent waiting for a pooled connection
+        :rtype: cterasdk.common.object.Object
+        """
+        return self._ctera_client.connection_stats()
+
+    def compression_stats(self):
+        """
+        Get the request and response compression statistics of the underlying http client
+
+        :return: Object holding the number of bytes sent and received before and after compression,
+         the overall compression ratios and the most recent compressed calls
+        :rtype: cterasdk.common.object.Object
+        """
+        return self._ctera_client.compression_stats()
+
+    def single_flight_stats(self):
+        """
+        Get the number of requests, and the number of concurrent identical requests collapsed into a single request
+
+        :return: Object holding the number of requests and collapsed requests
+        :rtype: cterasdk.common.object.Object
+        """
+        return self._ctera_client.single_flight_stats()
+
+    def throttle_stats(self):
+        """
+        Get the rate limiting statistics of this host, for database and schema methods and for file transfers
+
+        :return: Object holding the number of requests, throttled and rejected requests and the time spent throttled,
+         of each request family
+        :rtype: cterasdk.common.object.Object
+        """
+        return RateLimiterRegistry.instance().statistics(self.baseurl())
+
+    def metrics(self):
+        """
+        Get the request statistics of each endpoint, aggregated when ``config.http['metrics']`` is enabled
+
+        :return: Dictionary of endpoint keys, consisting of the http method, path and method name,
+         and objects holding the number of requests, errors and retries, bytes sent and received and latency percentiles
+        :rtype: dict
+        """
+        return self._ctera_client.metrics()
+
+    def add_request_hook(self, hook):
+        """
+        Add a function called with the measurements of every request, once completed
+
+        :param callable hook: Function accepting a ``cterasdk.client.instrumentation.RequestRecord``
+        """
+        self._ctera_client.add_request_hook(hook)
+
+    def remove_request_hook(self, hook):
+        """
+        Remove a request hook
+
+        :param callable hook: Function previously added
+        """
+        self._ctera_client.remove_request_hook(hook)
 
     def whoami(self):
         """
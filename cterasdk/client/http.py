@@ -1,3 +1,4 @@
+import time
 import urllib.parse
 import logging
 
@@ -9,8 +10,14 @@ from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
 from ..convert import fromxmlstr
 from ..common import Object, merge
 from .. import config
-from ..exception import SSLException, HostUnreachable, ExhaustedException
+from ..exception import SSLException, HostUnreachable, ConnectionTimeout, ExhaustedException
 from ..lib import ask
+from .pool import ConnectionStatistics, PooledHTTPAdapter
+from .retry import RetryPolicy
+from .breaker import circuit
+from .ratelimit import throttle
+from .instrumentation import Instrumentation
+from .compression import RequestCompression, body_text
 
 
 class HTTPException(Exception):
@@ -37,7 +44,7 @@ class HTTPException(Exception):
         target.uri = o.path
         target.headers = request.headers
         if request.body is not None:
-            target.body = request.body.decode('utf-8')  # decode from 'Bytes' to 'UTF-8'
+            target.body = body_text(request.headers, request.body)  # decode from 'Bytes' to 'UTF-8'
         return target
 
 
@@ -77,37 +84,95 @@ class ContentType:
 
 
 class HttpClientBase():
-    def __init__(self, session_id_key):
+    def __init__(self, session_id_key, retry_policy=None):
         self.timeout = config.http['timeout']
-        self.retries = config.http['retries']
+        self.retry_policy = retry_policy or config.http['retry_policy'] or RetryPolicy()
+        self.retries = self.retry_policy.retries
         self.ssl_error_handling = config.http['ssl']
+        self.statistics = ConnectionStatistics()
         self.session = requests.Session()
         self.session.verify = self.ssl_error_handling != 'Trust'
+        for scheme in ['http://', 'https://']:
+            self.session.mount(scheme, PooledHTTPAdapter(self.statistics, config.http['pool_connections'],
+                                                         config.http['pool_maxsize'], config.http['pool_block']))
+        if not config.http['keep_alive']:
+            self.session.headers.update({'Connection': 'close'})
+        self.session.headers.update({'Accept-Encoding': config.http['accept_encoding']})
+        self.compression = RequestCompression()
+        self.instrumentation = Instrumentation()
         self._session_id_key = session_id_key
 
     def dispatch(self, ctera_request):
+        self.compression.compress(ctera_request)
+        with circuit(ctera_request.url):
+            if not self.instrumentation.enabled():
+                return self._dispatch(ctera_request)
+            return self._instrumented_dispatch(ctera_request)
+
+    def _instrumented_dispatch(self, ctera_request):
+        record = self.instrumentation.start(ctera_request)
+        try:
+            request, response = self._dispatch(ctera_request)
+        except Exception as error:
+            self.instrumentation.finish(record, ctera_request, error=error)
+            raise
+        self.instrumentation.finish(record, ctera_request, response)
+        return (request, response)
+
+    def _dispatch(self, ctera_request):
         attempt = 0
-        while attempt < self.retries:
+        while True:
+            ctera_request.attempts = ctera_request.attempts + 1
             try:
-                return self._do_dispatch(ctera_request)
+                with throttle(ctera_request.url) as slot:
+                    request, response = self._do_dispatch(ctera_request)
+                    if ctera_request.kwargs.get('stream'):
+                        slot.hold(response)
+                    return (request, response)
             except requests_exceptions.HTTPError as error:
-                raise HTTPException(error)
+                attempt, delay = self._on_http_error(ctera_request, attempt, error)
             except requests_exceptions.Timeout:
                 self.on_timeout(attempt)
+                delay = self.retry_policy.delay(ctera_request, attempt)
+                if delay is None:
+                    break
             except requests_exceptions.SSLError as error:
                 self.on_ssl_error(error.request)
-                attempt = -1
+                attempt, delay = -1, 0
             except requests_exceptions.ConnectionError as error:
                 self._on_unreachable(error)
             except requests_exceptions.RequestException as error:
                 logging.getLogger().warning(error)
+                delay = self.retry_policy.delay(ctera_request, attempt)
+                if delay is None:
+                    break
             attempt = attempt + 1
-        logging.getLogger().error('Reached maximum number of retries. %s', {'retries': self.retries, 'timeout': self.timeout})
-        raise ExhaustedException(self.retries, self.timeout)
+            time.sleep(delay)
+        return self._on_exhausted(ctera_request, attempt)
+
+    def _on_http_error(self, ctera_request, attempt, error):
+        if self.compression.rejected(ctera_request, error.response.status_code):
+            return -1, 0
+        delay = self.retry_policy.delay(ctera_request, attempt, error.response)
+        if delay is None:
+            raise HTTPException(error)
+        if error.response.raw is not None:
+            error.response.close()  # release the connection before waiting
+        return attempt, delay
+
+    def _on_exhausted(self, ctera_request, attempt):
+        if not ctera_request.idempotent:
+            logging.getLogger().error('Request failed and is not safe to retry. %s', {'method': ctera_request.method,
+                                                                                      'url': ctera_request.url})
+            raise ConnectionTimeout('Request failed and is not safe to retry', self.timeout)
+        logging.getLogger().error('Reached maximum number of retries. %s', {'retries': attempt + 1, 'timeout': self.timeout})
+        raise ExhaustedException(attempt + 1, self.timeout)
 
     def _do_dispatch(self, ctera_request):
         response = self.session.request(ctera_request.method, ctera_request.url, **ctera_request.kwargs)
         response.raise_for_status()
+        if not ctera_request.kwargs.get('stream') and response.raw is not None:
+            self.compression.on_response(ctera_request, response.headers, len(response.content), response.raw.tell())
         return (response.request, response)
 
     @staticmethod
@@ -143,6 +208,15 @@ class HttpClientBase():
     def set_session_id(self, session_id):
         self.session.cookies.set(self._session_id_key, session_id)
 
+    def connection_stats(self):
+        return self.statistics.snapshot()
+
+    def compression_stats(self):
+        return self.compression.statistics.snapshot()
+
+    def metrics(self):
+        return self.instrumentation.aggregator.snapshot()
+
     def set_custom_headers(self, headers):
         """
         Add custom headers that will be included in every http request.
@@ -153,30 +227,36 @@ class HttpClientBase():
 
 
 class HttpClientRequest():
-    def __init__(self, method, url, **kwargs):
+    def __init__(self, method, url, idempotent=False, compress=False, name=None, **kwargs):  # pylint: disable=too-many-arguments
         self.method = method
         self.url = url
+        self.idempotent = idempotent
+        self.compress = compress
+        self.uncompressed = None
+        self.name = name
+        self.attempts = 0
         self.kwargs = kwargs
 
 
 class HttpClientRequestGet(HttpClientRequest):
     def __init__(self, url, params=None, headers=None, stream=None):
-        super().__init__('GET', url, params=params, headers=headers, stream=stream)
+        super().__init__('GET', url, idempotent=True, params=params, headers=headers, stream=stream)
 
 
 class HttpClientRequestPost(HttpClientRequest):
-    def __init__(self, url, headers=None, data=None):
-        super().__init__('POST', url, headers=headers, data=data)
+    def __init__(self, url, headers=None, data=None, idempotent=False, compress=False, stream=None,  # pylint: disable=too-many-arguments
+                 name=None):
+        super().__init__('POST', url, idempotent=idempotent, compress=compress, name=name, headers=headers, data=data, stream=stream)
 
 
 class HttpClientRequestPut(HttpClientRequest):
-    def __init__(self, url, headers=None, data=None):
-        super().__init__('PUT', url, headers=headers, data=data)
+    def __init__(self, url, headers=None, data=None, compress=False):
+        super().__init__('PUT', url, idempotent=True, compress=compress, headers=headers, data=data)
 
 
 class HttpClientRequestDelete(HttpClientRequest):
     def __init__(self, url, headers=None):
-        super().__init__('DELETE', url, headers=headers)
+        super().__init__('DELETE', url, idempotent=True, headers=headers)
 
 
 class HttpClientRequestMkcol(HttpClientRequest):
@@ -208,13 +288,15 @@ class HTTPClient(HttpClientBase):
     def get(self, url, params=None, headers=None, stream=None):
         return self.dispatch(HttpClientRequestGet(url, params=params, headers=headers, stream=stream))
 
-    def post(self, url, headers=None, data='', urlencode=False):
+    def post(self, url, headers=None, data='', urlencode=False,  # pylint: disable=too-many-arguments
+             idempotent=False, compress=False, stream=None, name=None):
         if urlencode:
             data = urllib.parse.urlencode(data).encode('utf-8')
-        return self.dispatch(HttpClientRequestPost(url, headers=headers, data=data))
+        return self.dispatch(HttpClientRequestPost(url, headers=headers, data=data, idempotent=idempotent, compress=compress,
+                                                   stream=stream, name=name))
 
-    def put(self, url, headers=None, data=''):
-        return self.dispatch(HttpClientRequestPut(url, headers=headers, data=data))
+    def put(self, url, headers=None, data='', compress=False):
+        return self.dispatch(HttpClientRequestPut(url, headers=headers, data=data, compress=compress))
 
     def delete(self, url, headers=None):
         return self.dispatch(HttpClientRequestDelete(url, headers=headers))
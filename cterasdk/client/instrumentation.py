@@ -0,0 +1,229 @@
+import collections
+import logging
+import re
+import threading
+import time
+import urllib.parse
+
+from .. import config
+from ..common import Object
+
+
+_identifiers = [
+    (re.compile(r'/devicecmdnew/[^/]+/[^/]+'), '/devicecmdnew/*/*'),  # remote gateway, by tenant and device name
+    (re.compile(r'^(/[^/]+)/devices/[^/]+'), r'\1/devices/*'),  # remote access to a device
+    (re.compile(r'/api/portals/[^/]+'), '/api/portals/*')  # tenant context
+]
+_api = re.compile(r'^(.*?/(?:api(?:/portals/\*)?|devicecmdnew/\*/\*))(?=/|$)(/[^/]+)?(/.+)?$')
+_root = re.compile(r'^(/[^/]+)(/[^/]+)?(/.+)?$')
+
+
+def logical_path(path):
+    """
+    Logical path of a request, keeping the API root and the first segment after it.
+    Tenant and device names, and the rest of the path, such as object names, are replaced with ``*``
+
+    :param str path: URL path, e.g. ``/ServicesPortal/api/users/alice``
+    :return str: Logical path, e.g. ``/ServicesPortal/api/users/*``
+    """
+    for pattern, replacement in _identifiers:
+        path = pattern.sub(replacement, path)
+    path = path.rstrip('/')
+    match = _api.match(path) or _root.match(path)
+    if match is None:
+        return path or '/'
+    root, collection, rest = match.groups()
+    return root + (collection or '') + ('/*' if rest else '')
+
+
+class RequestRecord:
+    """
+    Measurement of a dispatched request, passed to request hooks
+
+    :ivar str method: HTTP method
+    :ivar str path: URL path
+    :ivar str name: Database or schema method name, or ``None``
+    :ivar int request_bytes: Size of the request body, or ``None`` if unknown
+    :ivar int response_bytes: Size of the response body, or ``None`` if unknown
+    :ivar int status: HTTP status code, or ``None`` if no response was received
+    :ivar int retries: Number of retries
+    :ivar float elapsed: Time elapsed from the first attempt to the response, including retries (seconds)
+    :ivar str error: Name of the exception raised, or ``None``
+    """
+
+    __slots__ = ('method', 'path', 'name', 'request_bytes', 'response_bytes', 'status', 'retries', 'elapsed', 'error', '_start')
+
+    def __init__(self, ctera_request):
+        self.method = ctera_request.method
+        self.path = urllib.parse.urlparse(ctera_request.url).path
+        self.name = ctera_request.name
+        self.request_bytes = RequestRecord._size(ctera_request.kwargs.get('data'))
+        self.response_bytes = None
+        self.status = None
+        self.retries = 0
+        self.elapsed = None
+        self.error = None
+        self._start = time.monotonic()
+
+    @property
+    def endpoint(self):
+        """ Endpoint key, consisting of the method, the logical path and the database or schema method name """
+        return '%s %s%s' % (self.method, logical_path(self.path), ':' + self.name if self.name else '')
+
+    @staticmethod
+    def _size(data):
+        if data is None:
+            return 0
+        if isinstance(data, (bytes, bytearray)):
+            return len(data)
+        if isinstance(data, str):
+            return len(data.encode('utf-8'))
+        return getattr(data, 'len', None)  # multipart encoder
+
+    def __repr__(self):
+        return '%s(%s)' % (self.__class__.__name__, ', '.join('%s=%r' % (k, getattr(self, k)) for k in self.__slots__[:-1]))
+
+
+class LatencyAggregator:
+    """
+    In-memory aggregator of request latencies and sizes per endpoint.
+
+    Percentiles are computed over the most recent ``config.http['metrics_samples']`` requests of each endpoint
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def __call__(self, record):
+        with self._lock:
+            endpoint = self._endpoints.get(record.endpoint)
+            if endpoint is None:
+                endpoint = self._endpoints[record.endpoint] = _Endpoint(config.http['metrics_samples'])
+            endpoint.add(record)
+
+    def snapshot(self):
+        """
+        Return the request statistics of each endpoint
+
+        :return: Dictionary of endpoint keys and objects holding the number of requests, errors and retries,
+         the bytes sent and received and the latency percentiles in seconds
+        :rtype: dict
+        """
+        with self._lock:
+            return {key: endpoint.snapshot() for key, endpoint in self._endpoints.items()}
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+
+class _Endpoint:
+
+    def __init__(self, samples):
+        self.latencies = collections.deque(maxlen=samples)
+        self.requests = self.errors = self.retries = 0
+        self.request_bytes = self.response_bytes = 0
+
+    def add(self, record):
+        self.latencies.append(record.elapsed)
+        self.requests = self.requests + 1
+        self.retries = self.retries + record.retries
+        if record.error is not None:
+            self.errors = self.errors + 1
+        self.request_bytes = self.request_bytes + (record.request_bytes or 0)
+        self.response_bytes = self.response_bytes + (record.response_bytes or 0)
+
+    def snapshot(self):
+        stats = Object()
+        stats.requests = self.requests
+        stats.errors = self.errors
+        stats.retries = self.retries
+        stats.request_bytes = self.request_bytes
+        stats.response_bytes = self.response_bytes
+        latencies = sorted(self.latencies)
+        stats.mean = sum(latencies) / len(latencies)
+        stats.p50 = _percentile(latencies, 50)
+        stats.p90 = _percentile(latencies, 90)
+        stats.p99 = _percentile(latencies, 99)
+        stats.max = latencies[-1]
+        return stats
+
+
+def _percentile(ordered, percent):
+    """ Nearest-rank percentile of an ordered list """
+    index = max(-(-len(ordered) * percent // 100) - 1, 0)
+    return ordered[int(index)]
+
+
+class Instrumentation:
+    """
+    Request hooks of an http client.
+
+    Hooks are called with a :class:`RequestRecord` once a request completes, after all retries.
+    The built-in latency aggregator is fed when ``config.http['metrics']`` is enabled
+    """
+
+    def __init__(self):
+        self.hooks = []
+        self.aggregator = LatencyAggregator()
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook):
+        """
+        Add a request hook
+
+        :param callable hook: Function accepting a :class:`RequestRecord`
+        """
+        with self._lock:
+            self.hooks = self.hooks + [hook]
+
+    def remove_hook(self, hook):
+        """
+        Remove a request hook
+
+        :param callable hook: Function previously added
+        """
+        with self._lock:
+            hooks = list(self.hooks)
+            hooks.remove(hook)
+            self.hooks = hooks
+
+    def enabled(self):
+        return bool(self.hooks) or config.http['metrics']
+
+    @staticmethod
+    def start(ctera_request):
+        return RequestRecord(ctera_request)
+
+    def finish(self, record, ctera_request, response=None, error=None):
+        """
+        Complete a request record, and call the request hooks
+
+        :param cterasdk.client.instrumentation.RequestRecord record: Request record
+        :param cterasdk.client.http.HttpClientRequest ctera_request: Request
+        :param object,optional response: Response
+        :param Exception,optional error: Exception raised
+        """
+        record.elapsed = time.monotonic() - record._start  # pylint: disable=protected-access
+        record.retries = max(ctera_request.attempts - 1, 0)
+        if response is not None:
+            record.status = getattr(response, 'status_code', getattr(response, 'status', None))
+            record.response_bytes = Instrumentation._response_size(ctera_request, response)
+        if error is not None:
+            record.error = error.__class__.__name__
+            code = getattr(getattr(error, 'response', None), 'code', None)
+            record.status = code if code is not None else record.status
+        hooks = [self.aggregator] if config.http['metrics'] else []
+        for hook in hooks + self.hooks:
+            try:
+                hook(record)
+            except Exception:  # pylint: disable=broad-except
+                logging.getLogger().warning('Request hook failed. %s', {'hook': hook}, exc_info=True)
+
+    @staticmethod
+    def _response_size(ctera_request, response):
+        if ctera_request.kwargs.get('stream'):
+            length = response.headers.get('Content-Length')
+            return int(length) if length is not None else None
+        return len(response.content) if hasattr(response, 'content') else len(response.text.encode('utf-8'))
@@ -0,0 +1,88 @@
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from ..common import Object
+
+
+class ConnectionStatistics:
+    """ Thread-safe counters of connection pool usage """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._connections = 0
+        self._wait = 0
+        self._max_wait = 0
+
+    def on_checkout(self, seconds):
+        with self._lock:
+            self._requests = self._requests + 1
+            self._wait = self._wait + seconds
+            self._max_wait = max(self._max_wait, seconds)
+
+    def on_connect(self):
+        with self._lock:
+            self._connections = self._connections + 1
+
+    def snapshot(self):
+        """
+        Return the current connection statistics
+
+        :return: Object holding the number of requests, new and reused connections and the time spent waiting for a pooled connection
+        :rtype: cterasdk.common.object.Object
+        """
+        with self._lock:
+            stats = Object()
+            stats.requests = self._requests
+            stats.new_connections = self._connections
+            stats.reused_connections = max(self._requests - self._connections, 0)
+            stats.pool_wait_time = self._wait
+            stats.max_pool_wait_time = self._max_wait
+            return stats
+
+    def reset(self):
+        with self._lock:
+            self._requests = self._connections = 0
+            self._wait = self._max_wait = 0
+
+
+def _instrumented(pool_class, statistics):
+
+    def _get_conn(self, timeout=None):
+        start = time.monotonic()
+        try:
+            return pool_class._get_conn(self, timeout=timeout)  # pylint: disable=protected-access
+        finally:
+            statistics.on_checkout(time.monotonic() - start)
+
+    def connect(self):
+        statistics.on_connect()
+        return connection_class.connect(self)
+
+    connection_class = pool_class.ConnectionCls
+    return type('Instrumented' + pool_class.__name__, (pool_class,), dict(
+        _get_conn=_get_conn,
+        ConnectionCls=type('Instrumented' + connection_class.__name__, (connection_class,), dict(connect=connect))
+    ))
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter recording connection pool statistics
+
+    :param cterasdk.client.pool.ConnectionStatistics statistics: Statistics object to update
+    """
+
+    def __init__(self, statistics, pool_connections, pool_maxsize, pool_block):
+        self.statistics = statistics
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+
+    def init_poolmanager(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _instrumented(HTTPConnectionPool, self.statistics),
+            'https': _instrumented(HTTPSConnectionPool, self.statistics)
+        }
@@ -0,0 +1,311 @@
+import contextlib
+import logging
+import threading
+import time
+import urllib.parse
+
+from .. import config
+from ..common import Object
+from ..exception import RateLimitExceeded
+
+
+class RequestFamily:
+    API = 'api'
+    Files = 'files'
+
+
+class _CurrentFamily(threading.local):
+
+    def __init__(self):
+        super().__init__()
+        self.family = RequestFamily.API
+
+
+_current = _CurrentFamily()
+
+
+@contextlib.contextmanager
+def request_family(family):
+    """
+    Set the request family of requests sent by the current thread
+
+    :param str family: Request family
+    """
+    previous, _current.family = _current.family, family
+    try:
+        yield
+    finally:
+        _current.family = previous
+
+
+def current_family():
+    return _current.family
+
+
+class TokenBucket:
+    """
+    Token bucket, refilled at a constant rate
+
+    :param float rate: Number of tokens added per second
+    :param int,optional burst: Bucket capacity, defaults to the rate
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.burst = burst or max(rate, 1)
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self._tokens + (now - self._updated) * self.rate, self.burst)
+        self._updated = now
+
+    def reserve(self):
+        """
+        Take a token, even if the bucket is empty
+
+        :return float: Number of seconds to wait until the token is available
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = self._tokens - 1
+            return max(-self._tokens / self.rate, 0)
+
+    def try_acquire(self):
+        """
+        Take a token, if available
+
+        :return bool: ``True`` if a token was taken
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens = self._tokens - 1
+            return True
+
+
+class ThrottleStatistics:
+    """ Thread-safe counters of throttled requests """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests = self._throttled = self._rejected = 0
+        self._time = self._max_time = 0
+
+    def on_acquire(self, seconds):
+        with self._lock:
+            self._requests = self._requests + 1
+            if seconds > 0:
+                self._throttled = self._throttled + 1
+                self._time = self._time + seconds
+                self._max_time = max(self._max_time, seconds)
+
+    def on_reject(self):
+        with self._lock:
+            self._rejected = self._rejected + 1
+
+    def snapshot(self):
+        with self._lock:
+            stats = Object()
+            stats.requests = self._requests
+            stats.throttled = self._throttled
+            stats.rejected = self._rejected
+            stats.throttled_time = self._time
+            stats.max_throttled_time = self._max_time
+            return stats
+
+
+class ConcurrencySlot:
+    """
+    Concurrency slot of a request, released once.
+
+    A streamed response holds the slot until its body was read or the response was closed
+
+    :param threading.BoundedSemaphore semaphore: Semaphore to release, or ``None``
+    """
+
+    def __init__(self, semaphore=None):
+        self.held = False
+        self._semaphore = semaphore
+        self._lock = threading.Lock()
+
+    def hold(self, response):
+        """
+        Hold the slot until a response was read or closed
+
+        :param requests.Response response: Streamed response
+        """
+        if self._semaphore is None:
+            return
+        self.held = True
+        ConcurrencySlot._release_after(response, 'close', self.release)
+        if response.raw is not None and hasattr(response.raw, 'release_conn'):
+            ConcurrencySlot._release_after(response.raw, 'release_conn', self.release)  # called once the body was read
+
+    @staticmethod
+    def _release_after(obj, name, release):
+        function = getattr(obj, name)
+
+        def release_after(*args, **kwargs):
+            try:
+                return function(*args, **kwargs)
+            finally:
+                release()
+
+        setattr(obj, name, release_after)
+
+    def release(self):
+        with self._lock:
+            semaphore, self._semaphore = self._semaphore, None
+        if semaphore is not None:
+            semaphore.release()
+
+
+class RateLimiter:
+    """
+    Requests-per-second and concurrent-request caps of a single host and request family
+
+    :param str host: Host name
+    :param str family: Request family
+    :param float,optional rate: Maximum number of requests per second
+    :param int,optional burst: Maximum number of requests sent at once, after a period of inactivity
+    :param int,optional concurrency: Maximum number of concurrent requests
+    """
+
+    def __init__(self, host, family, rate=None, burst=None, concurrency=None):  # pylint: disable=too-many-arguments
+        self.host = host
+        self.family = family
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.semaphore = threading.BoundedSemaphore(concurrency) if concurrency else None
+        self.statistics = ThrottleStatistics()
+
+    @contextlib.contextmanager
+    def acquire(self, block=True):
+        """
+        Wait for the rate and concurrency limits
+
+        :param bool,optional block: Wait for capacity, defaults to ``True``. Otherwise, raise ``RateLimitExceeded``
+        :return cterasdk.client.ratelimit.ConcurrencySlot: Concurrency slot, released on exit unless held by a response
+        """
+        start, throttled = time.monotonic(), False
+        if self.semaphore is not None and not self.semaphore.acquire(blocking=False):
+            if not block:
+                self._reject('concurrency')
+            throttled = True
+            self.semaphore.acquire()
+        slot = ConcurrencySlot(self.semaphore)
+        try:
+            if self.bucket is not None:
+                if block:
+                    delay = self.bucket.reserve()
+                    if delay:
+                        throttled = True
+                        time.sleep(delay)
+                elif not self.bucket.try_acquire():
+                    self._reject('rate')
+        except BaseException:
+            slot.release()
+            raise
+        seconds = time.monotonic() - start if throttled else 0
+        self.statistics.on_acquire(seconds)
+        if throttled:
+            logging.getLogger().debug('Request throttled. %s', {'host': self.host, 'family': self.family, 'seconds': seconds})
+        try:
+            yield slot
+        finally:
+            if not slot.held:
+                slot.release()
+
+    def _reject(self, limit):
+        self.statistics.on_reject()
+        logging.getLogger().warning('Rate limit exceeded. %s', {'host': self.host, 'family': self.family, 'limit': limit})
+        raise RateLimitExceeded(self.host, self.family, limit)
+
+
+class RateLimiterRegistry:
+    """
+    Process-wide registry of rate limiters, keyed by scheme, host, port and request family.
+
+    Limits are read from ``config.http['rate_limits']`` when a rate limiter is first used
+    """
+
+    __instance = None
+    __lock = threading.Lock()
+
+    @staticmethod
+    def instance():
+        with RateLimiterRegistry.__lock:
+            if RateLimiterRegistry.__instance is None:
+                RateLimiterRegistry()
+        return RateLimiterRegistry.__instance
+
+    def __init__(self):
+        if RateLimiterRegistry.__instance is not None:
+            raise Exception("RateLimiterRegistry is a singleton class.")
+        self._lock = threading.Lock()
+        self._limiters = {}
+        RateLimiterRegistry.__instance = self
+
+    @staticmethod
+    def key(url):
+        parsed_url = urllib.parse.urlparse(url)
+        return (parsed_url.scheme, parsed_url.hostname, parsed_url.port)
+
+    def get(self, url, family):
+        """
+        Get the rate limiter of a host and request family
+
+        :param str url: Request URL
+        :param str family: Request family
+        :return cterasdk.client.ratelimit.RateLimiter: Rate limiter
+        """
+        key = RateLimiterRegistry.key(url) + (family,)
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                limits = config.http['rate_limits'][family]
+                limiter = RateLimiter(key[1], family, limits['rate'], limits['burst'], limits['concurrency'])
+                self._limiters[key] = limiter
+            return limiter
+
+    def statistics(self, url):
+        """
+        Get the throttling statistics of a host
+
+        :param str url: URL of the host
+        :return: Object holding the throttling statistics of each request family
+        :rtype: cterasdk.common.object.Object
+        """
+        stats = Object()
+        with self._lock:
+            for family in [RequestFamily.API, RequestFamily.Files]:
+                limiter = self._limiters.get(RateLimiterRegistry.key(url) + (family,))
+                setattr(stats, family, limiter.statistics.snapshot() if limiter else ThrottleStatistics().snapshot())
+        return stats
+
+    def reset(self):
+        """
+        Remove all rate limiters, applying changes to ``config.http['rate_limits']``
+        """
+        with self._lock:
+            self._limiters.clear()
+
+
+@contextlib.contextmanager
+def throttle(url):
+    """
+    Apply the rate limits of a host and the current request family to a request
+
+    :param str url: Request URL
+    :return cterasdk.client.ratelimit.ConcurrencySlot: Concurrency slot, released on exit unless held by a response
+    """
+    family = current_family()
+    limits = config.http['rate_limits'][family]
+    if not (limits['rate'] or limits['concurrency']):
+        yield ConcurrencySlot()
+        return
+    with RateLimiterRegistry.instance().get(url, family).acquire(config.http['rate_limit_block']) as slot:
+        yield slot
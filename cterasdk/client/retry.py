@@ -0,0 +1,132 @@
+import collections
+import datetime
+import email.utils
+import logging
+import random
+import threading
+import time
+import urllib.parse
+
+from .. import config
+
+
+class RetryBudget:
+    """
+    Limit the number of retries sent to each host within a sliding time window
+
+    :param int budget: Maximum number of retries per host within the window
+    :param int window: Window length, in seconds
+    """
+
+    def __init__(self, budget, window):
+        self.budget = budget
+        self.window = window
+        self._lock = threading.Lock()
+        self._retries = collections.defaultdict(collections.deque)
+
+    def acquire(self, host):
+        """
+        Consume a retry from the budget of a host
+
+        :param str host: Host name
+        :return bool: ``True`` if the retry is allowed, ``False`` if the budget of the host is exhausted
+        """
+        now = time.monotonic()
+        with self._lock:
+            retries = self._retries[host]
+            while retries and now - retries[0] > self.window:
+                retries.popleft()
+            if len(retries) >= self.budget:
+                return False
+            retries.append(now)
+            return True
+
+
+class RetryPolicy:
+    """
+    Retry policy with exponential backoff, jitter and per-host retry budgets.
+
+    Only idempotent requests are retried. Unless specified, parameters default to the values of ``config.http``
+
+    :param int,optional retries: Maximum number of attempts per request
+    :param float,optional backoff_factor: Delay before the first retry, doubled on every subsequent retry (seconds)
+    :param float,optional backoff_max: Maximum delay between attempts (seconds)
+    :param bool,optional jitter: Randomize the delay between zero and the computed backoff
+    :param list[int],optional retry_statuses: HTTP status codes to retry
+    :param bool,optional retry_after: Honor the ``Retry-After`` response header, even if longer than ``backoff_max``
+    :param int,optional retry_budget: Maximum number of retries per host within ``retry_budget_window``
+    :param int,optional retry_budget_window: Retry budget window (seconds)
+    :param list[str],optional safe_methods: Names of database and user-defined methods, and paths of form posts, that are safe to retry
+    :param float,optional retry_after_max: Maximum ``Retry-After`` delay to wait for. Longer delays are not retried (seconds)
+    """
+
+    def __init__(self, retries=None, backoff_factor=None, backoff_max=None, jitter=None,  # pylint: disable=too-many-arguments
+                 retry_statuses=None, retry_after=None, retry_budget=None, retry_budget_window=None, safe_methods=None,
+                 retry_after_max=None):
+        self.retries = RetryPolicy._default(retries, 'retries')
+        self.backoff_factor = RetryPolicy._default(backoff_factor, 'backoff_factor')
+        self.backoff_max = RetryPolicy._default(backoff_max, 'backoff_max')
+        self.jitter = RetryPolicy._default(jitter, 'jitter')
+        self.retry_statuses = RetryPolicy._default(retry_statuses, 'retry_statuses')
+        self.retry_after = RetryPolicy._default(retry_after, 'retry_after')
+        self.retry_after_max = RetryPolicy._default(retry_after_max, 'retry_after_max')
+        self.safe_methods = RetryPolicy._default(safe_methods, 'safe_methods')
+        self.budget = RetryBudget(RetryPolicy._default(retry_budget, 'retry_budget'),
+                                  RetryPolicy._default(retry_budget_window, 'retry_budget_window'))
+
+    @staticmethod
+    def _default(value, key):
+        return config.http[key] if value is None else value
+
+    def is_safe(self, name):
+        """
+        Check if a database or user-defined method, or a form post, is safe to retry
+
+        :param str name: Method name, or the path of a form post
+        """
+        return name in self.safe_methods
+
+    def delay(self, request, attempt, response=None):
+        """
+        Compute the delay before retrying a request
+
+        :param cterasdk.client.http.HttpClientRequest request: The failed request
+        :param int attempt: Zero-based number of the failed attempt
+        :param object,optional response: The error response, if the server responded
+        :return: Number of seconds to wait before retrying, or ``None`` if the request must not be retried
+        """
+        if attempt + 1 >= self.retries or not request.idempotent:
+            return None
+        if response is not None and response.status_code not in self.retry_statuses:
+            return None
+        retry_after = self._retry_after(response) if self.retry_after and response is not None else None
+        if retry_after is not None and retry_after > self.retry_after_max:
+            logging.getLogger().warning('Retry-After exceeds the maximum delay. %s', {'url': request.url, 'retry_after': retry_after,
+                                                                                      'max': self.retry_after_max})
+            return None
+        host = urllib.parse.urlparse(request.url).hostname
+        if not self.budget.acquire(host):
+            logging.getLogger().warning('Retry budget exhausted. %s', {'host': host})
+            return None
+        seconds = self._backoff(attempt)
+        if retry_after is not None:
+            seconds = max(seconds, retry_after)
+        logging.getLogger().debug('Retrying request. %s', {'url': request.url, 'attempt': attempt + 1, 'delay': seconds})
+        return seconds
+
+    def _backoff(self, attempt):
+        seconds = min(self.backoff_factor * (2 ** attempt), self.backoff_max)
+        return random.uniform(0, seconds) if self.jitter else seconds
+
+    @staticmethod
+    def _retry_after(response):
+        value = response.headers.get('Retry-After') if response.headers else None
+        if not value:
+            return None
+        if value.strip().isdigit():
+            return int(value)
+        try:
+            date = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max((date - datetime.datetime.now(date.tzinfo)).total_seconds(), 0)
@@ -0,0 +1,141 @@
+import hashlib
+import hmac
+import json
+import logging
+import os
+import threading
+
+from .. import config
+from ..common import Object
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:  # pragma: no cover
+    Fernet = InvalidToken = None
+
+
+class SessionCache:
+    """
+    Encrypted on-disk store of session identifiers and users, keyed by host and user name.
+
+    Sessions are encrypted using the ``cryptography`` package. Unless ``config.sessions['key']`` is set,
+    a key is generated and stored in the cache directory, readable by the current user only.
+    A session is loaded only for the password it was saved with, which is stored as a salted hash
+    """
+
+    _iterations = 100000
+
+    __instance = None
+    __lock = threading.Lock()
+
+    @staticmethod
+    def instance():
+        with SessionCache.__lock:
+            if SessionCache.__instance is None:
+                SessionCache()
+        return SessionCache.__instance
+
+    def __init__(self):
+        if SessionCache.__instance is not None:
+            raise Exception("SessionCache is a singleton class.")
+        self._lock = threading.Lock()
+        SessionCache.__instance = self
+
+    @staticmethod
+    def enabled():
+        if not config.sessions['cache']:
+            return False
+        if Fernet is None:
+            logging.getLogger().warning('Session cache requires the cryptography package. Skipping.')
+            return False
+        return True
+
+    def load(self, host, username, password):
+        """
+        Load a session from the cache
+
+        :param str host: Host URL
+        :param str username: User name
+        :param str password: User password
+        :return: Object holding the session identifier and the session user, or ``None`` if not found
+         or if the password does not match
+        """
+        path = self._path(host, username)
+        try:
+            with open(path, 'rb') as f:
+                entry = json.loads(self._fernet().decrypt(f.read()).decode('utf-8'))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, InvalidToken):
+            logging.getLogger().warning('Could not read cached session. %s', {'host': host, 'user': username})
+            self.remove(host, username)
+            return None
+        if 'salt' not in entry or not hmac.compare_digest(SessionCache._hash(password, entry['salt']), entry.get('password', '')):
+            logging.getLogger().debug('Password does not match cached session. %s', {'host': host, 'user': username})
+            return None
+        session = Object()
+        session.session_id = entry['session_id']
+        session.user = entry['user']
+        logging.getLogger().debug('Loaded cached session. %s', {'host': host, 'user': username})
+        return session
+
+    def save(self, host, username, password, session_id, user):
+        """
+        Save a session to the cache
+
+        :param str host: Host URL
+        :param str username: User name
+        :param str password: User password
+        :param str session_id: Session identifier
+        :param cterasdk.lib.session_base.SessionUser user: Session user
+        """
+        if session_id is None:
+            return
+        salt = os.urandom(16).hex()
+        entry = json.dumps({'session_id': session_id, 'salt': salt, 'password': SessionCache._hash(password, salt),
+                            'user': {'name': user.name, 'tenant': user.tenant, 'role': user.role}})
+        token = self._fernet().encrypt(entry.encode('utf-8'))
+        path = self._path(host, username)
+        with self._lock:
+            with os.fdopen(os.open(path + '.tmp', os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as f:
+                f.write(token)
+            os.replace(path + '.tmp', path)
+        logging.getLogger().debug('Saved session to cache. %s', {'host': host, 'user': username})
+
+    def remove(self, host, username):
+        """
+        Remove a session from the cache
+
+        :param str host: Host URL
+        :param str username: User name
+        """
+        try:
+            os.remove(self._path(host, username))
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _hash(password, salt):
+        return hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), bytes.fromhex(salt), SessionCache._iterations).hex()
+
+    @staticmethod
+    def _directory():
+        directory = os.path.expanduser(config.sessions['directory'])
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        return directory
+
+    def _path(self, host, username):
+        name = hashlib.sha256(('%s|%s' % (host, username)).encode('utf-8')).hexdigest()
+        return os.path.join(SessionCache._directory(), name + '.session')
+
+    def _fernet(self):
+        key = config.sessions['key']
+        if key is None:
+            path = os.path.join(SessionCache._directory(), '.key')
+            with self._lock:
+                if not os.path.exists(path):
+                    with os.fdopen(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), 'wb') as f:
+                        f.write(Fernet.generate_key())
+                with open(path, 'rb') as f:
+                    key = f.read()
+        return Fernet(key)
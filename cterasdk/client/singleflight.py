@@ -0,0 +1,86 @@
+import copy
+import logging
+import threading
+
+from ..common import Object
+
+
+class _Call:
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Collapse concurrent identical calls into a single call.
+
+    The first caller of a key executes the call, while concurrent callers of the same key wait for it to complete
+    and receive a copy of a snapshot of its result, taken before the caller can modify it, or the exception it raised
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._requests = 0
+        self._collapsed = 0
+
+    def do(self, key, function):
+        """
+        Execute a call, or wait for an identical call in flight
+
+        :param object key: Hashable call identifier
+        :param callable function: Function to execute
+        :return: The return value of the function
+        """
+        with self._lock:
+            self._requests = self._requests + 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                call.waiters = call.waiters + 1
+                self._collapsed = self._collapsed + 1
+        if not leader:
+            logging.getLogger().debug('Waiting for identical request in flight. %s', {'key': key})
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+        try:
+            call.result = function()
+        except Exception as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            result = call.result
+            try:
+                if call.waiters and call.error is None:
+                    call.result = copy.deepcopy(result)
+            finally:
+                call.event.set()
+        return result
+
+    def snapshot(self):
+        """
+        Return the current single-flight statistics
+
+        :return: Object holding the number of requests, and the number of requests collapsed into a request in flight
+        :rtype: cterasdk.common.object.Object
+        """
+        with self._lock:
+            stats = Object()
+            stats.requests = self._requests
+            stats.collapsed = self._collapsed
+            return stats
+
+    def reset(self):
+        with self._lock:
+            self._requests = self._collapsed = 0
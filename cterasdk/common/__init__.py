@@ -1,4 +1,5 @@
 from .item import Item  # noqa: E402, F401
 from .object import Object  # noqa: E402, F401
+from .record import Record  # noqa: E402, F401
 from .datetime_utils import DateTimeUtils  # noqa: E402, F401
 from .utils import merge, union, parse_base_object_ref  # noqa: E402, F401
@@ -3,4 +3,5 @@ import json
 
 class Object:  # pylint: disable=too-many-instance-attributes
     def __str__(self):
-        return json.dumps(self, default=lambda o: o.__dict__, indent=5)
+        from ..convert import materialize  # pylint: disable=import-outside-toplevel  # convert imports common
+        return json.dumps(self, default=lambda o: materialize(o).__dict__, indent=5)
@@ -0,0 +1,111 @@
+import json
+import keyword
+import threading
+
+
+class _Attributes(dict):
+    """ Read-only copy of the attributes of a record """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError('Record attributes cannot be changed using __dict__. Assign the attribute instead')
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _readonly
+
+
+class Record:
+    """
+    Compact object with a fixed set of attributes, stored in slots.
+
+    Record types are generated and cached per class name and attribute names. Records are not
+    :class:`cterasdk.common.object.Object` instances. Attributes may be read and assigned, but not added or deleted.
+    The ``__dict__`` of a record is a read-only copy of its attributes
+    """
+
+    __slots__ = ()
+    _classname = None
+
+    @property
+    def __dict__(self):
+        attributes = {'_classname': self._classname} if self._classname is not None else {}
+        for field in self.__slots__:
+            attributes[field] = getattr(self, field)
+        return _Attributes(attributes)
+
+    def __reduce__(self):
+        return (_restore, (self._classname, self.__slots__, tuple(getattr(self, field) for field in self.__slots__)))
+
+    def __str__(self):
+        return json.dumps(self, default=lambda o: o.__dict__, indent=5)
+
+    def __repr__(self):
+        return '%s(%s)' % (self.__class__.__name__, ', '.join('%s=%r' % (field, getattr(self, field)) for field in self.__slots__))
+
+
+class RecordTypes:
+    """
+    Cache of generated record types, keyed by class name and attribute names
+
+    :param int,optional maxsize: Maximum number of record types, defaults to 1024
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._types = {}
+
+    def get(self, classname, fields):
+        """
+        Get the record type of a class name and attribute names
+
+        :param str classname: Class name, or ``None``
+        :param tuple[str] fields: Attribute names, including ``_uuid`` if the objects have a unique identifier
+        :return: Record type, or ``None`` if the attribute names cannot be stored in slots
+        """
+        key = (classname, fields)
+        record_type = self._types.get(key)
+        if record_type is not None or key in self._types:
+            return record_type
+        with self._lock:
+            if len(self._types) >= self.maxsize:
+                return None
+            record_type = self._types[key] = RecordTypes._create(classname, fields)
+            return record_type
+
+    @staticmethod
+    def _create(classname, fields):
+        if not all(field.isidentifier() and not keyword.iskeyword(field) and (not field.startswith('_') or field == '_uuid')
+                   for field in fields):
+            return None
+        name = classname if classname is not None and classname.isidentifier() else 'Record'
+        arguments = ', '.join(fields)
+        namespace = {}
+        exec('def __init__(self, %s):\n    %s\n' % (  # pylint: disable=exec-used
+            arguments, '\n    '.join('self.%s = %s' % (field, field) for field in fields) or 'pass'), namespace)
+        return type(name, (Record,), dict(__slots__=fields, __init__=namespace['__init__'], _classname=classname))
+
+
+record_types = RecordTypes()
+
+
+def _restore(classname, fields, values):
+    """ Create a record when unpickling, since generated record types cannot be looked up by name """
+    record_type = record_types.get(classname, fields) or RecordTypes._create(classname, fields)  # pylint: disable=protected-access
+    return record_type(*values)
+
+
+def compact(obj):
+    """
+    Convert an object to a record
+
+    :param cterasdk.common.object.Object obj: Object
+    :return: A record holding the attributes of the object, or the object if it cannot be stored in a record
+    """
+    attributes = obj.__dict__
+    classname = attributes.get('_classname')
+    if classname is not None:
+        attributes = dict(attributes)
+        del attributes['_classname']
+    record_type = record_types.get(classname, tuple(attributes))
+    if record_type is None:
+        return obj
+    return record_type(*attributes.values())
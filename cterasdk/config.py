@@ -1,11 +1,15 @@
 import os
 import sys
+import queue
+import atexit
 import logging
+import logging.handlers
 
 
 class Logging:
 
     __instance = None
+    __listener = None
 
     @staticmethod
     def get():
@@ -26,6 +30,8 @@ class Logging:
         logger = logging.getLogger()
         logger.disabled = disabled
         logger.level = level
+        if logconf['queue']:
+            Logging.enable_queue()
 
     @staticmethod
     def _logconf(fmt, df, filename=None):
@@ -48,6 +54,41 @@ class Logging:
     def enable():
         logging.getLogger().disabled = False
 
+    @staticmethod
+    def enable_queue():
+        """
+        Write log messages from a background thread.
+
+        Messages are formatted by the calling thread, and written by the handlers of the root logger from a queue
+        """
+        if Logging.__listener is not None:
+            return
+        logger = logging.getLogger()
+        handlers = list(logger.handlers)
+        for handler in handlers:
+            logger.removeHandler(handler)
+        q = queue.Queue(-1)
+        Logging.__listener = logging.handlers.QueueListener(q, *handlers, respect_handler_level=True)
+        logger.addHandler(logging.handlers.QueueHandler(q))
+        Logging.__listener.start()
+        atexit.register(Logging.disable_queue)
+
+    @staticmethod
+    def disable_queue():
+        """
+        Write the queued log messages, and write log messages from the logging thread
+        """
+        listener, Logging.__listener = Logging.__listener, None
+        if listener is None:
+            return
+        listener.stop()
+        logger = logging.getLogger()
+        for handler in list(logger.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler) and handler.queue is listener.queue:
+                logger.removeHandler(handler)
+        for handler in listener.handlers:
+            logger.addHandler(handler)
+
     @staticmethod
     def setLevel(level):
         logging.getLogger().setLevel(level)
@@ -66,14 +107,49 @@ logconf = dict(
     level=logging.INFO,
     fmt='%(asctime)s,%(msecs)3d %(levelname)7s [%(filename)s:%(lineno)d] [%(funcName)s] - %(message)s',
     df='%Y-%m-%d %H:%M:%S',
-    filename=os.environ.get('CTERASDK_LOG_FILE')
+    filename=os.environ.get('CTERASDK_LOG_FILE'),
+    queue=bool(os.environ.get('CTERASDK_LOG_QUEUE'))  # write log messages from a background thread
 )
 
 http = dict(
     timeout=20,  # http client timeout (seconds)
-    retries=3,  # handle connection timeout
+    retries=3,  # maximum number of attempts per request
+    backoff_factor=0.5,  # delay before the first retry, doubled on every subsequent retry (seconds)
+    backoff_max=30,  # maximum delay between attempts (seconds)
+    jitter=True,  # randomize the delay between attempts
+    retry_statuses=[429, 502, 503, 504],  # http status codes to retry
+    retry_after=True,  # honor the Retry-After response header
+    retry_after_max=300,  # maximum Retry-After delay to wait for, longer delays are not retried (seconds)
+    retry_budget=100,  # maximum number of retries per host within the budget window
+    retry_budget_window=60,  # retry budget window (seconds)
+    safe_methods=['get-multi', 'query', 'queryLogs', 'pagedQuery', 'fetchResources'],  # methods and form paths safe to retry
+    retry_policy=None,  # custom cterasdk.client.retry.RetryPolicy instance
     ssl='Consent',  # ['Consent', 'Trust']
-    verbose=False  # include request info on error
+    verbose=False,  # include request info on error
+    pool_connections=10,  # number of per-host connection pools to cache
+    pool_maxsize=10,  # maximum number of connections to keep in each host pool
+    pool_block=False,  # wait for a free connection when the pool is exhausted, instead of opening a new one
+    keep_alive=True,  # reuse connections across requests
+    compression=False,  # compress request bodies using gzip
+    compression_threshold=1024,  # minimum size of a request body to compress (bytes)
+    compression_level=6,  # gzip compression level, 1 (fastest) to 9 (smallest)
+    accept_encoding='gzip, deflate',  # content encodings accepted in responses
+    single_flight=False,  # share a single request between concurrent identical GET requests
+    streaming=False,  # parse paged query responses incrementally, returning objects as they are received
+    circuit_breaker=False,  # fail fast on requests to hosts that are known to be unreachable
+    circuit_failure_threshold=3,  # number of consecutive connection failures that open the circuit of a host
+    circuit_recovery_timeout=60,  # time to wait before sending a trial request to a host with an open circuit (seconds)
+    rate_limits=dict(  # per host limits of requests per second, burst size and concurrent requests, or None for no limit
+        api=dict(rate=None, burst=None, concurrency=None),  # database and schema methods
+        files=dict(rate=None, burst=None, concurrency=None)  # file transfers, using the file url of the host
+    ),
+    rate_limit_block=True,  # wait for the rate limit to allow the request, otherwise raise RateLimitExceeded
+    stream_requests=False,  # serialize request bodies as they are sent, using chunked transfer encoding
+    metrics=False,  # aggregate request latencies and sizes per endpoint, available using metrics()
+    metrics_samples=1024,  # number of most recent requests per endpoint used to compute latency percentiles
+    prefetch=0,  # number of query pages to fetch on a background thread ahead of the consumer, 0 to fetch pages on demand
+    query_workers=0,  # number of query pages to fetch concurrently, 0 to fetch pages one at a time
+    query_ordered=True  # return the objects of concurrently fetched query pages in order, otherwise as pages are fetched
 )
 
 connect = dict(
@@ -84,6 +160,18 @@ filesystem = dict(
     dl='~/Downloads'
 )
 
+sessions = dict(
+    cache=False,  # persist sessions on disk, reusing them across processes
+    directory='~/.ctera/sessions',
+    key=os.environ.get('CTERASDK_SESSION_KEY')  # session encryption key, generated and saved in the cache directory if not set
+)
+
+codec = dict(
+    backend='python',  # xml parser, ['python', 'lxml']. lxml must be installed, and falls back to python otherwise
+    lazy=False,  # convert the attributes of response objects on first access
+    records=False  # convert the objects of response lists to compact records, with a fixed set of attributes
+)
+
 transcript = dict(
     disabled=True
 )
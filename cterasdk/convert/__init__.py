@@ -1,3 +1,5 @@
-from .parse import fromjsonstr, fromxmlstr  # noqa: E402, F401
-from .format import tojsonstr, toxmlstr  # noqa: E402, F401
+from .parse import fromjsonstr, fromjsonstream, JSONStream  # noqa: E402, F401
+from .parse import fromxmlstr, fromxmlstream, XMLStream, LazyObject, materialize  # noqa: E402, F401
+from .format import tojsonstr, tojsonstream, toxmlstr, XMLBody, JSONEncoder, LazyJSON  # noqa: E402, F401
+from .schema import schemas, Schemas  # noqa: E402, F401
 from .exception import ParseException  # noqa: E402, F401
@@ -0,0 +1,89 @@
+import logging
+import threading
+from xml.etree.ElementTree import fromstring as python_fromstring, ParseError
+
+from .. import config
+from .exception import ParseException
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # pragma: no cover
+    lxml_etree = None
+
+
+_lxml_missing = threading.Event()
+
+
+class Backend:
+    """
+    XML parser backends
+
+    :ivar str LXML: Use the C parser of the lxml package, if installed
+    :ivar str Python: Use the Python standard library
+    """
+    LXML = 'lxml'
+    Python = 'python'
+
+
+def available():
+    """
+    List the installed XML parser backends
+
+    :return list[str]: Backend names
+    """
+    return ([Backend.LXML] if lxml_etree is not None else []) + [Backend.Python]
+
+
+def selected():
+    """
+    Get the XML parser backend selected by ``config.codec['backend']``
+
+    :return str: Backend name
+    """
+    if config.codec['backend'] != Backend.LXML:
+        return Backend.Python
+    if lxml_etree is None:
+        if not _lxml_missing.is_set():
+            _lxml_missing.set()
+            logging.getLogger().warning('Could not find lxml. Using the Python XML parser.')
+        return Backend.Python
+    return Backend.LXML
+
+
+class _Parsers(threading.local):
+    """ lxml parsers may not be shared across threads """
+
+    def __init__(self):
+        super().__init__()
+        self.parser = None
+
+    def get(self):
+        if self.parser is None:
+            # huge_tree lifts the depth and text size limits of libxml2, which deep folder trees exceed
+            self.parser = lxml_etree.XMLParser(resolve_entities=False, no_network=True, remove_comments=True, remove_pis=True,
+                                               huge_tree=True)
+        return self.parser
+
+
+_parsers = _Parsers()
+
+
+def fromstring(string):
+    """
+    Parse an XML document using the selected backend
+
+    :param str string: XML document
+    :return: The root element, supporting the ``xml.etree.ElementTree.Element`` interface
+    """
+    if selected() == Backend.Python:
+        try:
+            return python_fromstring(string)
+        except ParseError:
+            raise ParseException()
+    try:
+        try:
+            return lxml_etree.fromstring(string, _parsers.get())
+        except ValueError:  # unicode strings with an encoding declaration
+            return lxml_etree.fromstring(string.encode('utf-8'), _parsers.get())
+    except lxml_etree.XMLSyntaxError:
+        raise ParseException()
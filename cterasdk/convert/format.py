@@ -1,11 +1,10 @@
-import queue
 import json
-import copy
-from xml.etree.ElementTree import Element, SubElement, tostring
+from xml.etree.ElementTree import fromstring
 from xml.dom import minidom
+from xml.sax.saxutils import escape
 
-from cterasdk.common import Item, Object
-from cterasdk.convert.xml_types import XMLTypes
+from cterasdk.common import Object, Record
+from .parse import materialize
 
 
 _sdk_hidden = [
@@ -24,12 +23,35 @@ _sdk_hidden = [
 ]
 
 
-def _to_protected_dict(o):
-    ret = copy.deepcopy(o.__dict__)
-    for key in _sdk_hidden:
-        if key in ret:
-            ret[key] = '*** The Value is Hidden by the SDK ***'
-    return ret
+_hidden = frozenset(_sdk_hidden)
+_hidden_value = '*** The Value is Hidden by the SDK ***'
+
+
+class JSONEncoder(json.JSONEncoder):
+    """
+    JSON encoder for Python objects, hiding sensitive values as objects are encoded.
+
+    Objects are encoded in place: sensitive values are replaced in a shallow copy of the attributes
+    of objects holding them, and other objects are not copied
+
+    :param bool,optional no_log: Hide sensitive values, defaults to ``True``
+    """
+
+    def __init__(self, *, no_log=True, **kwargs):
+        super().__init__(**kwargs)
+        self.no_log = no_log
+
+    def default(self, o):  # pylint: disable=method-hidden
+        attributes = materialize(o).__dict__
+        if self.no_log and not _hidden.isdisjoint(attributes):
+            return {key: _hidden_value if key in _hidden else value for key, value in attributes.items()}
+        return attributes
+
+
+_encoders = {
+    (pretty_print, no_log): JSONEncoder(no_log=no_log, indent=5 if pretty_print else None)
+    for pretty_print in (True, False) for no_log in (True, False)
+}
 
 
 def tojsonstr(obj, pretty_print=True, no_log=True):
@@ -42,10 +64,43 @@ def tojsonstr(obj, pretty_print=True, no_log=True):
     :return: JSON string of the object
     :rtype: str
     """
-    indent = 5 if pretty_print else None
-    if no_log:
-        return json.dumps(obj, default=_to_protected_dict, indent=indent)
-    return json.dumps(obj, default=lambda o: o.__dict__, indent=indent)
+    return _encoders[(bool(pretty_print), bool(no_log))].encode(obj)
+
+
+def tojsonstream(obj, fp, pretty_print=True, no_log=True):
+    """
+    Write a Python object to a file as JSON, in chunks as it is encoded
+
+    :param object obj: the Python object
+    :param object fp: File-like object opened for writing text
+    :param bool pretty_print: Whether to format the JSON string, defaults to ``True``
+    :param bool no_log: Hide sensitive values, defaults to ``True``
+    """
+    for chunk in _encoders[(bool(pretty_print), bool(no_log))].iterencode(obj):
+        fp.write(chunk)
+
+
+class LazyJSON:
+    """
+    Log message argument, converting a Python object to a JSON string only if the message is emitted
+
+    :param object obj: the Python object
+    :param bool pretty_print: Whether to format the JSON string, defaults to ``True``
+    :param bool no_log: Hide sensitive values, defaults to ``True``
+    """
+
+    __slots__ = ('obj', 'pretty_print', 'no_log')
+
+    def __init__(self, obj, pretty_print=True, no_log=True):
+        self.obj = obj
+        self.pretty_print = pretty_print
+        self.no_log = no_log
+
+    def __str__(self):
+        return tojsonstr(self.obj, self.pretty_print, self.no_log)
+
+    def __repr__(self):
+        return repr(str(self))
 
 
 def toxmlstr(obj, pretty_print=False):
@@ -59,62 +114,106 @@ def toxmlstr(obj, pretty_print=False):
     """
     if obj is None:
         return None
-    xml = toxml(obj)
+    string = b''.join(_serialize(obj, None))
     if pretty_print:
-        string = minidom.parseString(tostring(xml)).toprettyxml(indent="   ")
+        string = minidom.parseString(string).toprettyxml(indent="   ")
         return ''.join(string.split('\n', 1)[1:])
-    return tostring(xml)
+    return string
 
 
 def toxml(obj):
-    root = Item()
-    root.node = None
-    root.parent = None
-    root.obj = obj
-
-    q = queue.Queue()
-    q.put(root)
-    while not q.empty():
-        item = q.get()
-        if isinstance(item.obj, (str, int, float, complex, bool)):
-            item.node = CreateElement(item.parent, XMLTypes.VAL)
-            if isinstance(item.obj, bool):
-                item.node.text = str(item.obj).lower()
+    return fromstring(toxmlstr(obj))
+
+
+class XMLBody:
+    """
+    Request body, serializing a Python object to XML in chunks as it is sent.
+
+    The body may be iterated more than once, for example when a request is retried
+
+    :param object obj: the Python object
+    :param int,optional chunk_size: Approximate size of each chunk, defaults to 64KB
+    """
+
+    def __init__(self, obj, chunk_size=64 * 1024):
+        self.obj = obj
+        self.chunk_size = chunk_size
+
+    def __iter__(self):
+        return _serialize(self.obj, self.chunk_size)
+
+
+class _Markup(str):
+    __slots__ = ()
+
+
+_list_end = _Markup('</list>')
+_obj_end = _Markup('</obj>')
+_att_end = _Markup('</att>')
+_attrib_entities = {'"': '&quot;', '\r': '&#13;', '\n': '&#10;', '\t': '&#09;'}
+_serializable = (str, int, float, complex, bool, list, Object, Record)
+
+
+def _serialize(obj, chunk_size):
+    """
+    Serialize a Python object depth-first, yielding ascii-encoded chunks of at least ``chunk_size`` characters,
+    or a single chunk if ``chunk_size`` is ``None``
+    """
+    parts, size = [], 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        text = item if item.__class__ is _Markup else _open(item, stack)
+        parts.append(text)
+        if chunk_size is not None:
+            size = size + len(text)
+            if size >= chunk_size:
+                yield ''.join(parts).encode('ascii', 'xmlcharrefreplace')
+                parts, size = [], 0
+    if parts:
+        yield ''.join(parts).encode('ascii', 'xmlcharrefreplace')
+
+
+def _open(item, stack):  # pylint: disable=too-many-return-statements
+    """
+    Return the opening markup of an item, pushing its members and closing markup onto the stack
+    """
+    if isinstance(item, bool):
+        return '<val>true</val>' if item else '<val>false</val>'
+
+    if isinstance(item, (str, int, float, complex)):
+        text = str(item)
+        return '<val>' + escape(text) + '</val>' if text else '<val />'
+
+    if isinstance(item, list):
+        if not any(isinstance(member, _serializable) for member in item):
+            return '<list />'
+        stack.append(_list_end)
+        stack.extend(reversed(item))
+        return '<list>'
+
+    if isinstance(item, (Object, Record)):
+        attributes = materialize(item).__dict__
+        tag = '<obj'
+        classname = attributes.get('_classname')  # Convert { "_classname" : "ShareConfig" }
+        if classname is not None:
+            tag = tag + ' class="' + escape(classname, _attrib_entities) + '"'
+        uuid = attributes.get('_uuid')  # Convert { "_uuid" : "6f0e8c79-..." }
+        if uuid is not None:
+            tag = tag + ' uuid="' + escape(uuid, _attrib_entities) + '"'
+        names = [name for name in attributes if not name.startswith('_')]
+        if not names:
+            return tag + ' />'
+        stack.append(_obj_end)
+        for name in reversed(names):
+            value = attributes[name]
+            att = '<att id="' + escape(name, _attrib_entities) + '"'
+            if isinstance(value, _serializable):
+                stack.append(_att_end)
+                stack.append(value)
+                stack.append(_Markup(att + '>'))
             else:
-                item.node.text = str(item.obj)
-        elif isinstance(item.obj, list):
-            item.node = CreateElement(item.parent, XMLTypes.LIST)
-            for member in item.obj:
-                kid = Item()
-                kid.node = None
-                kid.parent = item.node
-                kid.obj = member
-                q.put(kid)
-        elif isinstance(item.obj, Object):
-            item.node = CreateElement(item.parent, XMLTypes.OBJ)
-            classname = item.obj.__dict__.get('_classname')  # Convert { "_classname" : "ShareConfig" }
-            if classname is not None:
-                item.node.set(XMLTypes.CLASS, classname)
-            uuid = item.obj.__dict__.get('_uuid')  # Convert { "_uuid" : "6f0e8c79-..." }
-            if uuid is not None:
-                item.node.set(XMLTypes.UUID, uuid)
-            for attribute_name in item.obj.__dict__:
-                if attribute_name.startswith('_'):
-                    continue
-                att = SubElement(item.node, XMLTypes.ATT)
-                att.set(XMLTypes.ID, attribute_name)
-                kid = Item()
-                kid.node = None
-                kid.parent = att
-                kid.obj = item.obj.__dict__[attribute_name]
-                q.put(kid)
-
-    return root.node
-
-
-def CreateElement(parent, tag):
-    if parent is not None:
-        element = SubElement(parent, tag)
-    else:
-        element = Element(tag)
-    return element
+                stack.append(_Markup(att + ' />'))
+        return tag + '>'
+
+    return ''
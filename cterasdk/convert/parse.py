@@ -1,17 +1,27 @@
+import re
+import codecs
 import logging
 import json
-import queue
-from xml.etree.ElementTree import fromstring, ParseError
+from xml.etree.ElementTree import ParseError, XMLPullParser
 
 from cterasdk.convert.xml_types import XMLTypes
 from .exception import ParseException
-from ..common import Item, Object
+from . import backend
+from .schema import schemas
+from ..common import Object
+from ..common.record import compact
+from .. import config
 
 
 def ParseValue(data):
     if not data:
         return data
 
+    if data.isdecimal():  # fast path, without raising exceptions
+        return int(data)
+    if data[0].isalpha() or data.count('.') > 1:  # not a number, e.g. a name, an ip address or a version
+        return _ParseText(data)
+
     try:
         if "." in data:
             return float(data)
@@ -23,6 +33,10 @@ def ParseValue(data):
     except ValueError:
         pass
 
+    return _ParseText(data)
+
+
+def _ParseText(data):
     text = data.strip()
     if text == "true":
         return True
@@ -32,55 +46,124 @@ def ParseValue(data):
     return text
 
 
-def SetAppendValue(item, value):
-    if item.parent is not None:
-        if isinstance(item.parent.value, list):
-            item.parent.value.append(value)
-        else:
-            setattr(item.parent.value, item.id, value)
-    else:
-        item.value = value
+def ParseTypedValue(data, parser):
+    """
+    Parse a value using the parser of its registered type, or by inferring its type if it cannot be parsed
+    """
+    if not data:
+        return data
+    try:
+        return parser(data)
+    except ValueError:
+        logging.getLogger().debug('Could not parse value as its registered type. %s', {'value': data})
+        return ParseValue(data)
+
+
+def _fromdict(attributes):
+    value = Object()
+    value.__dict__.update(attributes)
+    return value
+
+
+_decoder = json.JSONDecoder(object_hook=_fromdict)
 
 
 def fromjsonstr(fromstr):
+    """
+    Convert a JSON string to a Python object, decoding JSON objects as ``Object`` instances
+
+    :param str fromstr: JSON string
+    """
     if not fromstr:
         return fromstr
+    return _decoder.decode(fromstr)
+
+
+_delimiter = re.compile(r'[ \t\r\n]*[,\]]')
+
+
+class JSONStream:
+    """
+    Incremental JSON decoder, yielding the members of a JSON array one by one as they are read from a stream.
+
+    :param object source: File-like object to read from, opened in text or binary mode
+    """
 
-    root = Item()
-    root.node = json.loads(fromstr)
-    root.parent = None
-    root.value = None
-
-    q = queue.Queue()
-    q.put(root)
-    while not q.empty():
-        item = q.get()
-        if item.node is None:
-            SetAppendValue(item, None)
-        elif isinstance(item.node, (int, float, bool, str)):
-            SetAppendValue(item, item.node)
-        elif isinstance(item.node, list):
-            item.value = []
-            SetAppendValue(item, item.value)
-            for kidnode in item.node:
-                kid = Item()
-                kid.parent = item
-                kid.node = kidnode
-                q.put(kid)
-        elif isinstance(item.node, dict):
-            item.value = Object()
-            SetAppendValue(item, item.value)
-            for kidnode, kidvalue in item.node.items():
-                kid = Item()
-                kid.parent = item
-                kid.id = kidnode
-                kid.node = kidvalue
-                q.put(kid)
-
-    return root.value
-
-
-def fromxmlstr(string):  # pylint: disable=too-many-branches,too-many-statements
+    chunk_size = 64 * 1024
+
+    def __init__(self, source):
+        self._source = source
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._position = 0
+        self._eof = False
+
+    def __iter__(self):
+        if self._next() != '[':
+            raise ParseException()
+        self._position = self._position + 1
+        if self._next() == ']':
+            return
+        while True:
+            yield self._member()
+            delimiter = self._next()
+            self._position = self._position + 1
+            if delimiter == ']':
+                return
+            if delimiter != ',':
+                raise ParseException()
+
+    def _member(self):
+        self._next()
+        size = JSONStream.chunk_size
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._position)
+                if self._eof or _delimiter.match(self._buffer, end):  # otherwise, a number may continue in the next chunk
+                    self._position = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise ParseException()
+            # read in growing chunks, so a large member is decoded a logarithmic number of times
+            self._read(size)
+            size = size * 2
+
+    def _next(self):
+        """ Skip whitespace, and return the next character, or an empty string at the end of the stream """
+        while True:
+            while self._position < len(self._buffer) and self._buffer[self._position] in ' \t\r\n':
+                self._position = self._position + 1
+            if self._position < len(self._buffer) or self._eof:
+                return self._buffer[self._position:self._position + 1]
+            self._read()
+
+    def _read(self, size=None):
+        chunk = self._source.read(size or JSONStream.chunk_size)
+        if isinstance(chunk, bytes):
+            chunk = self._decoder.decode(chunk, final=not chunk)
+        self._eof = not chunk
+        self._buffer = self._buffer[self._position:] + chunk
+        self._position = 0
+
+
+def fromjsonstream(source):
+    """
+    Decode the members of a JSON array incrementally from a file-like object
+
+    :param object source: File-like object to read from, opened in text or binary mode
+    :return cterasdk.convert.parse.JSONStream: Stream of array members
+    """
+    return JSONStream(source)
+
+
+def fromxmlstr(string, lazy=None):
+    """
+    Convert an XML string to a Python object
+
+    :param str string: XML string
+    :param bool,optional lazy: Convert the attributes of objects on first access, defaults to ``config.codec['lazy']``
+    """
     if not string:
         logging.getLogger().debug('Skipping.')
         return string
@@ -90,60 +173,297 @@ def fromxmlstr(string):  # pylint: disable=too-many-branches,too-many-statements
         logging.getLogger().debug('Skipping. %s', {'type': 'HTML'})
         return string
 
-    root = Item()
-    root.value = None
-    root.parent = None
+    root = backend.fromstring(string)
+    if root.tag not in _values:
+        return None
+    if lazy if lazy is not None else config.codec['lazy']:
+        return _fromelement_lazy(root)
+    return _fromelement(root)
 
-    try:
-        root.node = fromstring(string)
-    except ParseError:
-        raise ParseException()
-
-    q = queue.Queue()
-    q.put(root)
-    while not q.empty():
-        item = q.get()
-        if item.node.tag == XMLTypes.VAL:
-            value = ParseValue(item.node.text)
-            SetAppendValue(item, value)
-        elif item.node.tag == XMLTypes.LIST:
-            item.value = []
-            SetAppendValue(item, item.value)
-            for kidnode in item.node:
-                if kidnode.tag in [XMLTypes.OBJ, XMLTypes.VAL]:
-                    kid = Item()
-                    kid.parent = item
-                    kid.node = kidnode
-                    q.put(kid)
-        elif item.node.tag == XMLTypes.OBJ:
-            classname = item.node.attrib.get(XMLTypes.CLASS)
-            uuid = item.node.attrib.get(XMLTypes.UUID)
-
-            item.value = Object()
-            if classname is not None:  # Convert <obj class="ShareConfig"> to { "_classname" : "ShareConfig" }
-                item.value._classname = classname  # pylint: disable=protected-access
-            if uuid is not None:  # Convert <obj uuid="6f0e8c79-..."> to { "_uuid" : "6f0e8c79-..." }
-                item.value._uuid = uuid  # pylint: disable=protected-access
-
-            SetAppendValue(item, item.value)
-
-            for kidnode in item.node:
-                if kidnode.tag == XMLTypes.ATT:
-                    kid = Item()
-                    kid.id = kidnode.attrib[XMLTypes.ID]
-                    kid.parent = item
-                    kid.node = kidnode
-                    q.put(kid)
-        elif item.node.tag == XMLTypes.ATT:
-            if len(item.node) > 0:
-                for kidnode in item.node:
-                    if kidnode.tag in [XMLTypes.OBJ, XMLTypes.LIST, XMLTypes.VAL]:
-                        kid = Item()
-                        kid.id = item.id
-                        kid.parent = item.parent
-                        kid.node = kidnode
-                        q.put(kid)
-            else:
-                SetAppendValue(item, None)              # include empty attrs
-
-    return root.value
+
+_values = frozenset([XMLTypes.OBJ, XMLTypes.LIST, XMLTypes.VAL])
+_members = frozenset([XMLTypes.OBJ, XMLTypes.VAL])
+
+
+def _fromelement(element):
+    """
+    Convert an <obj>, <list> or <val> element in a single depth-first pass
+    """
+    tag = element.tag
+    if tag == XMLTypes.VAL:
+        return ParseValue(element.text)
+
+    if tag == XMLTypes.LIST:
+        if config.codec['records']:
+            return [_compact(_fromelement(kid)) for kid in element if kid.tag in _members]
+        return [_fromelement(kid) for kid in element if kid.tag in _members]
+
+    value = Object()
+    attributes = value.__dict__
+    schema = None
+    if element.attrib:
+        classname = element.attrib.get(XMLTypes.CLASS)
+        if classname is not None:  # Convert <obj class="ShareConfig"> to { "_classname" : "ShareConfig" }
+            attributes['_classname'] = classname
+            schema = schemas.get(classname)
+        uuid = element.attrib.get(XMLTypes.UUID)
+        if uuid is not None:  # Convert <obj uuid="6f0e8c79-..."> to { "_uuid" : "6f0e8c79-..." }
+            attributes['_uuid'] = uuid
+    for att in element:
+        if att.tag != XMLTypes.ATT:
+            continue
+        if len(att) == 0:
+            attributes[att.attrib[XMLTypes.ID]] = None  # include empty attrs
+            continue
+        for kid in att:
+            if kid.tag == XMLTypes.VAL:
+                name = att.attrib[XMLTypes.ID]
+                attributes[name] = ParseValue(kid.text) if schema is None or name not in schema else \
+                    ParseTypedValue(kid.text, schema[name])
+            elif kid.tag in _values:
+                attributes[att.attrib[XMLTypes.ID]] = _fromelement(kid)
+    return value
+
+
+def _compact(value):
+    return compact(value) if value.__class__ is Object else value
+
+
+def _fromelement_lazy(element):
+    tag = element.tag
+    if tag == XMLTypes.VAL:
+        return ParseValue(element.text)
+    if tag == XMLTypes.LIST:
+        return [_fromelement_lazy(kid) for kid in element if kid.tag in _members]
+    return LazyObject(element)
+
+
+_missing = object()
+
+
+def _fromattribute_lazy(att, schema):
+    if len(att) == 0:
+        return None  # include empty attrs
+    value = _missing
+    for kid in att:
+        if kid.tag == XMLTypes.VAL and schema is not None and att.attrib[XMLTypes.ID] in schema:
+            value = ParseTypedValue(kid.text, schema[att.attrib[XMLTypes.ID]])
+        elif kid.tag in _values:
+            value = _fromelement_lazy(kid)
+    return value
+
+
+class LazyObject(Object):
+    """
+    Object converting its attributes from the parsed XML element on first access.
+
+    The ``__dict__`` of a lazy object holds the attributes accessed or set so far.
+    Use :func:`materialize` to convert all attributes. Serializing the object using ``tojsonstr`` or ``toxmlstr``
+    materializes it, and the objects nested in it
+    """
+
+    __slots__ = ('_element', '_index')
+
+    def __init__(self, element):
+        self._element = element
+        self._index = None
+        if element.attrib:
+            classname = element.attrib.get(XMLTypes.CLASS)
+            if classname is not None:
+                self.__dict__['_classname'] = classname
+            uuid = element.attrib.get(XMLTypes.UUID)
+            if uuid is not None:
+                self.__dict__['_uuid'] = uuid
+
+    def __getattr__(self, name):
+        if name.startswith('_') or self._element is None:
+            raise AttributeError("'%s' object has no attribute '%s'" % (self.__class__.__name__, name))
+        if self._index is None:
+            self._index = {att.attrib[XMLTypes.ID]: att for att in self._element if att.tag == XMLTypes.ATT}
+        att = self._index.get(name)
+        value = _fromattribute_lazy(att, schemas.get(self.__dict__.get('_classname'))) if att is not None else _missing
+        if value is _missing:
+            raise AttributeError("'%s' object has no attribute '%s'" % (self.__class__.__name__, name))
+        self.__dict__[name] = value
+        return value
+
+    def __delattr__(self, name):
+        materialize(self)
+        super().__delattr__(name)
+
+
+def materialize(obj):
+    """
+    Convert all attributes of a lazy object, preserving attributes accessed or set so far
+
+    :param object obj: Object
+    :return: The object
+    """
+    if not isinstance(obj, LazyObject) or obj._element is None:  # pylint: disable=protected-access
+        return obj
+    attributes = obj.__dict__
+    materialized = {key: attributes[key] for key in ['_classname', '_uuid'] if key in attributes}
+    schema = schemas.get(attributes.get('_classname'))
+    for att in obj._element:  # pylint: disable=protected-access
+        if att.tag != XMLTypes.ATT:
+            continue
+        name = att.attrib[XMLTypes.ID]
+        value = attributes[name] if name in attributes else _fromattribute_lazy(att, schema)
+        if value is not _missing:
+            materialized[name] = value
+    materialized.update((key, value) for key, value in attributes.items() if key not in materialized)
+    attributes.clear()
+    attributes.update(materialized)
+    obj._element = obj._index = None  # pylint: disable=protected-access
+    return obj
+
+
+class _Frame:
+
+    __slots__ = ('tag', 'value', 'id', 'filled', 'members')
+
+    def __init__(self, tag, value=None, identifier=None, members=False):
+        self.tag = tag
+        self.value = value
+        self.id = identifier
+        self.filled = False
+        self.members = members
+
+
+class XMLStream:
+    """
+    Incremental XML parser, converting and releasing elements as they are read from a stream.
+
+    Iterating the stream yields the members of the top-level list attributes named in ``members`` one by one,
+    instead of collecting them. The rest of the document is available using the ``value`` property.
+
+    :param object source: File-like object to read from
+    :param list[str],optional members: Names of the top-level list attributes to yield, e.g. ``['objects']``
+    :param callable,optional close: Function to call once the stream was parsed or abandoned
+    """
+
+    chunk_size = 64 * 1024
+    _accepts = {
+        None: [XMLTypes.OBJ, XMLTypes.LIST, XMLTypes.VAL],
+        XMLTypes.LIST: [XMLTypes.OBJ, XMLTypes.VAL],
+        XMLTypes.OBJ: [XMLTypes.ATT],
+        XMLTypes.ATT: [XMLTypes.OBJ, XMLTypes.LIST, XMLTypes.VAL],
+        XMLTypes.VAL: []
+    }
+
+    def __init__(self, source, members=None, close=None):
+        self._source = source
+        self._members = members or []
+        self._close = close
+        self._value = None
+        self._parsed = False
+
+    @property
+    def value(self):
+        """
+        The parsed document. Accessing the value parses the remainder of the stream
+        """
+        for _member in self:
+            pass
+        return self._value
+
+    def __iter__(self):
+        if self._parsed:
+            return
+        try:
+            yield from self._parse()
+        finally:
+            self._parsed = True
+            if self._close is not None:
+                self._close()
+
+    def _events(self):
+        parser = XMLPullParser(events=('start', 'end'))
+        chunk = self._source.read(XMLStream.chunk_size)
+        while chunk:
+            parser.feed(chunk)
+            yield from parser.read_events()
+            chunk = self._source.read(XMLStream.chunk_size)
+        parser.close()
+        yield from parser.read_events()
+
+    def _parse(self):
+        frames, elements, skip = [], [], 0
+        try:
+            for event, element in self._events():
+                if event == 'start':
+                    elements.append(element)
+                    if skip or element.tag not in XMLStream._accepts[frames[-1].tag if frames else None]:
+                        skip = skip + 1
+                    else:
+                        frames.append(self._start(frames, element))
+                    continue
+                elements.pop()
+                if elements:
+                    del elements[-1][-1]  # release the element, which is the last child of its parent
+                if skip:
+                    skip = skip - 1
+                    continue
+                frame = frames.pop()
+                value = XMLStream._end(frame, element, frames[-1] if frames else None)
+                if frame.tag == XMLTypes.ATT:
+                    continue
+                if not frames:
+                    self._value = value
+                elif frames[-1].members:
+                    yield value
+                else:
+                    XMLStream._append(frames[-1], value)
+        except ParseError:
+            if frames or elements:
+                raise ParseException()
+            logging.getLogger().debug('Skipping. %s', {'type': 'empty'})
+
+    def _start(self, frames, element):
+        if element.tag == XMLTypes.OBJ:
+            value = Object()
+            classname = element.attrib.get(XMLTypes.CLASS)
+            uuid = element.attrib.get(XMLTypes.UUID)
+            if classname is not None:
+                value._classname = classname  # pylint: disable=protected-access
+            if uuid is not None:
+                value._uuid = uuid  # pylint: disable=protected-access
+            return _Frame(element.tag, value)
+        if element.tag == XMLTypes.LIST:
+            parent = frames[-1] if frames else None
+            members = len(frames) == 2 and parent.tag == XMLTypes.ATT and parent.id in self._members
+            return _Frame(element.tag, [], members=members)
+        if element.tag == XMLTypes.ATT:
+            return _Frame(element.tag, frames[-1].value, element.attrib[XMLTypes.ID])
+        return _Frame(element.tag)
+
+    @staticmethod
+    def _end(frame, element, parent):
+        if frame.tag == XMLTypes.VAL:
+            if parent is not None and parent.tag == XMLTypes.ATT:
+                schema = schemas.get(parent.value.__dict__.get('_classname'))
+                if schema is not None and parent.id in schema:
+                    return ParseTypedValue(element.text, schema[parent.id])
+            return ParseValue(element.text)
+        if frame.tag == XMLTypes.ATT and not frame.filled:
+            setattr(frame.value, frame.id, None)  # include empty attrs
+        if frame.tag == XMLTypes.OBJ and parent is not None and parent.tag == XMLTypes.LIST and config.codec['records']:
+            return _compact(frame.value)
+        return frame.value
+
+    @staticmethod
+    def _append(parent, value):
+        if parent.tag == XMLTypes.LIST:
+            parent.value.append(value)
+        else:
+            setattr(parent.value, parent.id, value)
+            parent.filled = True
+
+
+def fromxmlstream(source):
+    """
+    Parse an XML document incrementally from a file-like object
+
+    :param object source: File-like object to read from
+    """
+    return XMLStream(source).value
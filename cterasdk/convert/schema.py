@@ -0,0 +1,82 @@
+import threading
+
+
+def _parse_str(data):
+    return data
+
+
+def _parse_bool(data):
+    text = data.strip()
+    if text == 'true':
+        return True
+    if text == 'false':
+        return False
+    raise ValueError('Invalid boolean: %s' % data)
+
+
+_parsers = {
+    str: _parse_str,
+    int: int,
+    float: float,
+    bool: _parse_bool
+}
+
+
+class Schemas:
+    """
+    Registry of attribute types by class name.
+
+    Scalar attributes of objects of a registered class are parsed as their registered type,
+    instead of inferring their type from their value. Values that cannot be parsed as their registered type,
+    and attributes that are not registered, are parsed by inferring their type
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._schemas = {}
+
+    def register(self, classname, types):
+        """
+        Register the attribute types of a class
+
+        :param str classname: Class name, e.g. ``'PortalUser'``
+        :param dict types: Attribute types by attribute name, each of ``str``, ``int``, ``float`` or ``bool``
+        """
+        invalid = [name for name, attribute_type in types.items() if attribute_type not in _parsers]
+        if invalid:
+            raise ValueError('Unsupported attribute types: %s' % ', '.join(invalid))
+        schema = {name: _parsers[attribute_type] for name, attribute_type in types.items()}
+        with self._lock:
+            registry = dict(self._schemas)
+            registry[classname] = schema
+            self._schemas = registry
+
+    def unregister(self, classname):
+        """
+        Remove the attribute types of a class
+
+        :param str classname: Class name
+        """
+        with self._lock:
+            registry = dict(self._schemas)
+            registry.pop(classname, None)
+            self._schemas = registry
+
+    def clear(self):
+        """
+        Remove the attribute types of all classes
+        """
+        with self._lock:
+            self._schemas = {}
+
+    def get(self, classname):
+        """
+        Get the attribute parsers of a class
+
+        :param str classname: Class name, or ``None``
+        :return: Parsers by attribute name, or ``None`` if the class is not registered
+        """
+        return self._schemas.get(classname)
+
+
+schemas = Schemas()
@@ -11,10 +11,11 @@ def update_current_tenant(function):
         if path == '/currentPortal':
             tenant = args[1]
             logging.getLogger().debug('Updating current tenant. %s', {'tenant': tenant})
-            session = self.session()
-            if not session.is_local_auth():  # Skip calling the function if using local authentication
-                ret = function(self, *args)
-            self.session().update_tenant(tenant)
+            with self._session_lock:  # pylint: disable=protected-access
+                session = self.session()
+                if not session.is_local_auth():  # Skip calling the function if using local authentication
+                    ret = function(self, *args)
+                self.session().update_tenant(tenant)
             logging.getLogger().debug('Updated current tenant. %s', {'tenant': tenant})
         else:
             ret = function(self, *args)
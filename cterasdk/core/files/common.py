@@ -5,33 +5,25 @@ from ...exception import RemoteDirectoryNotFound
 
 class SrcDstParam(Object):
 
-    __instance = None
-
     @staticmethod
     def instance(src, dest=None):
-        SrcDstParam(src, dest)
-        return SrcDstParam.__instance
+        return SrcDstParam(src, dest)
 
     def __init__(self, src, dest=None):
         self._classname = self.__class__.__name__
         self.src = src
         self.dest = dest
-        SrcDstParam.__instance = self
 
 
 class ActionResourcesParam(Object):
 
-    __instance = None
-
     @staticmethod
     def instance():
-        ActionResourcesParam()
-        return ActionResourcesParam.__instance
+        return ActionResourcesParam()
 
     def __init__(self):
         self._classname = self.__class__.__name__
         self.urls = []
-        ActionResourcesParam.__instance = self
 
     def add(self, param):
         self.urls.append(param)
@@ -39,12 +31,9 @@ class ActionResourcesParam(Object):
 
 class CreateShareParam(Object):
 
-    __instance = None
-
     @staticmethod
     def instance(path, access, expire_on):
-        CreateShareParam(path, access, expire_on)
-        return CreateShareParam.__instance
+        return CreateShareParam(path, access, expire_on)
 
     def __init__(self, path, access, expire_on):
         self._classname = self.__class__.__name__
@@ -57,7 +46,6 @@ class CreateShareParam(Object):
         self.share.invitee = Object()
         self.share.invitee._classname = 'Collaborator'
         self.share.invitee.type = 'external'
-        CreateShareParam.__instance = self
 
 
 def get_resource_info(ctera_host, path):
@@ -1,5 +1,6 @@
 from ...lib import Iterator, Command
 from .fetch_resources_param import FetchResourcesParamBuilder
+from ... import config
 
 
 def list_dir(ctera_host, param):
@@ -7,6 +8,14 @@ def list_dir(ctera_host, param):
     return (response.hasMore, response.items)
 
 
+def _list_page(ctera_host, param):
+    """ List a page for an iterator, streaming its items if ``config.http['streaming']`` is enabled """
+    if config.http['streaming']:
+        items = ctera_host.execute_stream('', 'fetchResources', param, ['items'])
+        return (lambda: items.value.hasMore, items)
+    return list_dir(ctera_host, param)
+
+
 def fetch_resources(ctera_host, param):
     return ctera_host.execute('', 'fetchResources', param)
 
@@ -17,6 +26,6 @@ def ls(ctera_host, path, depth=1, include_deleted=False):
         builder.include_deleted()
     param = builder.build()
     if depth > 0:
-        function = Command(list_dir, ctera_host)
+        function = Command(_list_page, ctera_host)
         return Iterator(function, param)
     return fetch_resources(ctera_host, param)
@@ -3,7 +3,7 @@ from urllib.parse import quote, unquote
 import re
 
 from ...exception import InputError
-from ...common import Object
+from ...common import Object, Record
 
 
 class CTERAPath:
@@ -12,7 +12,7 @@ class CTERAPath:
         if isinstance(item, str):
             self.basepath = PurePosixPath(basepath)
             self.relativepath = PurePosixPath(item)
-        elif isinstance(item, Object) and hasattr(item, '_classname') and item._classname == 'ResourceInfo':
+        elif isinstance(item, (Object, Record)) and hasattr(item, '_classname') and item._classname == 'ResourceInfo':
             href = unquote(item.href)
             match = re.search('^/(ServicesPortal|Users)/webdav', href)
             start, end = match.span()
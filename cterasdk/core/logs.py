@@ -3,6 +3,7 @@ from datetime import datetime
 from .base_command import BaseCommand
 from ..lib import Iterator, Command
 from ..core import enum
+from .. import config
 from . import query
 
 
@@ -34,7 +35,7 @@ class Logs(BaseCommand):
             builder.addFilter(query.FilterBuilder('time').after(self._strptime(after)))
 
         param = builder.build()
-        function = Command(self._query_logs)
+        function = Command(self._logs_page)
 
         return Iterator(function, param)
 
@@ -42,6 +43,13 @@ class Logs(BaseCommand):
         response = self._portal.execute('', 'queryLogs', param)
         return (response.hasMore, response.logs)
 
+    def _logs_page(self, param):
+        """ Query a page of logs for an iterator, streaming the logs if ``config.http['streaming']`` is enabled """
+        if config.http['streaming']:
+            logs = self._portal.execute_stream('', 'queryLogs', param, ['logs'])
+            return (lambda: logs.value.hasMore, logs)
+        return self._query_logs(param)
+
     @staticmethod
     def _strptime(datetime_str):
         try:
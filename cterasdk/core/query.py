@@ -1,8 +1,9 @@
 from datetime import datetime
 
-from ..lib import Iterator, Command
+from ..lib import Iterator, AsyncIterator, Command
 from ..common import Object
 from ..convert import tojsonstr
+from .. import config
 
 
 def query(CTERAHost, path, param):
@@ -10,6 +11,19 @@ def query(CTERAHost, path, param):
     return (response.hasMore, response.objects)
 
 
+def _page(CTERAHost, path, param):
+    """ Query a page for an iterator, streaming its objects if ``config.http['streaming']`` is enabled """
+    if config.http['streaming']:
+        objects = CTERAHost.db_stream(path, 'query', param, ['objects'])
+        return (lambda: objects.value.hasMore, objects)
+    return query(CTERAHost, path, param)
+
+
+async def async_query(CTERAHost, path, param):
+    response = await CTERAHost.db(path, 'query', param)
+    return (response.hasMore, response.objects)
+
+
 def show(CTERAHost, path, param):
     hasMore, objects = query(CTERAHost, path, param)
     print(tojsonstr(objects, no_log=False))
@@ -17,10 +31,15 @@ def show(CTERAHost, path, param):
 
 
 def iterator(CTERAHost, path, param):
-    function = Command(query, CTERAHost, path)
+    function = Command(_page, CTERAHost, path)
     return Iterator(function, param)
 
 
+def async_iterator(CTERAHost, path, param):
+    function = Command(async_query, CTERAHost, path)
+    return AsyncIterator(function, param)
+
+
 class Restriction:
     LIKE = "like"
     UNLIKE = "notLike"
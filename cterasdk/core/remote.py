@@ -1,4 +1,5 @@
 from .enum import DeviceType
+from ..convert import materialize
 from ..object.Gateway import Gateway
 from ..object.Agent import Agent
 
@@ -17,6 +18,6 @@ def remote_command(Portal, device):
     else:
         return device
 
-    ManagedDevice.__dict__.update(device.__dict__.copy())
+    ManagedDevice.__dict__.update(materialize(device).__dict__.copy())
 
     return ManagedDevice
@@ -11,11 +11,20 @@ class Session(SessionBase):
         self.context = context
 
     def _do_start_local_session(self, ctera_host):
-        tenant = ctera_host.get('/currentPortal') or Session.Administration
+        tenant = ctera_host.get('/currentPortal')
+        current_session = None if self.local_auth else ctera_host.get('/currentSession')
+        self._activate(tenant, current_session)
+
+    async def _do_async_start_local_session(self, ctera_host):
+        tenant = await ctera_host.get('/currentPortal')
+        current_session = None if self.local_auth else await ctera_host.get('/currentSession')
+        self._activate(tenant, current_session)
+
+    def _activate(self, tenant, current_session):
+        tenant = tenant or Session.Administration
         if self.local_auth:
             self.user = SessionUser('$admin', tenant=tenant, role=Role.ReadWriteAdmin)
         else:
-            current_session = ctera_host.get('/currentSession')
             self.user = SessionUser(current_session.username, tenant=tenant, role=current_session.role)
 
     def _do_terminate(self):
@@ -3,6 +3,7 @@ from ..lib import Command, Iterator
 from . import query
 from . import enum
 from .base_command import BaseCommand
+from .. import config
 
 
 class Logs(BaseCommand):
@@ -27,9 +28,16 @@ class Logs(BaseCommand):
         """
         param = query.QueryParamBuilder().include(
             include or Logs.default_include).put('topic', topic).put('minSeverity', minSeverity).build()
-        function = Command(self._query_logs)
+        function = Command(self._logs_page)
         return Iterator(function, param)
 
     def _query_logs(self, param):
         response = self._gateway.execute('/config/logging/general', 'pagedQuery', param)
         return (response.hasMore, response.logs)
+
+    def _logs_page(self, param):
+        """ Query a page of logs for an iterator, streaming the logs if ``config.http['streaming']`` is enabled """
+        if config.http['streaming']:
+            logs = self._gateway.execute_stream('/config/logging/general', 'pagedQuery', param, ['logs'])
+            return (lambda: logs.value.hasMore, logs)
+        return self._query_logs(param)
@@ -4,27 +4,57 @@ from ..exception import CTERAException
 
 
 def remote_access(Gateway, Portal):
-    tenant = Portal.session().tenant()
-    device = Gateway.host()
-    logging.getLogger().info("Enabling remote access. %s", {'tenant': tenant, 'device': device})
-
+    tenant, device = _enabling(Gateway, Portal)
     ticket = obtain_ticket(Portal, device)
     Gateway.session().enable_remote_access()
     login(Gateway, ticket)
     logging.getLogger().info("Enabled remote access. %s", {'tenant': tenant, 'device': device})
 
 
+async def async_remote_access(Gateway, Portal):
+    tenant, device = _enabling(Gateway, Portal)
+    ticket = await async_obtain_ticket(Portal, device)
+    Gateway.session().enable_remote_access()
+    await async_login(Gateway, ticket)
+    logging.getLogger().info("Enabled remote access. %s", {'tenant': tenant, 'device': device})
+
+
+def _enabling(Gateway, Portal):
+    if Portal is None:
+        logging.getLogger().error('Remote access requires a Portal. %s', {'device': Gateway.host()})
+        raise CTERAException('Remote access requires a Portal', None, device=Gateway.host())
+    tenant = Portal.session().tenant()
+    device = Gateway.host()
+    logging.getLogger().info("Enabling remote access. %s", {'tenant': tenant, 'device': device})
+    return tenant, device
+
+
 def login(Gateway, ticket):
     logging.getLogger().debug("Logging in using SSO ticket. %s", {'device': Gateway.host()})
     Gateway.get('/ssologin', {'ticket': ticket})
 
 
+async def async_login(Gateway, ticket):
+    logging.getLogger().debug("Logging in using SSO ticket. %s", {'device': Gateway.host()})
+    await Gateway.get('/ssologin', {'ticket': ticket})
+
+
 def obtain_ticket(Portal, device_name):
+    return _on_ticket(Portal, device_name, Portal.execute(_ticket_url(Portal, device_name), 'singleSignOn'))
+
+
+async def async_obtain_ticket(Portal, device_name):
+    return _on_ticket(Portal, device_name, await Portal.execute(_ticket_url(Portal, device_name), 'singleSignOn'))
+
+
+def _ticket_url(Portal, device_name):
     tenant = Portal.session().tenant()
-    url = '/portals/%s/devices/%s' % (tenant, device_name)
     logging.getLogger().debug("Obtaining SSO ticket. %s", {'tenant': tenant, 'device': device_name})
+    return '/portals/%s/devices/%s' % (tenant, device_name)
 
-    ticket = Portal.execute(url, 'singleSignOn')
+
+def _on_ticket(Portal, device_name, ticket):
+    tenant = Portal.session().tenant()
     if not ticket:
         logging.getLogger().error('Could not obtain SSO ticket. %s', {'tenant': tenant, 'device': device_name})
         raise CTERAException('Could not obtain SSO ticket.')
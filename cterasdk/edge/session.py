@@ -30,6 +30,10 @@ class Session(SessionBase):
         user = ctera_host.get('currentuser')
         self._activate(SessionType.Local, user)
 
+    async def _do_async_start_local_session(self, ctera_host):
+        user = await ctera_host.get('currentuser')
+        self._activate(SessionType.Local, user)
+
     def start_remote_session(self, remote_session):
         self._activate(SessionType.Remote, remote_session.user.name, tenant=remote_session.user.tenant, remote_from=remote_session.host)
         self.status = SessionStatus.Active
@@ -15,13 +15,20 @@ def api(Gateway):
         if session.remote_access():
             return remote_access(baseurl, device)   # remote: Gateway.remote_access()
 
-        base_object_ref = parse_base_object_ref(Gateway.portal)
-        return remote(baseurl, base_object_ref.name, device)  # remote, without a Gateway session
+        return remote(baseurl, _tenant(Gateway), device)  # remote, without a Gateway session
 
     logging.getLogger().error('Invalid connection type.')
     raise CTERAException('Invalid connection type', session)
 
 
+def _tenant(Gateway):
+    """ The tenant of a remote Gateway, or the tenant of the Portal session if the Gateway was not listed by the Portal """
+    portal = getattr(Gateway, 'portal', None)
+    if portal is not None:
+        return parse_base_object_ref(portal).name
+    return Gateway._Portal.session().tenant()  # pylint: disable=protected-access
+
+
 def local(baseurl):
     return '%s/admingui/api' % (baseurl)
 
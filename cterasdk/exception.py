@@ -51,6 +51,12 @@ class ExhaustedException(ConnectionTimeout):
         super().__init__("Don't blame me for lack of trying", retries * timeout, retries=retries, timeout=timeout)
 
 
+class RateLimitExceeded(CTERAException):
+
+    def __init__(self, host, family, limit):
+        super().__init__('Rate limit exceeded', None, host=host, family=family, limit=limit)
+
+
 class PythonVersionException(CTERAException):
 
     def __init__(self, version):
@@ -2,7 +2,7 @@ from .cmd import Command  # noqa: E402, F401
 from .consent import ask  # noqa: E402, F401
 from .tempfile import TempfileServices  # noqa: E402, F401
 from .version import Version  # noqa: E402, F401
-from .iterator import Iterator  # noqa: E402, F401
+from .iterator import Iterator, AsyncIterator  # noqa: E402, F401
 from .file_access_base import FileAccessBase  # noqa: E402, F401
 from .filesystem import FileSystem  # noqa: E402, F401
 from .tracker import track, ErrorStatus  # noqa: E402, F401
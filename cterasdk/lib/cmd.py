@@ -1,8 +1,9 @@
 class Command:
 
-    def __init__(self, cmd, *args):
+    def __init__(self, cmd, *args, **kwargs):
         self._cmd = cmd
         self._args = args
+        self._kwargs = kwargs
 
     def __call__(self, *args):
-        return self._cmd(*(self._args + args))
+        return self._cmd(*(self._args + args), **self._kwargs)
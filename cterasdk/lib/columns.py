@@ -0,0 +1,186 @@
+import sys
+import array
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+
+_typecodes = {
+    bool: 'b',
+    int: 'q',
+    float: 'd'
+}
+
+
+class Column:
+    """
+    Column of values of a single type.
+
+    Integers, floating point numbers and booleans are packed in an ``array.array``, and strings are interned.
+    Values of other types, or of mixed types, are stored in a list. Integers are converted to floating point numbers
+    if the column holds both. Integers out of the range of a 64-bit integer, or of a floating point number, are stored in a list
+
+    :ivar str name: Field name
+    :ivar type type: Value type, one of ``int``, ``float``, ``bool``, ``str`` or ``object``, or ``None`` if all values are ``None``
+    :ivar values: Values, packed in an ``array.array`` for numeric and boolean columns. ``None`` values are stored as ``0``
+    :ivar array.array nulls: Null mask, ``1`` for ``None`` values, or ``None`` if the column has no ``None`` values
+    """
+
+    __slots__ = ('name', 'type', 'values', 'nulls')
+
+    def __init__(self, name, value_type=None):
+        self.name = name
+        self.type = None
+        self.values = []
+        self.nulls = None
+        if value_type is not None:
+            self._retype(value_type)
+
+    def append(self, value):
+        """
+        Append a value to the column
+
+        :param object value: Value
+        """
+        if value is None:
+            if self.nulls is None:
+                self.nulls = array.array('b', bytes(len(self.values)))
+            self.nulls.append(1)
+            self.values.append(0 if self.type in _typecodes else None)
+            return
+        if self.type is not value.__class__ and self.type is not object:
+            self._coerce(value.__class__)
+        if self.type is str:
+            value = sys.intern(value)
+        try:
+            self.values.append(float(value) if self.type is float else value)
+        except OverflowError:  # integers out of the range of the column type
+            self._retype(object)
+            self.values.append(value)
+        if self.nulls is not None:
+            self.nulls.append(0)
+
+    def _coerce(self, value_type):
+        if self.type is None:
+            self._retype(value_type if value_type in _typecodes or value_type is str else object)
+        elif not (self.type is float and value_type is int):
+            self._retype(float if {self.type, value_type} == {int, float} else object)
+
+    def _retype(self, value_type):
+        values = self.values
+        if self.nulls is not None:
+            values = [None if null else value for value, null in zip(values, self.nulls)]
+        self.type = value_type
+        if value_type in _typecodes:
+            self.values = array.array(_typecodes[value_type], (0 if value is None else value for value in values))
+        else:
+            self.values = list(values)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        if self.nulls is not None and self.nulls[index]:
+            return None
+        return self.values[index]
+
+    def __iter__(self):
+        if self.nulls is None:
+            return iter(self.values)
+        return (None if null else value for value, null in zip(self.values, self.nulls))
+
+    def to_numpy(self):
+        """
+        Convert the column to a NumPy array, sharing the memory of numeric and boolean columns.
+        Columns with ``None`` values are converted to masked arrays
+
+        :return: NumPy array
+        """
+        if numpy is None:
+            raise ImportError('Could not find numpy. Install it using: pip install numpy')
+        if self.type in _typecodes:
+            values = numpy.frombuffer(self.values, dtype=numpy.bool_ if self.type is bool else self.values.typecode)
+        else:
+            values = numpy.array(self.values, dtype=object)
+        if self.nulls is not None:
+            return numpy.ma.masked_array(values, mask=numpy.frombuffer(self.nulls, dtype=numpy.bool_))
+        return values
+
+    def to_arrow(self):
+        """
+        Convert the column to an Arrow array, sharing the memory of numeric columns without ``None`` values
+
+        :return: Arrow array
+        """
+        if pyarrow is None:
+            raise ImportError('Could not find pyarrow. Install it using: pip install pyarrow')
+        if self.type in (int, float) and self.nulls is None:
+            arrow_type = pyarrow.int64() if self.type is int else pyarrow.float64()
+            return pyarrow.Array.from_buffers(arrow_type, len(self.values), [None, pyarrow.py_buffer(self.values)])
+        return pyarrow.array(list(self))
+
+
+class Columns:
+    """
+    Columns of the attributes of objects
+
+    :param list[str] fields: Attribute names, or dot separated paths of nested attributes, e.g. ``'licenseSettings.license'``
+    :param dict,optional types: Column types by field name, each of ``int``, ``float``, ``bool`` or ``str``,
+     inferred from the first value that is not ``None`` otherwise
+    """
+
+    def __init__(self, fields, types=None):
+        types = types or {}
+        self.fields = list(fields)
+        self.rows = 0
+        self._paths = [field.split('.') for field in self.fields]
+        self._columns = [Column(field, types.get(field)) for field in self.fields]
+
+    def append(self, obj):
+        """
+        Append the attributes of an object. Missing attributes are appended as ``None``
+
+        :param object obj: Object
+        """
+        for path, column in zip(self._paths, self._columns):
+            value = obj
+            for name in path:
+                value = getattr(value, name, None)
+                if value is None:
+                    break
+            column.append(value)
+        self.rows = self.rows + 1
+
+    def __getitem__(self, field):
+        return self._columns[self.fields.index(field)]
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self):
+        return self.rows
+
+    def to_numpy(self):
+        """
+        Convert the columns to NumPy arrays
+
+        :return: A dictionary of NumPy arrays by field name
+        """
+        return {column.name: column.to_numpy() for column in self._columns}
+
+    def to_arrow(self):
+        """
+        Convert the columns to an Arrow table
+
+        :return: Arrow table
+        """
+        if pyarrow is None:
+            raise ImportError('Could not find pyarrow. Install it using: pip install pyarrow')
+        return pyarrow.table({column.name: column.to_arrow() for column in self._columns})
@@ -1,6 +1,7 @@
 import logging
 import mimetypes
 import os
+import threading
 from pathlib import Path
 
 from .. import config
@@ -10,11 +11,13 @@ from ..exception import RenameException, LocalDirectoryNotFound, LocalFileNotFou
 class FileSystem:
 
     __instance = None
+    __lock = threading.Lock()
 
     @staticmethod
     def instance():
-        if FileSystem.__instance is None:
-            FileSystem()
+        with FileSystem.__lock:
+            if FileSystem.__instance is None:
+                FileSystem()
         return FileSystem.__instance
 
     def __init__(self):
@@ -1,22 +1,292 @@
+import sys
+import copy
+import queue
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from .columns import Columns
+from .. import config
+
+
+def _read(function, param):
+    hasMore, objects = function(param)
+    if callable(hasMore):  # read the page, to evaluate hasMore
+        objects = list(objects)
+        hasMore = hasMore()
+    return hasMore, objects
+
+
+class _Prefetcher:
+    """
+    Fetch pages on a background thread, ahead of the consumer.
+
+    The thread waits while ``pages`` pages are pending, and exits once the last page was fetched,
+    a page could not be fetched, or the prefetcher was closed. An error is raised again on every subsequent call
+    """
+
+    def __init__(self, function, param, pages):
+        self._function = function
+        self._param = param
+        self._pages = queue.Queue(maxsize=pages)
+        self._closed = threading.Event()
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name='Prefetch', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        hasMore = True
+        while hasMore and not self._closed.is_set():
+            try:
+                hasMore, objects = _read(self._function, self._param)
+                if hasMore or objects:
+                    self._param.increment()
+                page = (hasMore, objects)
+            except Exception as error:  # pylint: disable=broad-except
+                hasMore, page = False, error
+            self._put(page)
+        logging.getLogger().debug('Stopped prefetching. %s', {'closed': self._closed.is_set()})
+
+    def _put(self, page):
+        while not self._closed.is_set():
+            try:
+                self._pages.put(page, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def get(self):
+        """
+        Get the next page, waiting for it to be fetched
+
+        :return: A tuple of ``(hasMore, objects)``
+        """
+        if self._error is not None:
+            raise self._error
+        while not self._closed.is_set():
+            try:
+                page = self._pages.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if isinstance(page, Exception):
+                self._error = page
+                raise page
+            return page
+        return (False, [])
+
+    def close(self):
+        """
+        Stop fetching pages. A request in progress completes in the background, and its page is discarded.
+        Once closed, no more pages are returned
+        """
+        self._closed.set()
+
+
+class _Fanout:
+    """
+    Fetch pages concurrently, using speculative windows of ``workers`` pages.
+
+    Pages past the first page that has no more objects are discarded. Pages are returned in order if ``ordered``,
+    otherwise as they are fetched. An error is raised again on every subsequent call
+    """
+
+    def __init__(self, function, param, workers, ordered):
+        self._function = function
+        self._cursor = copy.deepcopy(param)
+        self._ordered = ordered
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._pending = {}
+        self._next = 0
+        self._end = None
+        self._last = []
+        self._error = None
+        for _ in range(workers):
+            self._submit()
+
+    def _submit(self):
+        self._pending[self._next] = self._executor.submit(_read, self._function, copy.deepcopy(self._cursor))
+        self._cursor.increment()
+        self._next = self._next + 1
+
+    def get(self):
+        """
+        Get the next page, waiting for it to be fetched
+
+        :return: A tuple of ``(hasMore, objects)``
+        """
+        if self._error is not None:
+            raise self._error
+        while self._pending:
+            if self._ordered:
+                index = min(self._pending)
+            else:
+                done, _ = wait(self._pending.values(), return_when=FIRST_COMPLETED)
+                index = min(index for index, future in self._pending.items() if future in done)
+            try:
+                hasMore, objects = self._pending.pop(index).result()
+            except Exception as error:
+                self._error = error
+                raise
+            if hasMore:
+                if self._end is None:
+                    self._submit()
+                return (True, objects)
+            if self._end is None or index < self._end:  # returned once the preceding pages were returned
+                self._end, self._last = index, objects
+                for discarded in [discarded for discarded in self._pending if discarded > index]:
+                    self._pending.pop(discarded).cancel()
+        return (False, self._last)
+
+    def close(self):
+        """
+        Stop fetching pages. Requests in progress complete in the background, and their pages are discarded.
+        Once closed, no more pages are returned
+        """
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self._last = []
+        if sys.version_info >= (3, 9):
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            self._executor.shutdown(wait=False)
 
 
 class Iterator:
-    """ Objects Iterator """
+    """
+    Objects Iterator
+
+    The function returns a tuple of ``(hasMore, objects)`` per page. The objects may be any iterable,
+    such as a stream of objects that are parsed as they are received, in which case ``hasMore``
+    may be a callable that is evaluated once the objects of the page were consumed.
+    """
 
     def __init__(self, function, param):
         self._function = function
         self._param = param
         self._hasMore = True
-        self._objects = []
+        self._objects = iter([])
+        self._pages = config.http['prefetch']
+        self._workers = config.http['query_workers']
+        self._ordered = config.http['query_ordered']
+        self._fetcher = None
 
-    def __iter__(self):
+    def prefetch(self, pages):
+        """
+        Fetch pages on a background thread while the current page is consumed.
+        Must be set before iteration starts. Streamed pages are read in full by the background thread
+
+        :param int pages: Maximum number of pages to fetch ahead of the consumer, or ``0`` to fetch pages on demand
+        :return: The iterator
+        """
+        self._pages = pages
         return self
 
+    def parallel(self, workers, ordered=True):
+        """
+        Fetch pages concurrently, keeping up to ``workers`` requests in progress until a page has no more objects.
+        Up to ``workers - 1`` requests past the last page may be sent, and their pages are discarded.
+        Must be set before iteration starts. Takes precedence over :func:`prefetch`.
+        Streamed pages are read in full by the worker threads
+
+        :param int workers: Number of concurrent requests, or ``0`` to fetch pages one at a time
+        :param bool,optional ordered: Return objects in order, otherwise return pages as they are fetched, defaults to ``True``
+        :return: The iterator
+        """
+        self._workers = workers
+        self._ordered = ordered
+        return self
+
+    def __iter__(self):
+        """ Iterate over the objects, and stop fetching pages in the background once iteration ends or is abandoned """
+        try:
+            while True:
+                try:
+                    obj = next(self)
+                except StopIteration:
+                    return
+                yield obj
+        finally:
+            self.close()
+
     def __next__(self):
+        while True:
+            for obj in self._objects:
+                return obj
+            if not (self._hasMore() if callable(self._hasMore) else self._hasMore):
+                self._terminate()
+            self._hasMore, objects = self._page()
+            if not (self._hasMore or callable(self._hasMore) or objects):
+                self._terminate()
+            self._objects = iter(objects)
+            if self._fetcher is None:
+                self._param.increment()
+
+    def _page(self):
+        if self._fetcher is None and self._workers:
+            self._fetcher = _Fanout(self._function, self._param, self._workers, self._ordered)
+        elif self._fetcher is None and self._pages:
+            self._fetcher = _Prefetcher(self._function, self._param, self._pages)
+        if self._fetcher is None:
+            return self._function(self._param)
+        try:
+            return self._fetcher.get()
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        """
+        Stop fetching pages in the background
+        """
+        if self._fetcher is not None:
+            self._fetcher.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def to_columns(self, fields, types=None):
+        """
+        Consume the iterator into columns. Objects are released once their attributes were appended
+
+        :param list[str] fields: Attribute names, or dot separated paths of nested attributes, e.g. ``'licenseSettings.license'``
+        :param dict,optional types: Column types by field name, each of ``int``, ``float``, ``bool`` or ``str``,
+         inferred from the first value that is not ``None`` otherwise
+        :return cterasdk.lib.columns.Columns: Columns
+        """
+        columns = Columns(fields, types)
+        for obj in self:
+            columns.append(obj)
+        return columns
+
+    @staticmethod
+    def _terminate():
+        logging.getLogger().debug('No more objects to return. Stopping iteration.')
+        raise StopIteration
+
+
+class AsyncIterator:
+    """ Asynchronous Objects Iterator """
+
+    def __init__(self, function, param):
+        self._function = function
+        self._param = param
+        self._hasMore = True
+        self._objects = []
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
         if not self._objects:
             if self._hasMore:
-                self._hasMore, self._objects = self._function(self._param)
+                self._hasMore, self._objects = await self._function(self._param)
                 if not self._hasMore and not self._objects:
                     self._terminate()
                 self._param.increment()
@@ -24,7 +294,21 @@ class Iterator:
                 self._terminate()
         return self._objects.pop(0)
 
+    async def to_columns(self, fields, types=None):
+        """
+        Consume the iterator into columns
+
+        :param list[str] fields: Attribute names, or dot separated paths of nested attributes, e.g. ``'licenseSettings.license'``
+        :param dict,optional types: Column types by field name, each of ``int``, ``float``, ``bool`` or ``str``,
+         inferred from the first value that is not ``None`` otherwise
+        :return cterasdk.lib.columns.Columns: Columns
+        """
+        columns = Columns(fields, types)
+        async for obj in self:
+            columns.append(obj)
+        return columns
+
     @staticmethod
     def _terminate():
         logging.getLogger().debug('No more objects to return. Stopping iteration.')
-        raise StopIteration
+        raise StopAsyncIteration
@@ -1,14 +1,17 @@
 import platform
+import threading
 
 
 class Platform:
 
     __instance = None
+    __lock = threading.Lock()
 
     @staticmethod
     def instance():
-        if Platform.__instance is None:
-            Platform()
+        with Platform.__lock:
+            if Platform.__instance is None:
+                Platform()
         return Platform.__instance
 
     def __init__(self):
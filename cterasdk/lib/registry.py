@@ -1,11 +1,16 @@
+import threading
+
+
 class Registry:
 
     __instance = None
+    __lock = threading.Lock()
 
     @staticmethod
     def instance():
-        if Registry.__instance is None:
-            Registry()
+        with Registry.__lock:
+            if Registry.__instance is None:
+                Registry()
         return Registry.__instance
 
     def __init__(self):
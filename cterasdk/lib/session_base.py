@@ -30,6 +30,18 @@ class SessionBase(Object):
     def _do_start_local_session(self, ctera_host):
         raise NotImplementedError("Implementing class must implement the _do_start_local_session method")
 
+    def resume_local_session(self, user):
+        self.user = user
+        self.status = SessionStatus.Active
+
+    async def async_start_local_session(self, ctera_host):
+        self.status = SessionStatus.Initializing
+        await self._do_async_start_local_session(ctera_host)
+        self.status = SessionStatus.Active
+
+    async def _do_async_start_local_session(self, ctera_host):
+        raise NotImplementedError("Implementing class must implement the _do_async_start_local_session method")
+
     def terminate(self):
         self._do_terminate()
         self.status = SessionStatus.Inactive
@@ -2,7 +2,7 @@ import time
 import logging
 from abc import ABC, abstractmethod
 from ..exception import CTERAException
-from ..convert import tojsonstr
+from ..convert import LazyJSON
 
 
 class TaskRunningStatus:
@@ -38,7 +38,7 @@ class TaskBase(ABC):
         while self.running:
             logging.getLogger().debug('Obtaining task status. %s', {'path': self.path, 'attempt': (self.attempt + 1)})
             task = self.CTERAHost.get(self.path)
-            logging.getLogger().debug('Task status. %s', tojsonstr(task, False))
+            logging.getLogger().debug('Task status. %s', LazyJSON(task, False))
             self.increment()
             self.running = task.status == TaskRunningStatus.Running
         return TaskBase.resolve(task)
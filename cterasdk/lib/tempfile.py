@@ -2,6 +2,7 @@ import atexit
 import logging
 import shutil
 import tempfile
+import threading
 
 from .registry import Registry
 
@@ -9,16 +10,18 @@ from .registry import Registry
 class TempfileServices:
 
     __tempdir_prefix = 'chopin_core-'
+    __lock = threading.Lock()
 
     @staticmethod
     def mkdir():
         registry = Registry.instance()
-        tempdir = registry.get('tempdir')
-        if tempdir is None:
-            logging.getLogger().debug('Creating temporary directory.')
-            tempdir = tempfile.mkdtemp(prefix=TempfileServices.__tempdir_prefix)
-            logging.getLogger().debug('Temporary directory created. %s', {'path': tempdir})
-            registry.register('tempdir', tempdir)
+        with TempfileServices.__lock:
+            tempdir = registry.get('tempdir')
+            if tempdir is None:
+                logging.getLogger().debug('Creating temporary directory.')
+                tempdir = tempfile.mkdtemp(prefix=TempfileServices.__tempdir_prefix)
+                logging.getLogger().debug('Temporary directory created. %s', {'path': tempdir})
+                registry.register('tempdir', tempdir)
         return tempdir
 
     @staticmethod
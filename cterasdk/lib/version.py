@@ -1,14 +1,18 @@
+import threading
+
 from .platform import Platform
 
 
 class Version:
 
     __instance = None
+    __lock = threading.Lock()
 
     @staticmethod
     def instance():
-        if Version.__instance is None:
-            Version()
+        with Version.__lock:
+            if Version.__instance is None:
+                Version()
         return Version.__instance
 
     def __init__(self):
@@ -0,0 +1,74 @@
+import asyncio
+import logging
+
+from ..client import NetworkHost, AsyncCTERAHost
+from ..edge import connection
+from ..edge import remote
+from ..edge import session
+from ..edge import uri
+from ..exception import CTERAException
+
+
+class AsyncGateway(AsyncCTERAHost):
+    """
+    Main class for asynchronous operations on a Gateway
+    """
+
+    def __init__(self, host, port=None, https=False, Portal=None):
+        """
+        :param str host: The fully qualified domain name, hostname or an IPv4 address of the Gateway
+        :param int,optional port: Set a custom port number (0 - 65535), If not set defaults to 80 for http and 443 for https
+        :param bool,optional https: Set to True to require HTTPS, defaults to False
+        :param cterasdk.object.AsyncPortal.AsyncPortal,optional Portal:
+         The portal throught which the remote session was created, defaults to None
+        """
+        super().__init__(host, port, https)
+        self._remote_access = False
+        self._session = session.Session(self.host())
+        self._Portal = Portal
+        if Portal is not None:
+            self._ctera_client = Portal._ctera_client
+            self._session.start_remote_session(self._Portal.session())
+
+    @property
+    def base_api_url(self):
+        return uri.api(self)
+
+    @property
+    def base_file_url(self):
+        return uri.files(self)
+
+    @property
+    def _session_id_key(self):
+        return '_cteraSessionId_'
+
+    async def _login(self, username, password):
+        host = self.host()
+        try:
+            await self.form_data('/login', {'username': username, 'password': password})
+            logging.getLogger().info("User logged in. %s", {'host': host, 'user': username})
+        except CTERAException as error:
+            logging.getLogger().error("Login failed. %s", {'host': host, 'user': username})
+            raise error
+
+    async def _logout(self):
+        await self.form_data('/logout', {'foo': 'bar'})
+        logging.getLogger().info("User logged out. %s", {'host': self.host()})
+
+    def _is_authenticated(self, function, *args, **kwargs):
+        def is_nosession(path):
+            return path.startswith('/nosession')
+        current_session = self.session()
+        return current_session.authenticated() or current_session.initializing() or is_nosession(args[0])
+
+    async def test(self):
+        """ Verification check to ensure the target host is a Gateway. """
+        await asyncio.get_running_loop().run_in_executor(None, connection.test_network, self)
+        return await self.get('/nosession/logininfo')
+
+    async def remote_access(self):
+        """ Enable remote access to the Gateway using a single sign-on ticket obtained from the Portal """
+        await remote.async_remote_access(self, self._Portal)
+
+    def _baseurl(self):
+        return NetworkHost.baseurl(self)
@@ -0,0 +1,134 @@
+import asyncio
+import logging
+
+from ..client import AsyncCTERAHost, authenticated
+from ..core import connection
+from ..core import query
+from ..core import session
+from ..core import uri
+
+
+class AsyncPortal(AsyncCTERAHost):
+    """
+    Parent class for asynchronous communication with the Portal through either AsyncGlobalAdmin or AsyncServicesPortal
+    """
+
+    def __init__(self, host, port, https):
+        """
+        :param str host: The fully qualified domain name, hostname or an IPv4 address of the Portal
+        :param int port: Set a custom port number (0 - 65535)
+        :param bool https: Set to True to require HTTPS
+        """
+        super().__init__(host, port, https)
+        self._session = session.Session(self.host(), self.context)
+
+    @property
+    def base_api_url(self):
+        return uri.api(self)
+
+    @property
+    def base_portal_url(self):
+        return self.baseurl() + '/' + self.context
+
+    @property
+    def base_file_url(self):
+        return self.baseurl()
+
+    @property
+    def _session_id_key(self):
+        return 'JSESSIONID'
+
+    @property
+    def context(self):
+        raise NotImplementedError("Implementing class must implement the context property")
+
+    async def _login(self, username, password):
+        await self.form_data('/login', {'j_username': username, 'j_password': password})
+        logging.getLogger().info("User logged in. %s", {'host': self.host(), 'user': username})
+
+    async def _logout(self):
+        await self.form_data('/logout', {})
+        logging.getLogger().info("User logged out. %s", {'host': self.host()})
+
+    def _is_authenticated(self, function, *args, **kwargs):
+        def is_public(path):
+            return path.startswith('/%s/public' % self.context)
+
+        def is_setup(path):
+            return path.startswith('/%s/setup' % self.context)
+
+        def is_startup(path):
+            return path.startswith('/%s/startup' % self.context)
+        current_session = self.session()
+        return current_session.authenticated() or current_session.initializing() or \
+            is_public(args[0]) or is_setup(args[0]) or is_startup(args[0]) or \
+            current_session.is_local_auth()
+
+    async def test(self):
+        """ Verification check to ensure the target host is a Portal. """
+        await asyncio.get_running_loop().run_in_executor(None, connection.test, self)
+        return await self.public_info()
+
+    async def public_info(self):
+        """ Obtain the Portal's public info. """
+        return await self.get('/' + self.context + '/public/publicInfo', params={}, use_file_url=True)
+
+    async def put(self, path, value, use_file_url=False):
+        if path != '/currentPortal':
+            return await super().put(path, value, use_file_url=use_file_url)
+        logging.getLogger().debug('Updating current tenant. %s', {'tenant': value})
+        response = None
+        if not self.session().is_local_auth():
+            response = await super().put(path, value, use_file_url=use_file_url)
+        self.session().update_tenant(value)
+        logging.getLogger().debug('Updated current tenant. %s', {'tenant': value})
+        return response
+
+    @authenticated
+    async def query(self, path, param):
+        return await query.async_query(self, path, param)
+
+    def iterator(self, path, param):
+        """
+        Iterate over the objects returned by a query
+
+        :return: Asynchronous iterator for all matching objects
+        :rtype: cterasdk.lib.iterator.AsyncIterator
+        """
+        return query.async_iterator(self, path, param)
+
+
+class AsyncGlobalAdmin(AsyncPortal):
+    """
+    Main class for asynchronous Global Admin operations on a Portal
+    """
+
+    def __init__(self, host, port=None, https=True):
+        """
+        :param str host: The fully qualified domain name, hostname or an IPv4 address of the Portal
+        :param int,optional port: Set a custom port number (0 - 65535), If not set defaults to 80 for http and 443 for https
+        :param bool,optional https: Set to True to require HTTPS, defaults to True
+        """
+        super().__init__(host, port, https)
+
+    @property
+    def context(self):
+        return 'admin'
+
+
+class AsyncServicesPortal(AsyncPortal):
+    """
+    Main class for asynchronous Service operations on a Portal
+    """
+
+    def __init__(self, host, port=None, https=True):
+        """
+        :param str host: The fully qualified domain name, hostname or an IPv4 address of the Portal
+        :param int,optional port: Set a custom port number (0 - 65535), If not set defaults to 80 for http and 443 for https
+        :param bool,optional https: Set to True to require HTTPS, defaults to True
+        """
+        super().__init__(host, port, https)
+
+    @property
+    def context(self):
+        return 'ServicesPortal'
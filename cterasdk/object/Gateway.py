@@ -92,8 +92,8 @@ class Gateway(CTERAHost):  # pylint: disable=too-many-instance-attributes
         super().__init__(host, port, https)
         self._remote_access = False
         self._session = session.Session(self.host())
+        self._Portal = Portal
         if Portal is not None:
-            self._Portal = Portal
             self._ctera_client = Portal._ctera_client
             self._session.start_remote_session(self._Portal.session())
         self.config = config.Config(self)
@@ -5,6 +5,8 @@ from xml.dom import minidom
 from xml.sax.saxutils import escape
 from xml.parsers.expat import ExpatError
 
+from ..client.compression import body_text
+
 
 class Transcribe():
     COMMENT = '<!--TEMPLATE-->'
@@ -45,7 +47,7 @@ class Transcribe():
         # Request body:
         if request.body:
             request_content_array.append("<br/><p class=\"h6\">Request body:</p>")
-            request_content_array.append('<pre>' + cls._prettify(request.body.decode('utf-8')) + '</pre>')
+            request_content_array.append('<pre>' + cls._prettify(body_text(request.headers, request.body)) + '</pre>')
 
         return ''.join(request_content_array)
 
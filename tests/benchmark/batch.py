@@ -0,0 +1,89 @@
+"""
+Round trips and elapsed time of a status-collection script, with and without request batching.
+
+Usage: python -m tests.benchmark.batch [--gateways N] [--latency SECONDS]
+"""
+import argparse
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from cterasdk import Gateway
+
+
+STATUS = ['/status/services', '/status/sync', '/status/device', '/status/network', '/config/network', '/config/device']
+
+
+class LatencyHandler(BaseHTTPRequestHandler):
+    """ Respond to every request after a simulated network round trip """
+
+    protocol_version = 'HTTP/1.1'
+    latency = 0
+    round_trips = 0
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self._respond('<val>%s</val>' % self.path.rsplit('/', 1)[-1])
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        body = self.rfile.read(int(self.headers['Content-Length'])).decode('utf-8')
+        names = re.findall(r'<val>/([^<]+)</val>', body)
+        self._respond('<obj>%s</obj>' % ''.join('<att id="%s"><val>%s</val></att>' % (name, name) for name in names))
+
+    def _respond(self, text):
+        LatencyHandler.round_trips = LatencyHandler.round_trips + 1
+        time.sleep(LatencyHandler.latency)
+        body = text.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+def collect(gateway):
+    return [gateway.get(path) for path in STATUS]
+
+
+def collect_batch(gateway):
+    with gateway.batch() as batch:
+        results = [batch.get(path) for path in STATUS]
+    return [result.value for result in results]
+
+
+def run(function, gateways, port):
+    edge = Gateway('127.0.0.1', https=False, port=port)
+    edge.session().start_local_session(edge)
+    LatencyHandler.round_trips = 0
+    start = time.monotonic()
+    for _ in range(gateways):
+        function(edge)
+    return LatencyHandler.round_trips, time.monotonic() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--gateways', type=int, default=50, help='number of gateways to collect from')
+    parser.add_argument('--latency', type=float, default=0.02, help='simulated round-trip time (seconds)')
+    args = parser.parse_args()
+
+    LatencyHandler.latency = args.latency
+    server = ThreadingHTTPServer(('127.0.0.1', 0), LatencyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        baseline = run(collect, args.gateways, server.server_port)
+        batched = run(collect_batch, args.gateways, server.server_port)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print('%-10s %12s %12s' % ('mode', 'round trips', 'elapsed (s)'))
+    for mode, (round_trips, elapsed) in [('get', baseline), ('batch', batched)]:
+        print('%-10s %12d %12.3f' % (mode, round_trips, elapsed))
+    print('round-trip reduction: %.1fx' % (baseline[0] / batched[0]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,271 @@
+"""
+Throughput, peak memory and retained allocations of the codec on generated payloads:
+a user query page, a device query page, a queryLogs result, a deep selectedFolders tree and a gateway configuration.
+
+Operations are fromxmlstr, with each installed XML backend, into compact records, lazily and with registered types,
+XMLStream, toxmlstr, fromjsonstr, JSONStream, and tojsonstr, compact and as logged.
+
+Results may be written to a JSON file, and compared with the results of a previous run,
+e.g. of a previous commit, to measure a change.
+
+Usage: python -m tests.benchmark.codec [--scale N] [--repeat N] [--payload NAME] [--output FILE] [--compare FILE]
+"""
+import argparse
+import contextlib
+import datetime
+import gc
+import io
+import json
+import platform
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from unittest import mock
+
+from cterasdk import config
+from cterasdk.common import Object
+from cterasdk.convert import fromxmlstr, toxmlstr, fromjsonstr, tojsonstr, XMLStream, JSONStream, schemas
+from cterasdk.convert import backend
+
+
+def _object(classname=None, **attributes):
+    o = Object()
+    if classname is not None:
+        o._classname = classname  # pylint: disable=protected-access
+    o.__dict__.update(attributes)
+    return o
+
+
+def users(count):
+    """ A query page of users, with scalar, empty and nested attributes """
+    return _object('QueryResults', hasMore=False, objects=[
+        _object('PortalUser', _uuid=str(index), name='user%s' % index, email='user%s@ctera.com' % index, uid=index, enabled=True,
+                quota=10.5, password=None, groups=['Everyone', 'Admins'],
+                settings=_object('UserSettings', language='en', timezone=None))
+        for index in range(count)])
+
+
+def devices(count):
+    """ A query page of devices """
+    return _object('QueryResults', hasMore=False, objects=[
+        _object('Device', name='vGateway-%s' % index, portal='team%s' % (index % 100), deviceType='vGateway', uid=index,
+                runningFirmware='7.6.%s.0' % (index % 1000), ipAddress='10.%s.%s.1' % (index // 256 % 256, index % 256),
+                connected=index % 10 != 0, lastConnected='2024-01-01T10:00:%02d' % (index % 60), owner=None,
+                licenseSettings=_object('DeviceLicenseSettings', license='EV16', vGatewayType='Small'),
+                remoteAccessUrl='https://portal.ctera.com/devices/vGateway-%s' % index)
+        for index in range(count)])
+
+
+def logs(count):
+    """ A queryLogs result """
+    return _object('LogsQueryResults', hasMore=True, logs=[
+        _object('Log', id=index, topic='system', origin='vGateway-%s' % (index % 100), originType='Device',
+                username='admin', msg='User logged in. IP address 10.0.%s.%s' % (index // 256 % 256, index % 256),
+                time='2024-01-01T10:%02d:%02d' % (index // 60 % 60, index % 60), level='info', more=None)
+        for index in range(count)])
+
+
+def selected_folders(depth, entries):
+    """ A cloud drive selectedFolders tree, ``depth`` directories deep with ``entries`` directories and files per directory """
+    def directory(name, level):
+        children = None
+        if level < depth:
+            children = [directory('%s-0' % name, level + 1)]
+            children.extend(_object('DirEntry', displayName=None, name='%s-%s' % (name, index), isIncluded=index % 2 == 0, children=None)
+                            for index in range(1, entries // 2))
+            children.extend(_object('FileEntry', displayName=None, name='%s-%s.txt' % (name, index), isIncluded=False)
+                            for index in range(entries // 2))
+        return _object('DirEntry', displayName=None, name=name, isIncluded=True, children=children)
+    return directory('Users', 0)
+
+
+def gateway_config(shares, local_users):
+    """ A gateway /config, with shares holding access control lists, and local users """
+    return _object(
+        'EdgeConfiguration',
+        device=_object('DeviceSettings', hostname='vGateway', location='Tel Aviv', timezone='(GMT+02:00) Jerusalem'),
+        network=_object('NetworkConfig', ports=[
+            _object('NetworkPort', ethernet=_object('EthernetSettings', mac='00:0c:29:%02x:00:01' % port),
+                    ip=_object('IPSettings', address='10.0.0.%s' % port, DHCPMode='disabled', netmask='255.255.255.0',
+                               gateway='10.0.0.254'))
+            for port in range(4)]),
+        cloudsync=_object('CloudSyncConfig', encPassphrase='secret', cloudExtender=_object('CloudExtender', selectedFolders=None)),
+        shares=[_object('ShareConfig', name='share%s' % index, directory='/main/share%s' % index, access='winAclMode',
+                        comment=None, exportToAFP=False, exportToFTP=False, exportToNFS=False,
+                        acl=[_object('ShareAccessControlEntry',
+                                     permissions=_object('FileAccessPermissions', allowedFileAccess='RW'),
+                                     principal2=_object('LocalUser', name='user%s' % principal,
+                                                        ref='#config#auth#users#user%s' % principal))
+                             for principal in range(10)])
+                for index in range(shares)],
+        auth=_object('AuthConfig', users=[_object('UserConfig', username='user%s' % index, fullName='User %s' % index,
+                                                  email='user%s@ctera.com' % index, uid=1000 + index, password='secret')
+                                          for index in range(local_users)])
+    )
+
+
+SCHEMAS = {
+    'PortalUser': dict(name=str, email=str, uid=int, enabled=bool, quota=float),
+    'Device': dict(name=str, portal=str, deviceType=str, uid=int, runningFirmware=str, ipAddress=str, connected=bool,
+                   lastConnected=str, remoteAccessUrl=str),
+    'Log': dict(id=int, topic=str, origin=str, originType=str, username=str, msg=str, time=str, level=str)
+}
+
+
+def payloads(scale):
+    """ The benchmark payloads, as objects, with the name of their list attribute """
+    return [
+        ('users', users(int(20000 * scale)), 'objects'),
+        ('devices', devices(int(10000 * scale)), 'objects'),
+        ('logs', logs(int(100000 * scale)), 'logs'),
+        ('selected_folders', selected_folders(100, int(100 * scale)), None),
+        ('config', gateway_config(int(500 * scale), int(2000 * scale)), None)
+    ]
+
+
+@contextlib.contextmanager
+def codec(**options):
+    """ Measure an operation with codec options """
+    with mock.patch.dict(config.codec, **options):
+        yield
+
+
+@contextlib.contextmanager
+def typed():
+    """ Measure an operation with the attribute types of the payload classes registered """
+    for classname, types in SCHEMAS.items():
+        schemas.register(classname, types)
+    try:
+        yield
+    finally:
+        for classname in SCHEMAS:
+            schemas.unregister(classname)
+
+
+def xmlstream(xml):
+    return XMLStream(io.BytesIO(xml)).value
+
+
+def jsonstream(jsonstr):
+    return list(JSONStream(io.StringIO(jsonstr)))
+
+
+def operations(obj, members):
+    """
+    The operations to measure, with their input, the size of their text in bytes, the codec options to measure them with,
+    and whether their output must match the output of the default options
+    """
+    xml = toxmlstr(obj)
+    jsonstr = tojsonstr(obj, pretty_print=False, no_log=False)
+    xml_size, json_size = len(xml), len(jsonstr.encode('utf-8'))
+    result = [('fromxmlstr', fromxmlstr, xml, xml_size, codec(), False)]
+    result.extend(('fromxmlstr:%s' % name, fromxmlstr, xml, xml_size, codec(backend=name), True)
+                  for name in backend.available() if name != backend.Backend.Python)
+    result.extend([
+        ('fromxmlstr:records', fromxmlstr, xml, xml_size, codec(records=True), True),
+        ('fromxmlstr:lazy', fromxmlstr, xml, xml_size, codec(lazy=True), True),
+        ('fromxmlstr:typed', fromxmlstr, xml, xml_size, typed(), False),
+        ('xmlstream', xmlstream, xml, xml_size, codec(), True),
+        ('toxmlstr', toxmlstr, obj, xml_size, codec(), False),
+        ('fromjsonstr', fromjsonstr, jsonstr, json_size, codec(), False)
+    ])
+    if members is not None:
+        array = tojsonstr(getattr(obj, members), pretty_print=False, no_log=False)
+        result.append(('jsonstream', jsonstream, array, len(array.encode('utf-8')), codec(), False))
+    result.extend([
+        ('tojsonstr', lambda o: tojsonstr(o, pretty_print=False), obj, json_size, codec(), False),
+        ('tojsonstr:log', lambda o: tojsonstr(o, pretty_print=True, no_log=True), obj, json_size, codec(), False)
+    ])
+    return result
+
+
+def canonical(value):
+    return tojsonstr(value, pretty_print=False, no_log=False)
+
+
+def memory(function, argument):
+    """ Peak memory allocated during a call, and memory blocks retained by its result """
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    result = function(argument)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    gc.collect()
+    retained_blocks = sys.getallocatedblocks() - blocks
+    del result
+    return peak, current, retained_blocks
+
+
+def verify(operation, output, expected):
+    """ The output of the default options, which the output of other options must match """
+    output = canonical(output)
+    if operation == 'fromxmlstr':
+        return output
+    if output != expected:
+        raise AssertionError('%s returned different objects' % operation)
+    return expected
+
+
+def measure(payload, obj, members, repeat):
+    results, expected = [], None
+    for operation, function, argument, size, options, same in operations(obj, members):
+        with options:
+            if operation == 'fromxmlstr' or same:
+                expected = verify(operation, function(argument), expected)
+            seconds = min(timeit.repeat(lambda: function(argument), number=1, repeat=repeat))  # pylint: disable=cell-var-from-loop
+            result = dict(payload=payload, operation=operation, bytes=size, seconds=seconds, mb_per_s=size / seconds / 1024 / 1024)
+            result.update(zip(('peak_bytes', 'retained_bytes', 'retained_blocks'), memory(function, argument)))
+        results.append(result)
+    return results
+
+
+def commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.DEVNULL).decode('ascii').strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def report(results, baseline):
+    baseline = {(result['payload'], result['operation']): result for result in baseline['results']} if baseline else {}
+    columns = ('payload', 'operation', 'size (MB)', 'time (s)', 'MB/s', 'peak (MB)', 'blocks', 'vs. base')
+    print('%-17s %-20s %9s %9s %9s %11s %10s %9s' % columns)
+    for result in results:
+        previous = baseline.get((result['payload'], result['operation']))
+        print('%-17s %-20s %9.1f %9.3f %9.1f %11.1f %10d %9s' % (
+            result['payload'], result['operation'], result['bytes'] / 1024 / 1024, result['seconds'], result['mb_per_s'],
+            result['peak_bytes'] / 1024 / 1024, result['retained_blocks'],
+            '%.2fx' % (result['mb_per_s'] / previous['mb_per_s']) if previous else '-'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=float, default=1, help='payload size factor, e.g. 0.1 for a quick run')
+    parser.add_argument('--repeat', type=int, default=3, help='number of time measurements, the best is reported')
+    parser.add_argument('--payload', action='append', help='payload to measure, may be repeated, defaults to all payloads')
+    parser.add_argument('--output', help='write the results to a JSON file')
+    parser.add_argument('--compare', help='compare the throughput of each operation with the results in a JSON file')
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    results = []
+    for payload, obj, members in payloads(args.scale):
+        if not args.payload or payload in args.payload:
+            results.extend(measure(payload, obj, members, args.repeat))
+    report(results, baseline)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            metadata = dict(commit=commit(), python=platform.python_version(), platform=platform.platform(),
+                            timestamp=datetime.datetime.now().isoformat(), scale=args.scale, repeat=args.repeat)
+            json.dump(dict(metadata, results=results), f, indent=4)
+
+
+if __name__ == '__main__':
+    main()
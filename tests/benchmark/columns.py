@@ -0,0 +1,79 @@
+"""
+Peak memory and time of pivoting query results into columns, comparing collecting the objects
+and then building a list per field, with consuming the iterator into columns.
+
+Usage: python -m tests.benchmark.columns [--pages N] [--page-size N]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from cterasdk.convert import fromxmlstr, toxmlstr
+from cterasdk.core import query
+from cterasdk.lib import Iterator
+
+from .codec import users
+
+
+FIELDS = ['name', 'email', 'uid', 'enabled', 'quota', 'settings.language']
+
+
+def iterator(pages, page_size):
+    string = toxmlstr(users(page_size))
+    remaining = [pages]
+
+    def function(_param):
+        remaining[0] = remaining[0] - 1
+        response = fromxmlstr(string)
+        return (remaining[0] > 0, response.objects)
+    return Iterator(function, query.QueryParamBuilder().build())
+
+
+def rows(objects):
+    objects = list(objects)
+    table = {}
+    for field in FIELDS:
+        column = []
+        for obj in objects:
+            value = obj
+            for name in field.split('.'):
+                value = getattr(value, name, None)
+            column.append(value)
+        table[field] = column
+    return table
+
+
+def columns(objects):
+    return objects.to_columns(FIELDS)
+
+
+def measure(function, pages, page_size):
+    start = time.perf_counter()
+    function(iterator(pages, page_size))
+    elapsed = time.perf_counter() - start
+    objects = iterator(pages, page_size)
+    gc.collect()
+    tracemalloc.start()
+    result = function(objects)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, current, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=100, help='number of pages')
+    parser.add_argument('--page-size', type=int, default=1000, help='number of objects per page')
+    args = parser.parse_args()
+
+    print('%d objects, %d fields' % (args.pages * args.page_size, len(FIELDS)))
+    print('%-10s %10s %15s %12s' % ('pivot', 'time (s)', 'retained (MB)', 'peak (MB)'))
+    for name, function in [('rows', rows), ('columns', columns)]:
+        elapsed, current, peak = measure(function, args.pages, args.page_size)
+        print('%-10s %10.3f %15.1f %12.1f' % (name, elapsed, current / 1024 / 1024, peak / 1024 / 1024))
+
+
+if __name__ == '__main__':
+    main()
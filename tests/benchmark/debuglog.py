@@ -0,0 +1,45 @@
+"""
+Per-call overhead of the debug log messages of CTERAHost.put, post, db and execute when logging at INFO,
+comparing deferred formatting with formatting the parameter before every call.
+
+Usage: python -m tests.benchmark.debuglog [--shares N] [--number N]
+"""
+import argparse
+import logging
+import timeit
+
+from cterasdk.convert import tojsonstr, LazyJSON
+
+from .codec import gateway_config
+
+
+def eager(value):
+    logging.getLogger().debug('Configuration changed. %s', {'url': '/config', 'value': tojsonstr(value, pretty_print=False)})
+
+
+def deferred(value):
+    logging.getLogger().debug('Configuration changed. %s', {'url': '/config', 'value': LazyJSON(value, pretty_print=False)})
+
+
+def measure(value, number):
+    eager_time = min(timeit.repeat(lambda: eager(value), number=number, repeat=5)) / number
+    deferred_time = min(timeit.repeat(lambda: deferred(value), number=number, repeat=5)) / number
+    return eager_time, deferred_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--shares', type=int, default=100, help='number of shares in the large parameter')
+    parser.add_argument('--number', type=int, default=1000, help='number of calls per measurement')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.INFO)
+    parameters = [('share', gateway_config(1, 0).shares[0]), ('%d shares' % args.shares, gateway_config(args.shares, 0))]
+    print('%-12s %12s %15s' % ('parameter', 'eager (us)', 'deferred (us)'))
+    for name, value in parameters:
+        eager_time, deferred_time = measure(value, args.number)
+        print('%-12s %12.1f %15.2f' % (name, eager_time * 1e6, deferred_time * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""
+Time to consume a paged query with simulated network latency, and the number of requests sent,
+comparing fetching pages one at a time with fetching pages concurrently.
+
+Usage: python -m tests.benchmark.parallel [--pages N] [--latency SECONDS] [--jitter FRACTION]
+"""
+import argparse
+import random
+import threading
+import time
+
+from cterasdk.core import query
+from cterasdk.lib import Iterator
+
+
+def measure(pages, latency, jitter, workers, ordered):
+    requests = []
+    lock = threading.Lock()
+
+    def function(param):
+        with lock:
+            requests.append(param.startFrom)
+        time.sleep(latency * random.uniform(1 - jitter, 1 + jitter))
+        page = param.startFrom // param.countLimit
+        return (page < pages - 1, list(range(param.countLimit)))
+
+    start = time.perf_counter()
+    objects = sum(1 for _obj in Iterator(function, query.QueryParamBuilder().build()).parallel(workers, ordered))
+    return time.perf_counter() - start, objects, len(requests)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=200, help='number of pages')
+    parser.add_argument('--latency', type=float, default=0.02, help='time to fetch a page (seconds)')
+    parser.add_argument('--jitter', type=float, default=0.5, help='latency variation, as a fraction of the latency')
+    args = parser.parse_args()
+
+    print('%d pages, %.0fms latency per page, %.0f%% jitter' % (args.pages, args.latency * 1000, args.jitter * 100))
+    print('%-8s %-8s %9s %9s %9s' % ('workers', 'ordered', 'time (s)', 'objects', 'requests'))
+    for workers, ordered in [(0, True), (4, True), (4, False), (8, True), (8, False)]:
+        seconds, objects, requests = measure(args.pages, args.latency, args.jitter, workers, ordered)
+        print('%-8d %-8s %9.3f %9d %9d' % (workers, ordered, seconds, objects, requests))
+
+
+if __name__ == '__main__':
+    main()
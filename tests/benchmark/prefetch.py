@@ -0,0 +1,40 @@
+"""
+Time to consume a paged query with simulated network latency and consumer processing time,
+comparing fetching pages on demand with prefetching pages on a background thread.
+
+Usage: python -m tests.benchmark.prefetch [--pages N] [--latency SECONDS] [--processing SECONDS]
+"""
+import argparse
+import time
+
+from cterasdk.core import query
+from cterasdk.lib import Iterator
+
+
+def measure(pages, latency, processing, prefetch):
+    def function(param):
+        time.sleep(latency)
+        page = param.startFrom // param.countLimit
+        return (page < pages - 1, list(range(10)))
+
+    start = time.perf_counter()
+    for _obj in Iterator(function, query.QueryParamBuilder().build()).prefetch(prefetch):
+        time.sleep(processing / 10)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=20, help='number of pages')
+    parser.add_argument('--latency', type=float, default=0.05, help='time to fetch a page (seconds)')
+    parser.add_argument('--processing', type=float, default=0.05, help='time to process a page (seconds)')
+    args = parser.parse_args()
+
+    print('%d pages, %.0fms latency, %.0fms processing per page' % (args.pages, args.latency * 1000, args.processing * 1000))
+    print('%-9s %9s' % ('prefetch', 'time (s)'))
+    for prefetch in [0, 1, 4]:
+        print('%-9d %9.3f' % (prefetch, measure(args.pages, args.latency, args.processing, prefetch)))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,7 @@
 import queue
+import threading
 import unittest
+from http.server import ThreadingHTTPServer
 
 
 class BaseTest(unittest.TestCase):
@@ -15,6 +17,18 @@ class BaseTest(unittest.TestCase):
         patch_kwargs.update({'new_callable': unittest.mock.PropertyMock})
         return self.patch_call(module_path, **patch_kwargs)
 
+    def serve(self, handler):
+        """Serve a request handler class on a local port until the test ends, and return the base URL of the server."""
+        server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(BaseTest._stop_server, server)
+        return 'http://127.0.0.1:%s' % server.server_port
+
+    @staticmethod
+    def _stop_server(server):
+        server.shutdown()
+        server.server_close()
+
     def _assert_equal_objects(self, actual_param, expected_param):
         q = queue.Queue()
         q.put((actual_param, expected_param))
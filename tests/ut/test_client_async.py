@@ -0,0 +1,146 @@
+import asyncio
+import threading
+from unittest import mock
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from cterasdk import AsyncGlobalAdmin, AsyncGateway, toxmlstr, config
+from cterasdk.client.async_http import AsyncHTTPClient
+from cterasdk.common import Object
+from cterasdk.exception import CTERAClientException, CTERAException
+from tests.ut import base
+
+
+class TestAsyncClient(base.BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self._username = 'admin'
+        self._tenant = 'Administration'
+        self._requests = []
+        config.http['ssl'] = 'Trust'
+        self.addCleanup(config.http.update, {'ssl': 'Consent'})
+
+    def test_login_and_get(self):
+        async def scenario(admin):
+            await admin.login(self._username, 'password')
+            return await admin.get('/settings')
+        settings = self._run(scenario)
+        self.assertEqual(settings.name, 'settings')
+        self.assertEqual([request[:2] for request in self._requests], [
+            ('POST', '/admin/api/login'),
+            ('GET', '/admin/api/currentPortal'),
+            ('GET', '/admin/api/currentSession'),
+            ('GET', '/admin/api/settings')
+        ])
+        self.assertEqual(self._requests[-1][2], 'session-id')
+
+    def test_concurrent_db(self):
+        async def scenario(admin):
+            await admin.login(self._username, 'password')
+            return await asyncio.gather(*[admin.db('/users', 'query', index) for index in range(20)])
+        responses = self._run(scenario)
+        self.assertEqual(len(responses), 20)
+        self.assertEqual(len([request for request in self._requests if request[1] == '/admin/api/users']), 20)
+
+    def test_not_logged_in(self):
+        async def scenario(admin):
+            return await admin.get('/settings')
+        with self.assertRaises(Exception) as error:
+            self._run(scenario)
+        self.assertEqual(error.exception.message, 'Not logged in')
+
+    def test_http_error(self):
+        async def scenario(admin):
+            await admin.login(self._username, 'password')
+            return await admin.get('/missing')
+        with self.assertRaises(CTERAClientException) as error:
+            self._run(scenario)
+        self.assertEqual(error.exception.response.code, 404)
+
+    def test_ssl_consent_in_executor(self):
+        threads = []
+
+        def ask(_question):
+            threads.append(threading.current_thread())
+            return True
+
+        config.http['ssl'] = 'Consent'
+        client = AsyncHTTPClient('JSESSIONID')
+        with mock.patch('cterasdk.client.async_http.ask', side_effect=ask):
+            asyncio.run(client.on_ssl_error('https://portal.ctera.com:443/admin/api'))
+        self.assertFalse(client.verify)
+        self.assertIsNot(threads[0], threading.main_thread())
+
+    def _run(self, scenario):
+        async def run():
+            server = TestServer(self._create_application())
+            await server.start_server()
+            try:
+                async with AsyncGlobalAdmin(server.host, port=server.port, https=False) as admin:
+                    return await scenario(admin)
+            finally:
+                await server.close()
+        return asyncio.run(run())
+
+    def _create_application(self):
+        async def handler(request):
+            self._requests.append((request.method, request.path, request.cookies.get('JSESSIONID')))
+            path = request.path[len('/admin/api'):]
+            if path == '/login':
+                response = web.Response(text='')
+                response.set_cookie('JSESSIONID', 'session-id')
+                return response
+            if path == '/currentPortal':
+                return web.Response(text='')
+            if path == '/currentSession':
+                return web.Response(text=toxmlstr(TestAsyncClient._create_current_session(self._username)).decode('utf-8'))
+            if path == '/missing':
+                return web.Response(status=404, text='')
+            response = Object()
+            response.name = path[1:]
+            return web.Response(text=toxmlstr(response).decode('utf-8'))
+        application = web.Application()
+        application.router.add_route('*', '/{tail:.*}', handler)
+        return application
+
+    @staticmethod
+    def _create_current_session(username):
+        current_session = Object()
+        current_session.username = username
+        current_session.role = 'ReadWriteAdmin'
+        return current_session
+
+
+class TestAsyncGateway(base.BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self._portal = mock.MagicMock()
+        self._portal.base_portal_url = 'https://portal.ctera.com/ServicesPortal'
+        self._portal.session.return_value.tenant.return_value = 'acme'
+        self._portal.execute = mock.AsyncMock(return_value='sso ticket')
+
+    def test_remote_access(self):
+        gateway = AsyncGateway('vGateway-1', Portal=self._portal)
+        self.assertEqual(gateway.base_api_url, 'https://portal.ctera.com/ServicesPortal/devicecmdnew/acme/vGateway-1/')
+        gateway.get = mock.AsyncMock()
+        asyncio.run(gateway.remote_access())
+        self._portal.execute.assert_called_once_with('/portals/acme/devices/vGateway-1', 'singleSignOn')
+        gateway.get.assert_called_once_with('/ssologin', {'ticket': 'sso ticket'})
+        self.assertEqual(gateway.base_api_url, 'https://portal.ctera.com/ServicesPortal/devices/vGateway-1/admingui/api')
+
+    def test_remote_access_requires_portal(self):
+        gateway = AsyncGateway('vGateway-1')
+        with self.assertRaises(CTERAException) as error:
+            asyncio.run(gateway.remote_access())
+        self.assertEqual(error.exception.message, 'Remote access requires a Portal')
+
+    def test_connection_test_in_executor(self):
+        threads = []
+        gateway = AsyncGateway('vGateway-1')
+        gateway.get = mock.AsyncMock(return_value='logininfo')
+        with mock.patch('cterasdk.edge.connection.test_network', side_effect=lambda host: threads.append(threading.current_thread())):
+            self.assertEqual(asyncio.run(gateway.test()), 'logininfo')
+        self.assertIsNot(threads[0], threading.main_thread())
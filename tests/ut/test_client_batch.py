@@ -0,0 +1,64 @@
+from unittest import mock
+
+from cterasdk.common import Object
+from cterasdk.exception import CTERAException
+from tests.ut import base_edge
+
+
+class TestClientBatch(base_edge.BaseEdgeTest):
+
+    def setUp(self):
+        super().setUp()
+        self._init_filer(get_response='ok')
+        self._filer.get_multi = mock.MagicMock(return_value=self._get_multi_response())
+
+    def test_batch(self):
+        with self._filer.batch() as batch:
+            services = batch.get('/status/services')
+            sync = batch.get('/status/sync/')
+            network = batch.get('/config/network')
+            self.assertFalse(services.done)
+        self._filer.get_multi.assert_called_once_with('/status', ['/services', '/sync'], use_file_url=False)
+        self._filer.get.assert_called_once_with('/config/network', use_file_url=False)
+        self.assertEqual(services.value, 'connected')
+        self.assertEqual(sync.value, 'synced')
+        self.assertEqual(network.value, 'ok')
+
+    def test_duplicate_paths(self):
+        with self._filer.batch() as batch:
+            results = [batch.get('/status/services') for _ in range(2)] + [batch.get('/status/sync')]
+        self._filer.get_multi.assert_called_once_with('/status', ['/services', '/sync'], use_file_url=False)
+        self.assertEqual([result.value for result in results], ['connected', 'connected', 'synced'])
+
+    def test_not_flushed(self):
+        batch = self._filer.batch()
+        deferred = batch.get('/status/services')
+        with self.assertRaises(CTERAException):
+            deferred.value  # pylint: disable=pointless-statement
+        batch.flush()
+        self.assertEqual(deferred.value, 'ok')
+
+    def test_error(self):
+        error = CTERAException('Failed')
+        self._filer.get_multi.side_effect = error
+        with self._filer.batch() as batch:
+            services = batch.get('/status/services')
+            sync = batch.get('/status/sync')
+        for deferred in [services, sync]:
+            with self.assertRaises(CTERAException) as context:
+                deferred.value  # pylint: disable=pointless-statement
+            self.assertIs(context.exception, error)
+
+    def test_no_flush_on_exception(self):
+        with self.assertRaises(ValueError):
+            with self._filer.batch() as batch:
+                batch.get('/status/services')
+                raise ValueError()
+        self._filer.get.assert_not_called()
+
+    @staticmethod
+    def _get_multi_response():
+        response = Object()
+        response.services = 'connected'
+        response.sync = 'synced'
+        return response
@@ -0,0 +1,168 @@
+from unittest import mock
+
+import requests
+
+from cterasdk import config
+from cterasdk.client.breaker import CircuitBreaker, CircuitBreakerRegistry, CircuitState, circuit
+from cterasdk.client.http import HTTPClient, HTTPException
+from cterasdk.client.retry import RetryPolicy
+from cterasdk.exception import HostUnreachable, ExhaustedException, RateLimitExceeded, SSLException
+from tests.ut import base
+
+
+class TestCircuitBreaker(base.BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self._now = 1000
+        self.patch_call('cterasdk.client.breaker.time.monotonic').side_effect = lambda: self._now
+
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker(3, 60)
+        for _ in range(2):
+            breaker.on_failure()
+        self.assertEqual(breaker.state, CircuitState.Closed)
+        breaker.on_failure()
+        self.assertEqual(breaker.state, CircuitState.Open)
+        self.assertFalse(breaker.allow())
+
+    def test_success_resets_failures(self):
+        breaker = CircuitBreaker(2, 60)
+        breaker.on_failure()
+        breaker.on_success()
+        breaker.on_failure()
+        self.assertTrue(breaker.allow())
+
+    def test_half_open_single_trial(self):
+        breaker = CircuitBreaker(1, 60)
+        breaker.on_failure()
+        self._now = self._now + 60
+        self.assertEqual(breaker.state, CircuitState.HalfOpen)
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())
+        breaker.on_success()
+        self.assertEqual(breaker.state, CircuitState.Closed)
+
+    def test_half_open_failure_reopens(self):
+        breaker = CircuitBreaker(3, 60)
+        for _ in range(3):
+            breaker.on_failure()
+        self._now = self._now + 60
+        self.assertTrue(breaker.allow())
+        breaker.on_failure()
+        self.assertEqual(breaker.state, CircuitState.Open)
+
+
+class TestHTTPClientCircuitBreaker(base.BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self._url = 'https://gateway.ctera.com/status'
+        self.patch_call('cterasdk.client.http.time.sleep')
+        patcher = mock.patch.dict(config.http, circuit_breaker=True, circuit_failure_threshold=2, circuit_recovery_timeout=60)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        CircuitBreakerRegistry.instance().reset()
+        self.addCleanup(CircuitBreakerRegistry.instance().reset)
+
+    def test_fail_fast(self):
+        client = self._client()
+        client.session.request.side_effect = requests.exceptions.ConnectionError(request=requests.Request('GET', self._url))
+        for _ in range(2):
+            with self.assertRaises(HostUnreachable):
+                client.get(self._url)
+        with self.assertRaises(HostUnreachable) as error:
+            client.get(self._url)
+        self.assertEqual(error.exception.reason, 'Circuit breaker is open')
+        self.assertEqual(client.session.request.call_count, 2)
+
+    def test_shared_across_clients(self):
+        client = self._client()
+        client.session.request.side_effect = requests.exceptions.Timeout()
+        for _ in range(2):
+            with self.assertRaises(ExhaustedException):
+                client.get(self._url)
+        other = self._client()
+        with self.assertRaises(HostUnreachable):
+            other.get(self._url + '/path')
+        other.session.request.assert_not_called()
+        self.assertEqual(CircuitBreakerRegistry.instance().get(self._url).state, CircuitState.Open)
+
+    def test_remote_gateways(self):
+        portal = 'https://portal.ctera.com/ServicesPortal'
+        client = self._client()
+        client.session.request.side_effect = requests.exceptions.Timeout()
+        for _ in range(2):
+            with self.assertRaises(ExhaustedException):
+                client.get(portal + '/devicecmdnew/acme/vGateway-1/status')
+        registry = CircuitBreakerRegistry.instance()
+        self.assertEqual(registry.get(portal + '/devicecmdnew/acme/vGateway-1/').state, CircuitState.Open)
+        self.assertEqual(registry.get(portal + '/devicecmdnew/acme/vGateway-2/').state, CircuitState.Closed)
+        self.assertEqual(registry.get(portal + '/devices/vGateway-1/admingui/api').state, CircuitState.Closed)
+        self.assertEqual(registry.get(portal + '/api/devices/vGateway-1').state, CircuitState.Closed)
+        self.assertIs(registry.get(portal + '/api/devices/vGateway-1'), registry.get(portal + '/api'))
+
+    def test_error_response_closes_circuit(self):
+        client = self._client()
+        client.session.request.side_effect = [requests.exceptions.ConnectionError(request=requests.Request('GET', self._url)),
+                                              TestHTTPClientCircuitBreaker._response(500)]
+        with self.assertRaises(HostUnreachable):
+            client.get(self._url)
+        with self.assertRaises(HTTPException):
+            client.get(self._url)
+        self.assertEqual(CircuitBreakerRegistry.instance().get(self._url).state, CircuitState.Closed)
+
+    def test_gateway_errors(self):
+        portal = 'https://portal.ctera.com/ServicesPortal'
+        client = self._client()
+        client.session.request.side_effect = lambda *args, **kwargs: TestHTTPClientCircuitBreaker._response(503)
+        for url in [portal + '/devicecmdnew/acme/vGateway-1/status', portal + '/api/status']:
+            for _ in range(2):
+                with self.assertRaises(HTTPException):
+                    client.get(url)
+        registry = CircuitBreakerRegistry.instance()
+        self.assertEqual(registry.get(portal + '/devicecmdnew/acme/vGateway-1/').state, CircuitState.Open)
+        self.assertEqual(registry.get(portal + '/api').state, CircuitState.Closed)
+
+    def test_no_response_not_recorded(self):
+        breaker = CircuitBreakerRegistry.instance().get(self._url)
+        breaker.on_failure()
+        for error in [RateLimitExceeded('gateway.ctera.com', 'default', 10), SSLException('gateway.ctera.com', 443, 'Cancelled by user')]:
+            with self.assertRaises(type(error)):
+                with circuit(self._url):
+                    raise error
+        breaker.on_failure()
+        self.assertEqual(breaker.state, CircuitState.Open)
+
+    def test_no_response_releases_trial(self):
+        breaker = CircuitBreakerRegistry.instance().get(self._url)
+        breaker.on_failure()
+        breaker.on_failure()
+        self.patch_call('cterasdk.client.breaker.time.monotonic', return_value=breaker._opened_at + 60)  # pylint: disable=protected-access
+        with self.assertRaises(RateLimitExceeded):
+            with circuit(self._url):
+                raise RateLimitExceeded('gateway.ctera.com', 'default', 10)
+        self.assertEqual(breaker.state, CircuitState.HalfOpen)
+        self.assertTrue(breaker.allow())
+
+    def test_disabled(self):
+        config.http['circuit_breaker'] = False
+        client = self._client()
+        client.session.request.side_effect = requests.exceptions.ConnectionError(request=requests.Request('GET', self._url))
+        for _ in range(3):
+            with self.assertRaises(HostUnreachable):
+                client.get(self._url)
+        self.assertEqual(client.session.request.call_count, 3)
+
+    @staticmethod
+    def _response(status_code):
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = b''  # pylint: disable=protected-access
+        return response
+
+    @staticmethod
+    def _client():
+        client = HTTPClient('JSESSIONID', retry_policy=RetryPolicy(retries=1, jitter=False))
+        client.session.request = mock.MagicMock()
+        return client
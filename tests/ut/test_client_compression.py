@@ -0,0 +1,95 @@
+import gzip
+from http.server import BaseHTTPRequestHandler
+
+from cterasdk import config
+from cterasdk.client.cteraclient import CTERAClient
+from cterasdk.client.compression import body_text
+from tests.ut import base
+
+
+class CompressionHandler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+    received = []
+    reject = False
+
+    def do_PUT(self):  # pylint: disable=invalid-name
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        encoding = self.headers.get('Content-Encoding')
+        if encoding == 'gzip' and CompressionHandler.reject:
+            return self._respond(415, b'')
+        CompressionHandler.received.append((encoding, gzip.decompress(body) if encoding == 'gzip' else body))
+        return self._respond(200, b'<val>ok</val>')
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        body = ('<list>%s</list>' % ('<val>item</val>' * 1000)).encode('utf-8')
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            return self._respond(200, gzip.compress(body), {'Content-Encoding': 'gzip'})
+        return self._respond(200, body)
+
+    def _respond(self, status, body, headers=None):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+class TestClientCompression(base.BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self._baseurl = self.serve(CompressionHandler)
+        CompressionHandler.received = []
+        CompressionHandler.reject = False
+        self._config = dict(config.http)
+        self.addCleanup(config.http.update, self._config)
+        config.http.update(dict(compression=True, compression_threshold=100))
+        self._data = ['item-%s' % index for index in range(100)]
+
+    def test_compress_request(self):
+        client = CTERAClient('JSESSIONID')
+        self.assertEqual(client.put(self._baseurl, '/config', self._data), 'ok')
+        encoding, body = CompressionHandler.received[0]
+        self.assertEqual(encoding, 'gzip')
+        self.assertIn(b'<val>item-99</val>', body)
+        stats = client.compression_stats()
+        self.assertEqual(stats.bytes_sent, len(body))
+        self.assertGreater(stats.request_ratio, 1)
+        self.assertEqual(stats.calls[0].direction, 'request')
+
+    def test_below_threshold(self):
+        client = CTERAClient('JSESSIONID')
+        client.put(self._baseurl, '/config', 'small')
+        self.assertEqual(CompressionHandler.received[0], (None, b'<val>small</val>'))
+
+    def test_compression_disabled(self):
+        config.http['compression'] = False
+        client = CTERAClient('JSESSIONID')
+        client.put(self._baseurl, '/config', self._data)
+        self.assertIsNone(CompressionHandler.received[0][0])
+        self.assertEqual(client.compression_stats().bytes_sent, 0)
+
+    def test_unsupported_falls_back(self):
+        CompressionHandler.reject = True
+        client = CTERAClient('JSESSIONID')
+        for _ in range(2):
+            self.assertEqual(client.put(self._baseurl, '/config', self._data), 'ok')
+        self.assertEqual([encoding for encoding, _body in CompressionHandler.received], [None, None])
+        self.assertEqual(len(client.compression_stats().calls), 1)
+
+    def test_compressed_response(self):
+        client = CTERAClient('JSESSIONID')
+        self.assertEqual(len(client.get(self._baseurl, '/list')), 1000)
+        stats = client.compression_stats()
+        self.assertEqual(stats.calls[0].direction, 'response')
+        self.assertEqual(stats.bytes_received, len(('<list>%s</list>' % ('<val>item</val>' * 1000))))
+        self.assertGreater(stats.response_ratio, 10)
+
+    def test_body_text(self):
+        self.assertEqual(body_text({'Content-Encoding': 'gzip'}, gzip.compress(b'<val>1</val>')), '<val>1</val>')
+        self.assertEqual(body_text({}, b'<val>1</val>'), '<val>1</val>')
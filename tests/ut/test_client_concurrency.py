@@ -0,0 +1,63 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from cterasdk.core.files.common import SrcDstParam, ActionResourcesParam, CreateShareParam
+from cterasdk.core import portals
+from tests.ut import base_core
+
+
+class TestClientConcurrency(base_core.BaseCoreTest):
+
+    _workers = 32
+    _iterations = 2000
+
+    def test_param_builders(self):
+        def build(index):
+            param = ActionResourcesParam.instance()
+            for offset in range(3):
+                param.add(SrcDstParam.instance(src='src-%s-%s' % (index, offset), dest='dest-%s' % index))
+            share = CreateShareParam.instance(path='path-%s' % index, access='RO', expire_on=None)
+            return index, param, share
+
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            results = list(executor.map(build, range(self._iterations)))
+
+        for index, param, share in results:
+            self.assertEqual([url.src for url in param.urls], ['src-%s-%s' % (index, offset) for offset in range(3)])
+            self.assertEqual({url.dest for url in param.urls}, {'dest-%s' % index})
+            self.assertEqual(share.url, 'path-%s' % index)
+
+    def test_map(self):
+        threads = set()
+
+        def get(path, *_args, **_kwargs):
+            threads.add(threading.get_ident())
+            return path.upper()
+
+        self._global_admin.get = mock.MagicMock(side_effect=get)
+        paths = ['/users/user-%s' % index for index in range(self._iterations)]
+        results = self._global_admin.map(self._global_admin.get, paths, max_workers=self._workers)
+        self.assertEqual(results, [path.upper() for path in paths])
+        self.assertGreater(len(threads), 1)
+
+    def test_concurrent_browse(self):
+        self._activate_portal_session()
+        observed = []
+
+        def put(path, tenant, *_args, **_kwargs):
+            observed.append((path, tenant, self._global_admin.session().tenant()))
+
+        with mock.patch('cterasdk.client.host.CTERAHost.put', side_effect=put):
+            tenants = ['tenant-%s' % (index % 8) for index in range(self._iterations)]
+            self._global_admin.map(portals.Portals(self._global_admin).browse, tenants, max_workers=self._workers)
+
+        self.assertEqual(len(observed), self._iterations)
+        for previous, current in zip(observed, observed[1:]):
+            self.assertEqual(current[2], previous[1])  # each browse starts from the tenant set by the previous one
+        self.assertEqual(self._global_admin.session().tenant(), observed[-1][1])
+
+    def _activate_portal_session(self):
+        current_session = mock.MagicMock(username='admin', role='ReadWriteAdmin')
+        self._global_admin.get = mock.MagicMock(side_effect=['', current_session])
+        self._global_admin.session().start_local_session(self._global_admin)
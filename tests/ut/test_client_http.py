@@ -0,0 +1,57 @@
+from http.server import BaseHTTPRequestHandler
+
+from cterasdk import config
+from cterasdk.client.http import HTTPClient
+from cterasdk.client.pool import PooledHTTPAdapter
+from tests.ut import base
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        body = b'<val>ok</val>'
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+class TestHTTPClientPool(base.BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self._url = self.serve(KeepAliveHandler) + '/status'
+        self._config = dict(config.http)
+        self.addCleanup(config.http.update, self._config)
+
+    def test_adapters_use_configured_pool_size(self):
+        config.http.update(dict(pool_connections=4, pool_maxsize=200, pool_block=True))
+        client = HTTPClient('JSESSIONID')
+        for scheme in ['http://', 'https://']:
+            adapter = client.session.get_adapter(scheme)
+            self.assertIsInstance(adapter, PooledHTTPAdapter)
+            self.assertEqual(adapter.poolmanager.connection_pool_kw['maxsize'], 200)
+            self.assertTrue(adapter.poolmanager.connection_pool_kw['block'])
+
+    def test_connection_reuse_statistics(self):
+        client = HTTPClient('JSESSIONID')
+        for _ in range(3):
+            client.get(self._url)
+        stats = client.connection_stats()
+        self.assertEqual(stats.requests, 3)
+        self.assertEqual(stats.new_connections, 1)
+        self.assertEqual(stats.reused_connections, 2)
+
+    def test_keep_alive_disabled(self):
+        config.http['keep_alive'] = False
+        client = HTTPClient('JSESSIONID')
+        for _ in range(3):
+            client.get(self._url)
+        stats = client.connection_stats()
+        self.assertEqual(stats.new_connections, 3)
+        self.assertEqual(stats.reused_connections, 0)
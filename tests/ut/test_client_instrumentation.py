@@ -0,0 +1,128 @@
+from unittest import mock
+
+import requests
+
+from cterasdk import config
+from cterasdk.client.cteraclient import CTERAClient
+from cterasdk.client.instrumentation import LatencyAggregator, RequestRecord, logical_path
+from cterasdk.client.http import HttpClientRequestPost
+from cterasdk.exception import CTERAClientException
+from tests.ut import base
+
+
+class TestLatencyAggregator(base.BaseTest):
+
+    def test_percentiles(self):
+        aggregator = LatencyAggregator()
+        for elapsed in range(1, 101):
+            aggregator(TestLatencyAggregator._record(elapsed / 1000))
+        stats = aggregator.snapshot()['POST /ServicesPortal/api/users:query']
+        self.assertEqual(stats.requests, 100)
+        self.assertEqual((stats.p50, stats.p90, stats.p99, stats.max), (0.05, 0.09, 0.099, 0.1))
+        self.assertAlmostEqual(stats.mean, 0.0505)
+        self.assertEqual(stats.request_bytes, 1000)
+
+    def test_samples(self):
+        config.http['metrics_samples'] = 10
+        self.addCleanup(config.http.__setitem__, 'metrics_samples', 1024)
+        aggregator = LatencyAggregator()
+        for elapsed in range(100):
+            aggregator(TestLatencyAggregator._record(elapsed))
+        stats = aggregator.snapshot()['POST /ServicesPortal/api/users:query']
+        self.assertEqual((stats.requests, stats.p50), (100, 94))
+
+    def test_logical_path(self):
+        for path, expected in [
+            ('/ServicesPortal/api/users', '/ServicesPortal/api/users'),
+            ('/ServicesPortal/api/users/alice', '/ServicesPortal/api/users/*'),
+            ('/ServicesPortal/api/portals/acme/devices/vGateway', '/ServicesPortal/api/portals/*/devices/*'),
+            ('/ServicesPortal/devicecmdnew/acme/vGateway/config/shares/share', '/ServicesPortal/devicecmdnew/*/*/config/*'),
+            ('/ServicesPortal/devices/vGateway/admingui/api/status', '/ServicesPortal/devices/*/admingui/api/status'),
+            ('/admingui/api/config/fileservices/cifs', '/admingui/api/config/*'),
+            ('/ServicesPortal/webdav/Users/alice/My Files', '/ServicesPortal/webdav/*')
+        ]:
+            self.assertEqual(logical_path(path), expected)
+
+    def test_endpoints(self):
+        aggregator = LatencyAggregator()
+        for name in ['alice', 'bob']:
+            record = RequestRecord(HttpClientRequestPost('https://portal.ctera.com/ServicesPortal/api/users/%s' % name))
+            record.elapsed = 0.1
+            aggregator(record)
+        self.assertEqual(list(aggregator.snapshot()), ['POST /ServicesPortal/api/users/*'])
+
+    @staticmethod
+    def _record(elapsed):
+        record = RequestRecord(HttpClientRequestPost('https://portal.ctera.com/ServicesPortal/api/users', data='0123456789',
+                                                     name='query'))
+        record.elapsed = elapsed
+        return record
+
+
+class TestClientInstrumentation(base.BaseTest):
+
+    _baseurl = 'https://portal.ctera.com/ServicesPortal/api'
+
+    def setUp(self):
+        super().setUp()
+        self._client = CTERAClient('JSESSIONID')
+        self._responses = []
+        patcher = mock.patch.object(self._client.http_client.session, 'request', side_effect=self._request)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.dict(config.http, metrics=True, retry_policy=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self._records = []
+        self._client.add_request_hook(self._records.append)
+
+    def test_execute(self):
+        self._responses.append(TestClientInstrumentation._response(200, '<val>3</val>'))
+        self.assertEqual(self._client.execute(self._baseurl, '/users', 'getCount'), 3)
+        record = self._records[0]
+        self.assertEqual((record.method, record.path, record.name, record.status, record.retries, record.error),
+                         ('POST', '/ServicesPortal/api/users', 'getCount', 200, 0, None))
+        self.assertGreater(record.request_bytes, 0)
+        self.assertEqual(record.response_bytes, len('<val>3</val>'))
+        self.assertIn('POST /ServicesPortal/api/users:getCount', self._client.metrics())
+
+    def test_error(self):
+        self._responses.append(TestClientInstrumentation._response(404, '<val>Not found</val>'))
+        with self.assertRaises(CTERAClientException):
+            self._client.get(self._baseurl, '/users/admin')
+        record = self._records[0]
+        self.assertEqual((record.status, record.error), (404, 'HTTPException'))
+        self.assertEqual(self._client.metrics()['GET /ServicesPortal/api/users/*'].errors, 1)
+
+    def test_retries(self):
+        self._responses.extend([TestClientInstrumentation._response(503, ''), TestClientInstrumentation._response(200, '<val>1</val>')])
+        with mock.patch('time.sleep'):
+            self._client.get(self._baseurl, '/users/admin')
+        self.assertEqual((self._records[0].retries, self._records[0].status), (1, 200))
+
+    def test_remove_hook(self):
+        self._client.remove_request_hook(self._records.append)
+        config.http['metrics'] = False
+        self._responses.append(TestClientInstrumentation._response(200, '<val>1</val>'))
+        self._client.get(self._baseurl, '/users/admin')
+        self.assertEqual(self._records, [])
+        self.assertEqual(self._client.metrics(), {})
+
+    def test_failing_hook(self):
+        self._client.add_request_hook(mock.MagicMock(side_effect=ValueError))
+        self._responses.append(TestClientInstrumentation._response(200, '<val>1</val>'))
+        self.assertEqual(self._client.get(self._baseurl, '/users/admin'), 1)
+        self.assertEqual(len(self._records), 1)
+
+    def _request(self, method, url, **kwargs):
+        response = self._responses.pop(0)
+        response.request = requests.Request(method, url, data=kwargs.get('data')).prepare()
+        response.url = url
+        return response
+
+    @staticmethod
+    def _response(status_code, text):
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = text.encode('utf-8')  # pylint: disable=protected-access
+        return response
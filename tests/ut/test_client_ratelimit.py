@@ -0,0 +1,145 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import requests
+
+from cterasdk import config
+from cterasdk.client.ratelimit import TokenBucket, RateLimiter, RateLimiterRegistry, RequestFamily, request_family, throttle
+from cterasdk.exception import RateLimitExceeded
+from cterasdk.object import GlobalAdmin
+from tests.ut import base
+
+
+class TestTokenBucket(base.BaseTest):
+
+    def test_burst(self):
+        bucket = TokenBucket(1, 3)
+        self.assertEqual([bucket.try_acquire() for _ in range(4)], [True, True, True, False])
+
+    def test_reserve(self):
+        bucket = TokenBucket(10, 1)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertAlmostEqual(bucket.reserve(), 0.1, delta=0.01)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, delta=0.01)
+
+    def test_refill(self):
+        bucket = TokenBucket(1000, 1)
+        self.assertTrue(bucket.try_acquire())
+        time.sleep(0.01)
+        self.assertTrue(bucket.try_acquire())
+
+
+class TestRateLimiter(base.BaseTest):
+
+    def test_throttled(self):
+        limiter = RateLimiter('portal.ctera.com', RequestFamily.API, rate=50, burst=1)
+        start = time.monotonic()
+        for _ in range(3):
+            with limiter.acquire():
+                pass
+        self.assertGreaterEqual(time.monotonic() - start, 0.03)
+        stats = limiter.statistics.snapshot()
+        self.assertEqual((stats.requests, stats.throttled, stats.rejected), (3, 2, 0))
+        self.assertGreater(stats.throttled_time, 0)
+
+    def test_rate_exceeded(self):
+        limiter = RateLimiter('portal.ctera.com', RequestFamily.API, rate=1, burst=1)
+        with limiter.acquire(block=False):
+            pass
+        with self.assertRaises(RateLimitExceeded) as error:
+            with limiter.acquire(block=False):
+                pass
+        self.assertEqual(error.exception.limit, 'rate')
+        self.assertEqual(limiter.statistics.snapshot().rejected, 1)
+
+    def test_concurrency(self):
+        limiter = RateLimiter('portal.ctera.com', RequestFamily.Files, concurrency=2)
+        lock, active, peak = threading.Lock(), [0], [0]
+
+        def request():
+            with limiter.acquire():
+                with lock:
+                    active[0] = active[0] + 1
+                    peak[0] = max(peak[0], active[0])
+                time.sleep(0.02)
+                with lock:
+                    active[0] = active[0] - 1
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: request(), range(8)))
+        self.assertEqual(peak[0], 2)
+
+    def test_concurrency_exceeded(self):
+        limiter = RateLimiter('portal.ctera.com', RequestFamily.Files, concurrency=1)
+        with limiter.acquire(block=False):
+            with self.assertRaises(RateLimitExceeded) as error:
+                with limiter.acquire(block=False):
+                    pass
+        self.assertEqual(error.exception.limit, 'concurrency')
+        with limiter.acquire(block=False):
+            pass
+
+    def test_concurrency_exceeded_keeps_token(self):
+        limiter = RateLimiter('portal.ctera.com', RequestFamily.Files, rate=1, burst=2, concurrency=1)
+        with limiter.acquire(block=False):
+            with self.assertRaises(RateLimitExceeded):
+                with limiter.acquire(block=False):
+                    pass
+        with limiter.acquire(block=False):
+            pass
+
+    def test_streamed_response_holds_slot(self):
+        limiter = RateLimiter('portal.ctera.com', RequestFamily.Files, concurrency=1)
+        closed, read = requests.Response(), requests.Response()
+        closed.raw, read.raw = mock.MagicMock(), mock.MagicMock()
+        for response, obj, release in [(closed, closed, 'close'), (read, read.raw, 'release_conn')]:  # closed, or the body was read
+            with limiter.acquire(block=False) as slot:
+                slot.hold(response)
+            with self.assertRaises(RateLimitExceeded):
+                with limiter.acquire(block=False):
+                    pass
+            getattr(obj, release)()
+            with limiter.acquire(block=False):
+                pass
+        read.close()  # released once
+
+
+class TestThrottle(base.BaseTest):
+
+    _url = 'https://portal.ctera.com:443/ServicesPortal/api/users'
+
+    def setUp(self):
+        super().setUp()
+        rate_limits = dict(api=dict(rate=1, burst=1, concurrency=None), files=dict(rate=None, burst=None, concurrency=None))
+        patcher = mock.patch.dict(config.http, rate_limits=rate_limits, rate_limit_block=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        RateLimiterRegistry.instance().reset()
+        self.addCleanup(RateLimiterRegistry.instance().reset)
+
+    def test_families(self):
+        with throttle(TestThrottle._url):
+            pass
+        with self.assertRaises(RateLimitExceeded):
+            with throttle(TestThrottle._url):
+                pass
+        with request_family(RequestFamily.Files):
+            for _ in range(3):
+                with throttle(TestThrottle._url):
+                    pass
+
+    def test_hosts(self):
+        with throttle(TestThrottle._url):
+            pass
+        with throttle('https://other.ctera.com:443/ServicesPortal/api/users'):
+            pass
+
+    def test_throttle_stats(self):
+        admin = GlobalAdmin('portal.ctera.com')
+        with throttle(TestThrottle._url):
+            pass
+        stats = admin.throttle_stats()
+        self.assertEqual(stats.api.requests, 1)
+        self.assertEqual(stats.files.requests, 0)
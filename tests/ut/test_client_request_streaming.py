@@ -0,0 +1,68 @@
+from unittest import mock
+from http.server import BaseHTTPRequestHandler
+
+from cterasdk import config
+from cterasdk.common import Object
+from cterasdk.client.cteraclient import CTERAClient
+from cterasdk.convert import toxmlstr
+from tests.ut import base
+
+
+class ChunkedHandler(BaseHTTPRequestHandler):
+    """ Record the transfer encoding and the body of every request """
+
+    protocol_version = 'HTTP/1.1'
+    requests = []
+
+    def do_PUT(self):  # pylint: disable=invalid-name
+        self.do_POST()
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        if self.headers.get('Transfer-Encoding') == 'chunked':
+            body = b''
+            while True:
+                size = int(self.rfile.readline().strip(), 16)
+                body = body + self.rfile.read(size)
+                self.rfile.readline()
+                if size == 0:
+                    break
+        else:
+            body = self.rfile.read(int(self.headers['Content-Length']))
+        ChunkedHandler.requests.append((self.headers.get('Transfer-Encoding'), body))
+        response = b'<val>ok</val>'
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+class TestRequestStreaming(base.BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        ChunkedHandler.requests = []
+        self._baseurl = self.serve(ChunkedHandler)
+        self._client = CTERAClient('JSESSIONID')
+        self._data = Object()
+        self._data.acl = ['entry %s' % index for index in range(20000)]
+        patcher = mock.patch.dict(config.http, stream_requests=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_put(self):
+        self.assertEqual(self._client.put(self._baseurl, '/config/acl', self._data), 'ok')
+        self.assertEqual(ChunkedHandler.requests, [('chunked', toxmlstr(self._data))])
+
+    def test_execute(self):
+        self.assertEqual(self._client.execute(self._baseurl, '/status', 'syncAD', self._data), 'ok')
+        encoding, body = ChunkedHandler.requests[0]
+        self.assertEqual(encoding, 'chunked')
+        self.assertIn(toxmlstr(self._data), body)
+
+    def test_disabled(self):
+        config.http['stream_requests'] = False
+        self._client.post(self._baseurl, '/config/acl', self._data)
+        self.assertEqual(ChunkedHandler.requests, [(None, toxmlstr(self._data))])
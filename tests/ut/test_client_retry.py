@@ -0,0 +1,143 @@
+from unittest import mock
+
+import requests
+
+from cterasdk import config
+from cterasdk.client.cteraclient import CTERAClient
+from cterasdk.client.http import HTTPClient, HttpClientRequestGet, HttpClientRequestPost, HTTPException
+from cterasdk.client.retry import RetryPolicy, RetryBudget
+from cterasdk.exception import ExhaustedException, ConnectionTimeout
+from tests.ut import base
+
+
+class TestRetryPolicy(base.BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self._url = 'https://portal.ctera.com/admin/api/users'
+
+    def test_exponential_backoff(self):
+        policy = RetryPolicy(retries=5, backoff_factor=1, backoff_max=5, jitter=False)
+        request = HttpClientRequestGet(self._url)
+        self.assertEqual([policy.delay(request, attempt) for attempt in range(5)], [1, 2, 4, 5, None])
+
+    def test_jitter(self):
+        policy = RetryPolicy(retries=10, backoff_factor=1, backoff_max=100, jitter=True)
+        request = HttpClientRequestGet(self._url)
+        for attempt in range(9):
+            self.assertTrue(0 <= policy.delay(request, attempt) <= 2 ** attempt)
+
+    def test_retry_after(self):
+        policy = RetryPolicy(retries=3, backoff_factor=1, backoff_max=30, jitter=False)
+        request = HttpClientRequestGet(self._url)
+        self.assertEqual(policy.delay(request, 0, TestRetryPolicy._response(503, {'Retry-After': '7'})), 7)
+        self.assertEqual(policy.delay(request, 0, TestRetryPolicy._response(429, {'Retry-After': '120'})), 120)
+        self.assertIsNone(policy.delay(request, 0, TestRetryPolicy._response(429, {'Retry-After': '3600'})))
+        policy = RetryPolicy(retries=3, backoff_factor=1, jitter=False, retry_after_max=3600)
+        self.assertEqual(policy.delay(request, 0, TestRetryPolicy._response(429, {'Retry-After': '3600'})), 3600)
+
+    def test_non_retryable_status(self):
+        policy = RetryPolicy(retries=3, jitter=False)
+        self.assertIsNone(policy.delay(HttpClientRequestGet(self._url), 0, TestRetryPolicy._response(500)))
+
+    def test_idempotency(self):
+        policy = RetryPolicy(retries=3, jitter=False)
+        self.assertIsNone(policy.delay(HttpClientRequestPost(self._url), 0))
+        self.assertIsNotNone(policy.delay(HttpClientRequestPost(self._url, idempotent=True), 0))
+        self.assertTrue(policy.is_safe('query'))
+        self.assertFalse(policy.is_safe('add'))
+
+    def test_retry_budget(self):
+        budget = RetryBudget(2, 60)
+        self.assertTrue(budget.acquire('a'))
+        self.assertTrue(budget.acquire('a'))
+        self.assertFalse(budget.acquire('a'))
+        self.assertTrue(budget.acquire('b'))
+
+    @staticmethod
+    def _response(status_code, headers=None):
+        return mock.MagicMock(status_code=status_code, headers=headers or {})
+
+
+class TestHTTPClientRetry(base.BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self._url = 'https://portal.ctera.com/admin/api/users'
+        self._sleep = self.patch_call('cterasdk.client.http.time.sleep')
+        self._client = HTTPClient('JSESSIONID', retry_policy=RetryPolicy(retries=3, backoff_factor=1, jitter=False))
+        self._client.session.request = mock.MagicMock()
+
+    def test_retry_unavailable(self):
+        unavailable = TestHTTPClientRetry._response(503)
+        unavailable.raw = mock.MagicMock()
+        self._client.session.request.side_effect = [unavailable, TestHTTPClientRetry._response(200)]
+        _request, response = self._client.get(self._url)
+        self.assertEqual(response.status_code, 200)
+        self._sleep.assert_called_once_with(1)
+        unavailable.raw.release_conn.assert_called_once()  # released before waiting
+
+    def test_retry_exhausted(self):
+        self._client.session.request.side_effect = [TestHTTPClientRetry._response(503) for _ in range(3)]
+        with self.assertRaises(HTTPException) as error:
+            self._client.get(self._url)
+        self.assertEqual(error.exception.response.code, 503)
+        self.assertEqual(self._client.session.request.call_count, 3)
+
+    def test_timeout(self):
+        self._client.session.request.side_effect = requests.exceptions.Timeout()
+        with self.assertRaises(ExhaustedException):
+            self._client.get(self._url)
+        self.assertEqual(self._client.session.request.call_count, 3)
+
+    def test_unsafe_post_is_not_retried(self):
+        self._client.session.request.side_effect = requests.exceptions.Timeout()
+        with self.assertRaises(ConnectionTimeout):
+            self._client.post(self._url, data='')
+        self._client.session.request.assert_called_once()
+        self._sleep.assert_not_called()
+
+    def test_default_policy_from_config(self):
+        self.assertEqual(HTTPClient('JSESSIONID').retry_policy.retries, config.http['retries'])
+
+    @staticmethod
+    def _response(status_code):
+        response = requests.Response()
+        response.status_code = status_code
+        response.url = 'https://portal.ctera.com/admin/api/users'
+        response._content = b''  # pylint: disable=protected-access
+        response.request = requests.Request('GET', response.url).prepare()
+        return response
+
+
+class TestCTERAClientRetry(base.BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self._baseurl = 'https://portal.ctera.com/admin/api'
+        self._client = CTERAClient('JSESSIONID')
+        self._client.http_client.dispatch = mock.MagicMock(return_value=(None, TestCTERAClientRetry._response()))
+
+    def test_form_data_not_retried(self):
+        self._client.form_data(self._baseurl, '/login', {'j_username': 'admin'})
+        request = self._client.http_client.dispatch.call_args[0][0]
+        self.assertFalse(request.idempotent)
+        self.assertEqual(request.kwargs['data'], b'j_username=admin')
+
+    def test_safe_form_data(self):
+        self._client.http_client.retry_policy = RetryPolicy(safe_methods=['/status'])
+        self._client.form_data(self._baseurl, '/status', {})
+        self.assertTrue(self._client.http_client.dispatch.call_args[0][0].idempotent)
+
+    def test_safe_method(self):
+        self._client.execute(self._baseurl, '', 'queryLogs')
+        self._client.execute(self._baseurl, '', 'reboot')
+        self.assertEqual([call[0][0].idempotent for call in self._client.http_client.dispatch.call_args_list], [True, False])
+        self.assertTrue(all(call[0][0].compress for call in self._client.http_client.dispatch.call_args_list))
+
+    @staticmethod
+    def _response():
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b''  # pylint: disable=protected-access
+        return response
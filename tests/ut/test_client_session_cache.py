@@ -0,0 +1,115 @@
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from cterasdk import config
+from cterasdk.common import Object
+from cterasdk.client.session_cache import SessionCache
+from cterasdk.exception import CTERAClientException
+from cterasdk.object import GlobalAdmin
+from tests.ut import base
+
+
+class TestSessionCache(base.BaseTest):
+
+    _username = 'admin'
+    _password = 'password'
+    _session_id = 'a1b2c3'
+
+    def setUp(self):
+        super().setUp()
+        self._directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self._directory)
+        patcher = mock.patch.dict(config.sessions, cache=True, directory=self._directory, key=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self._expired = False
+        self._forbidden = False
+
+    def test_login_and_resume(self):
+        client = TestSessionCache._client(self._login())
+        client.form_data.assert_called_once()
+        self.assertEqual(client.get.call_count, 2)
+
+        admin = self._login()
+        client = TestSessionCache._client(admin)
+        client.form_data.assert_not_called()
+        client.get.assert_not_called()
+        self.assertEqual(client.get_session_id(), TestSessionCache._session_id)
+        self.assertEqual(admin.session().user.name, TestSessionCache._username)
+        self.assertEqual(admin.session().user.tenant, 'acme')
+        self.assertTrue(admin.session().authenticated())
+
+    def test_encrypted(self):
+        self._login()
+        sessions = [name for name in os.listdir(self._directory) if name.endswith('.session')]
+        self.assertEqual(len(sessions), 1)
+        with open(os.path.join(self._directory, sessions[0]), 'rb') as f:
+            self.assertNotIn(TestSessionCache._session_id.encode('utf-8'), f.read())
+
+    def test_expired_session(self):
+        self._login()
+        admin = self._login()
+        self._expired = True
+        self.assertEqual(admin.get('/users'), 'users')
+        TestSessionCache._client(admin).form_data.assert_called_once()
+        self.assertFalse(self._expired)
+
+    def test_wrong_password(self):
+        self._login()
+        client = TestSessionCache._client(self._login('wrong'))
+        client.form_data.assert_called_once()
+        self.assertEqual(client.form_data.call_args[0][2]['j_password'], 'wrong')
+
+    def test_forbidden_keeps_session(self):
+        self._login()
+        admin = self._login()
+        self._forbidden = True
+        with self.assertRaises(CTERAClientException):
+            admin.get('/users')
+        TestSessionCache._client(admin).form_data.assert_not_called()
+        self.assertIsNotNone(SessionCache.instance().load(admin.base_api_url, TestSessionCache._username, TestSessionCache._password))
+
+    def test_logout_removes_session(self):
+        admin = self._login()
+        admin.logout()
+        self.assertIsNone(SessionCache.instance().load(admin.base_api_url, TestSessionCache._username, TestSessionCache._password))
+
+    def test_disabled(self):
+        config.sessions['cache'] = False
+        self._login()
+        TestSessionCache._client(self._login()).form_data.assert_called_once()
+        self.assertEqual(os.listdir(self._directory), [])
+
+    def test_cryptography_not_installed(self):
+        with mock.patch('cterasdk.client.session_cache.Fernet', None):
+            self.assertFalse(SessionCache.enabled())
+
+    def _login(self, password=None):
+        admin = GlobalAdmin('portal.ctera.com')
+        client = TestSessionCache._client(admin)
+        client.form_data = mock.MagicMock(side_effect=lambda *args: client.set_session_id(TestSessionCache._session_id))
+        client.get = mock.MagicMock(side_effect=self._get)
+        admin.login(TestSessionCache._username, password or TestSessionCache._password)
+        return admin
+
+    @staticmethod
+    def _client(admin):
+        return admin._ctera_client  # pylint: disable=protected-access
+
+    def _get(self, _baseurl, path, _params=None):
+        if path == '/currentPortal':
+            return 'acme'
+        if path == '/currentSession':
+            current_session = Object()
+            current_session.username = TestSessionCache._username
+            current_session.role = 'ReadWriteAdmin'
+            return current_session
+        if self._expired or self._forbidden:
+            error = CTERAClientException()
+            error.response = Object()
+            error.response.code = 401 if self._expired else 403
+            self._expired = False
+            raise error
+        return 'users'
@@ -0,0 +1,121 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import requests
+
+from cterasdk import config
+from cterasdk.client.cteraclient import CTERAClient
+from cterasdk.client.singleflight import SingleFlight
+from cterasdk.exception import CTERAException
+from tests.ut import base
+
+
+class TestSingleFlight(base.BaseTest):
+
+    _workers = 16
+
+    def setUp(self):
+        super().setUp()
+        self._release = threading.Event()
+        self._single_flight = SingleFlight()
+
+    def test_collapse(self):
+        calls = []
+
+        def function():
+            calls.append(threading.get_ident())
+            self._release.wait()
+            return ['value']
+
+        results = self._run(lambda: self._single_flight.do('key', function))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [['value']] * self._workers)
+        self.assertEqual(len({id(result) for result in results}), self._workers)  # waiters receive a copy
+        stats = self._single_flight.snapshot()
+        self.assertEqual((stats.requests, stats.collapsed), (self._workers, self._workers - 1))
+
+    def test_leader_mutates_result(self):
+        leader, mutated = [], threading.Event()
+
+        class Result:
+
+            def __init__(self, value):
+                self.value = value
+
+            def __deepcopy__(self, memo):
+                if threading.get_ident() not in leader:
+                    mutated.wait(1)  # copy after the leader modified its result
+                return Result(self.value)
+
+        def function():
+            leader.append(threading.get_ident())
+            self._release.wait()
+            return Result('original')
+
+        def call():
+            result = self._single_flight.do('key', function)
+            if threading.get_ident() in leader:
+                result.value = 'modified'
+                mutated.set()
+            return result.value
+
+        results = self._run(call)
+        self.assertEqual(sorted(results), ['modified'] + ['original'] * (self._workers - 1))
+
+    def test_error(self):
+        def function():
+            self._release.wait()
+            raise CTERAException('Failed')
+
+        def call():
+            try:
+                return self._single_flight.do('key', function)
+            except CTERAException as error:
+                return error.message
+
+        self.assertEqual(self._run(call), ['Failed'] * self._workers)
+
+    def test_sequential(self):
+        for _ in range(3):
+            self.assertEqual(self._single_flight.do('key', lambda: 1), 1)
+        self.assertEqual(self._single_flight.snapshot().collapsed, 0)
+
+    def _run(self, function):
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            futures = [executor.submit(function) for _ in range(self._workers)]
+            while self._single_flight.snapshot().requests < self._workers:
+                time.sleep(0.01)
+            self._release.set()
+            return [future.result() for future in futures]
+
+
+class TestClientSingleFlight(base.BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self._baseurl = 'https://portal.ctera.com/admin/api'
+        self._client = CTERAClient('JSESSIONID')
+        self._get = self.patch_call('cterasdk.client.http.HTTPClient.get',
+                                    return_value=(None, TestClientSingleFlight._response('<val>portal</val>')))
+        patcher = mock.patch.dict(config.http, single_flight=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get(self):
+        self.assertEqual(self._client.get(self._baseurl, '/currentPortal'), 'portal')
+        self._get.assert_called_once_with(self._client.http_client, self._baseurl + '/currentPortal', {})
+        self.assertEqual(self._client.single_flight_stats().requests, 1)
+
+    def test_disabled(self):
+        config.http['single_flight'] = False
+        self._client.get(self._baseurl, '/currentPortal')
+        self.assertEqual(self._client.single_flight_stats().requests, 0)
+
+    @staticmethod
+    def _response(text):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = text.encode('utf-8')  # pylint: disable=protected-access
+        return response
@@ -0,0 +1,92 @@
+import copy
+import io
+import pickle
+from unittest import mock
+
+from cterasdk import config
+from cterasdk.common import Object, Record
+from cterasdk.common.record import compact, RecordTypes
+from cterasdk.convert import fromxmlstr, toxmlstr, tojsonstr, XMLStream
+from cterasdk.core.files.path import CTERAPath
+from tests.ut import base
+
+
+class TestRecord(base.BaseTest):
+
+    _document = '<obj><att id="objects"><list>' \
+        '<obj class="Log" uuid="1"><att id="id"><val>1</val></att><att id="msg"><val>started</val></att><att id="more" /></obj>' \
+        '<obj class="Log" uuid="2"><att id="id"><val>2</val></att><att id="msg"><val>stopped</val></att><att id="more" /></obj>' \
+        '<obj><att id="class"><val>keyword</val></att></obj><val>3</val>' \
+        '</list></att><att id="hasMore"><val>false</val></att></obj>'
+
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.dict(config.codec, records=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_parse(self):
+        response = fromxmlstr(TestRecord._document)
+        self.assertIsInstance(response, Object)
+        first, second, other, value = response.objects
+        self.assertIsInstance(first, Record)
+        self.assertIs(first.__class__, second.__class__)
+        self.assertEqual((first._classname, first._uuid, first.id, first.msg, first.more),  # pylint: disable=protected-access
+                         ('Log', '1', 1, 'started', None))
+        self.assertIsInstance(other, Object)  # 'class' cannot be stored in a slot
+        self.assertEqual(value, 3)
+
+    def test_same_output(self):
+        records = fromxmlstr(TestRecord._document)
+        config.codec['records'] = False
+        objects = fromxmlstr(TestRecord._document)
+        self.assertEqual(toxmlstr(records), toxmlstr(objects))
+        self.assertEqual(tojsonstr(records), tojsonstr(objects))
+        self.assertEqual(str(records.objects[0]), str(objects.objects[0]))
+
+    def test_modify(self):
+        record = fromxmlstr(TestRecord._document).objects[0]
+        record.msg = 'modified'
+        self.assertEqual(record.__dict__['msg'], 'modified')
+        with self.assertRaises(AttributeError):
+            record.added = True
+        self.assertEqual(copy.deepcopy(record).msg, 'modified')
+        with self.assertRaises(TypeError):
+            record.__dict__['msg'] = 'ignored'
+        with self.assertRaises(TypeError):
+            record.__dict__.update(msg='ignored')
+        self.assertEqual(record.msg, 'modified')
+        self.assertNotIsInstance(record, Object)
+
+    def test_pickle(self):
+        response = fromxmlstr(TestRecord._document)
+        restored = pickle.loads(pickle.dumps(response))
+        self.assertEqual(toxmlstr(restored), toxmlstr(response))
+        self.assertIs(restored.objects[0].__class__, response.objects[0].__class__)
+        record_type = RecordTypes(maxsize=0)
+        with mock.patch('cterasdk.common.record.record_types', record_type):
+            self.assertEqual(pickle.loads(pickle.dumps(response.objects[1])).msg, 'stopped')
+
+    def test_stream(self):
+        stream = XMLStream(io.BytesIO(TestRecord._document.encode('utf-8')), ['objects'])
+        self.assertIsInstance(next(iter(stream)), Record)
+
+    def test_maxsize(self):
+        record_types = RecordTypes(maxsize=1)
+        self.assertIsNotNone(record_types.get('Log', ('id',)))
+        self.assertIsNotNone(record_types.get('Log', ('id',)))
+        self.assertIsNone(record_types.get('Log', ('id', 'msg')))
+
+    def test_compact(self):
+        o = Object()
+        o.name = 'admin'
+        record = compact(o)
+        self.assertEqual(record.__dict__, {'name': 'admin'})
+        self.assertEqual(record.__class__.__name__, 'Record')
+
+    def test_resource_info(self):
+        document = '<obj><att id="items"><list><obj class="ResourceInfo">' \
+            '<att id="href"><val>/ServicesPortal/webdav/Users/My%20Files/doc.txt</val></att></obj></list></att></obj>'
+        resource = fromxmlstr(document).items[0]
+        self.assertIsInstance(resource, Record)
+        self.assertEqual(CTERAPath(resource, '').fullpath(), '/ServicesPortal/webdav/Users/My Files/doc.txt')
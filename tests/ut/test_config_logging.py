@@ -0,0 +1,49 @@
+import io
+import logging
+from unittest import mock
+
+from cterasdk import config
+from cterasdk.common import Object
+from cterasdk.convert import LazyJSON
+from tests.ut import base
+
+
+class TestLazyJSON(base.BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self._value = Object()
+        self._value.name = 'admin'
+        self._value.password = 'secret'
+        self._stream = io.StringIO()
+        self._handler = logging.StreamHandler(self._stream)
+        logger = logging.getLogger()
+        logger.addHandler(self._handler)
+        self.addCleanup(logger.removeHandler, self._handler)
+        self.addCleanup(logger.setLevel, logger.level)
+
+    def test_format(self):
+        logging.getLogger().setLevel(logging.DEBUG)
+        logging.getLogger().debug('Added. %s', {'url': '/users', 'value': LazyJSON(self._value, pretty_print=False)})
+        self.assertEqual(self._stream.getvalue(),
+                         'Added. {\'url\': \'/users\', \'value\': '
+                         '\'{"name": "admin", "password": "*** The Value is Hidden by the SDK ***"}\'}\n')
+
+    def test_deferred(self):
+        logging.getLogger().setLevel(logging.INFO)
+        with mock.patch('cterasdk.convert.format.tojsonstr') as tojsonstr_mock:
+            logging.getLogger().debug('Added. %s', {'url': '/users', 'value': LazyJSON(self._value, pretty_print=False)})
+            tojsonstr_mock.assert_not_called()
+        self.assertEqual(self._stream.getvalue(), '')
+
+    def test_queue(self):
+        logging.getLogger().setLevel(logging.DEBUG)
+        config.Logging.enable_queue()
+        self.addCleanup(config.Logging.disable_queue)
+        self.assertNotIn(self._handler, logging.getLogger().handlers)
+        logging.getLogger().debug('Task status. %s', LazyJSON(self._value, False))
+        self._value.name = 'modified'  # messages are formatted before they are queued
+        config.Logging.disable_queue()
+        self.assertIn(self._handler, logging.getLogger().handlers)
+        self.assertEqual(self._stream.getvalue(),
+                         'Task status. {"name": "admin", "password": "*** The Value is Hidden by the SDK ***"}\n')
@@ -0,0 +1,113 @@
+import threading
+import unittest
+from unittest import mock
+
+from cterasdk import config
+from cterasdk.convert import fromxmlstr, ParseException
+from cterasdk.convert import backend
+from tests.ut import base, test_convert_parse_xml
+
+
+class BackendMixin:
+
+    backend = None
+
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.dict(config.codec, backend=self.backend)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class PythonBackend(BackendMixin):
+    backend = backend.Backend.Python
+
+
+@unittest.skipUnless(backend.lxml_etree is not None, 'lxml is not installed')
+class LXMLBackend(BackendMixin):
+    backend = backend.Backend.LXML
+
+
+class TestParseObjectPython(PythonBackend, test_convert_parse_xml.TestParseObjectXML):
+    pass
+
+
+class TestParseListValuePython(PythonBackend, test_convert_parse_xml.TestParseListValueXML):
+    pass
+
+
+class TestParseValuePython(PythonBackend, test_convert_parse_xml.TestParseValueXML):
+    pass
+
+
+class TestParseNestedPython(PythonBackend, test_convert_parse_xml.TestParseNestedXML):
+    pass
+
+
+class TestParseObjectLXML(LXMLBackend, test_convert_parse_xml.TestParseObjectXML):
+    pass
+
+
+class TestParseListValueLXML(LXMLBackend, test_convert_parse_xml.TestParseListValueXML):
+    pass
+
+
+class TestParseValueLXML(LXMLBackend, test_convert_parse_xml.TestParseValueXML):
+    pass
+
+
+class TestParseNestedLXML(LXMLBackend, test_convert_parse_xml.TestParseNestedXML):
+    pass
+
+
+@unittest.skipUnless(backend.lxml_etree is not None, 'lxml is not installed')
+class TestBackendSelection(base.BaseTest):
+
+    _document = '<?xml version="1.0" encoding="UTF-8"?><!-- comment --><obj class="Share"><att id="name"><!-- comment -->' \
+        '<val>é &amp; ü</val></att><att id="empty"><!-- comment --></att></obj>'
+
+    def test_same_objects(self):
+        objects = []
+        for name in [backend.Backend.Python, backend.Backend.LXML]:
+            with mock.patch.dict(config.codec, backend=name):
+                objects.append(fromxmlstr(TestBackendSelection._document).__dict__)
+        self.assertEqual(objects[0], objects[1])
+        self.assertEqual(objects[1], {'_classname': 'Share', 'name': 'é & ü', 'empty': None})
+
+    def test_selected(self):
+        self.assertEqual(backend.selected(), backend.Backend.Python)
+        with mock.patch.dict(config.codec, backend=backend.Backend.LXML):
+            self.assertEqual(backend.selected(), backend.Backend.LXML)
+            with mock.patch.object(backend, 'lxml_etree', None):
+                self.assertEqual(backend.selected(), backend.Backend.Python)
+                self.assertEqual(backend.available(), [backend.Backend.Python])
+
+    def test_deep_document(self):
+        depth = 300
+        document = '<obj class="Folder">' + '<att id="child"><obj class="Folder">' * depth + '</obj></att>' * depth + '</obj>'
+        objects = []
+        for name in [backend.Backend.Python, backend.Backend.LXML]:
+            with mock.patch.dict(config.codec, backend=name):
+                objects.append(fromxmlstr(document))
+        for obj in objects:
+            for _ in range(depth):
+                obj = obj.child
+            self.assertEqual(obj.__dict__, {'_classname': 'Folder'})
+
+    def test_lxml_missing_warned_once(self):
+        with mock.patch.dict(config.codec, backend=backend.Backend.LXML), mock.patch.object(backend, 'lxml_etree', None), \
+                mock.patch.object(backend, '_lxml_missing', threading.Event()), mock.patch('logging.Logger.warning') as warning:
+            for _ in range(3):
+                self.assertEqual(backend.selected(), backend.Backend.Python)
+        warning.assert_called_once()
+
+    def test_parse_error(self):
+        for name in [backend.Backend.Python, backend.Backend.LXML]:
+            with mock.patch.dict(config.codec, backend=name):
+                with self.assertRaises(ParseException):
+                    fromxmlstr('<obj><att id="a"></obj>')
+
+    def test_entities_not_resolved(self):
+        document = '<!DOCTYPE val [<!ENTITY e SYSTEM "file:///etc/hostname">]><val>&e;</val>'
+        with mock.patch.dict(config.codec, backend=backend.Backend.LXML):
+            self.assertIsNone(fromxmlstr(document))
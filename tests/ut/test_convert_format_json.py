@@ -1,6 +1,8 @@
+import io
 import json
 
 from cterasdk import Object
+from cterasdk.convert import tojsonstream
 from tests.ut import base_convert
 
 
@@ -55,3 +57,25 @@ class TestFormatObjectJSON(base_convert.TestJSON):
         o.password = 'secret'
         object_str_json = json.loads(base_convert.TestJSON._tojsonstr(o, False, True))
         self.assertEqual(object_str_json['password'], "*** The Value is Hidden by the SDK ***")
+
+    def test_nested_sensitive_object(self):
+        o = Object()
+        o.users = [Object()]
+        o.users[0].name = 'alice'
+        o.users[0].password = 'secret'
+        o.cloudSync = Object()
+        o.cloudSync.encPassphrase = 'secret'
+        object_str_json = json.loads(base_convert.TestJSON._tojsonstr(o, False, True))
+        self.assertEqual(object_str_json['users'][0], {'name': 'alice', 'password': '*** The Value is Hidden by the SDK ***'})
+        self.assertEqual(object_str_json['cloudSync']['encPassphrase'], '*** The Value is Hidden by the SDK ***')
+        self.assertEqual((o.users[0].password, o.cloudSync.encPassphrase), ('secret', 'secret'))
+
+    def test_stream(self):
+        o = Object()
+        o.drives = ['SATA-' + str(i) for i in range(1, 4)]
+        o.password = 'secret'
+        for pretty_print in [True, False]:
+            for no_log in [True, False]:
+                fp = io.StringIO()
+                tojsonstream(o, fp, pretty_print, no_log)
+                self.assertEqual(fp.getvalue(), base_convert.TestJSON._tojsonstr(o, pretty_print, no_log))
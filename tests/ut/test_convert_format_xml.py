@@ -1,4 +1,5 @@
 from cterasdk import Object
+from cterasdk.convert import toxmlstr, XMLBody
 from tests.ut import base_convert
 
 
@@ -63,3 +64,30 @@ class TestFormatValueXML(base_convert.TestXML):
     def test_float(self):
         value = 0.6901
         self.assertEqual(base_convert.TestXML._toxmlstr(value), base_convert.TestXML._format_value(value))
+
+
+class TestFormatNestedXML(base_convert.TestXML):
+
+    def test_classname_and_escaping(self):
+        o = Object()
+        o._classname = 'ShareConfig'  # pylint: disable=protected-access
+        o._uuid = '6f0e8c79'  # pylint: disable=protected-access
+        o.name = 'a & <b> é'
+        o.empty = ''
+        o.acl = [None]
+        o.members = [Object()]
+        self.assertEqual(base_convert.TestXML._toxmlstr(o), '<obj class="ShareConfig" uuid="6f0e8c79">'
+                         '<att id="name"><val>a &amp; &lt;b&gt; &#233;</val></att>'
+                         '<att id="empty"><val /></att>'
+                         '<att id="acl"><list /></att>'
+                         '<att id="members"><list><obj /></list></att>'
+                         '</obj>')
+
+    def test_chunks(self):
+        o = Object()
+        o.objects = [{'skipped': True}] + ['value %s' % index for index in range(1000)]
+        chunks = list(XMLBody(o, chunk_size=1024))
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(chunk) < 1024 + 64 for chunk in chunks))
+        self.assertEqual(b''.join(chunks), toxmlstr(o))
+        self.assertEqual(b''.join(chunks), b''.join(XMLBody(o, chunk_size=1024)))  # iterable more than once
@@ -1,4 +1,10 @@
-from cterasdk import fromjsonstr
+import json
+import io
+from unittest import mock
+
+from cterasdk import fromjsonstr, Object
+from cterasdk.convert import fromjsonstream, tojsonstream, ParseException
+from cterasdk.convert.parse import JSONStream
 from tests.ut import base_convert
 
 
@@ -42,3 +48,52 @@ class TestParseObjectJSON(base_convert.TestJSON):
         self.assertEqual(o[1].serial, 'JPW9K0N01968XL')
         self.assertEqual(o[1].firmware, 'JP4OA3EA')
         self.assertEqual(o[1].logicalCapacity, 952830)
+
+    def test_json_nested(self):
+        o = fromjsonstr('{"_classname": "ShareConfig", "name": "public", "acl": [{"principal2": {"name": "admin"}}], "comment": null}')
+        self.assertIsInstance(o.acl[0].principal2, Object)
+        self.assertEqual(o.__dict__, {'_classname': 'ShareConfig', 'name': 'public', 'acl': [o.acl[0]], 'comment': None})
+        self.assertEqual(o.acl[0].principal2.name, 'admin')
+
+    def test_json_empty(self):
+        self.assertEqual(fromjsonstr(''), '')
+        self.assertIsNone(fromjsonstr(None))
+
+
+class TestParseJSONStream(base_convert.TestJSON):
+
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.object(JSONStream, 'chunk_size', 7)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_stream(self):
+        objects = []
+        for index in range(50):
+            o = Object()
+            o.id = index
+            o.msg = 'Übertragung %s' % index
+            o.more = None
+            objects.append(o)
+        fp = io.StringIO()
+        tojsonstream(objects, fp, no_log=False)
+        for source in [io.StringIO(fp.getvalue()), io.BytesIO(fp.getvalue().encode('utf-8'))]:
+            members = list(fromjsonstream(source))
+            self.assertEqual([member.__dict__ for member in members], [o.__dict__ for o in objects])
+
+    def test_stream_values(self):
+        self.assertEqual(list(fromjsonstream(io.StringIO(' [ ] '))), [])
+        self.assertEqual(list(fromjsonstream(io.StringIO('[1234567, 2.5e3, "a", true, null, []]'))), [1234567, 2500.0, 'a', True, None, []])
+
+    def test_stream_large_member(self):
+        member = {'msg': 'x' * 100000}
+        source = io.StringIO(json.dumps([member, member]))
+        with mock.patch.object(source, 'read', wraps=source.read) as read:
+            self.assertEqual([m.__dict__ for m in fromjsonstream(source)], [member, member])
+        self.assertLess(read.call_count, 40)
+
+    def test_stream_parse_error(self):
+        for string in ['', '{}', '[1,', '[1 2]', '[1,]', '[{"a": }]']:
+            with self.assertRaises(ParseException):
+                list(fromjsonstream(io.StringIO(string)))
@@ -114,3 +114,28 @@ class TestParseValueXML(base_convert.TestXML):
         original_value = 0.6901
         formatted_value = base_convert.TestXML._format_value(original_value)
         self.assertEqual(base_convert.TestXML._fromxmlstr(formatted_value), original_value)
+
+
+class TestParseNestedXML(base_convert.TestXML):
+
+    def test_classname_and_uuid(self):
+        o = base_convert.TestXML._fromxmlstr('<obj class="ShareConfig" uuid="6f0e8c79"><att id="name"><val>share</val></att></obj>')
+        self.assertEqual(o._classname, 'ShareConfig')  # pylint: disable=protected-access
+        self.assertEqual(o._uuid, '6f0e8c79')  # pylint: disable=protected-access
+        self.assertEqual(list(o.__dict__), ['_classname', '_uuid', 'name'])
+
+    def test_nested(self):
+        o = base_convert.TestXML._fromxmlstr('<obj><att id="a"><obj><att id="b"><list><obj><att id="c" /></obj>'
+                                             '<val>1</val><list><val>2</val></list></list></att></obj></att>'
+                                             '<att id="d"><list /></att></obj>')
+        self.assertIsNone(o.a.b[0].c)
+        self.assertEqual(o.a.b[1], 1)
+        self.assertEqual(len(o.a.b), 2)  # nested lists are not list members
+        self.assertEqual(o.d, [])
+        self.assertEqual(list(o.__dict__), ['a', 'd'])
+
+    def test_unknown_elements(self):
+        self.assertIsNone(base_convert.TestXML._fromxmlstr('<att id="a"><val>1</val></att>'))
+        o = base_convert.TestXML._fromxmlstr('<obj><att id="a"><unknown /></att><val>1</val><att id="b"><val /></att></obj>')
+        self.assertFalse(hasattr(o, 'a'))
+        self.assertIsNone(o.b)
@@ -0,0 +1,85 @@
+import copy
+from unittest import mock
+
+from cterasdk import config, Object
+from cterasdk.convert import fromxmlstr, toxmlstr, tojsonstr, LazyObject, materialize
+from tests.ut import base_convert, test_convert_parse_xml
+
+
+class LazyMixin:
+
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.dict(config.codec, lazy=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TestParseObjectLazy(LazyMixin, test_convert_parse_xml.TestParseObjectXML):
+    pass
+
+
+class TestParseListValueLazy(LazyMixin, test_convert_parse_xml.TestParseListValueXML):
+    pass
+
+
+class TestParseValueLazy(LazyMixin, test_convert_parse_xml.TestParseValueXML):
+    pass
+
+
+class TestLazyObject(base_convert.TestXML):
+
+    _document = '<obj class="Config" uuid="1234"><att id="device"><obj class="DeviceConfig"><att id="hostname"><val>vGateway</val>' \
+        '</att><att id="location" /></obj></att><att id="shares"><list><obj><att id="name"><val>public</val></att></obj></list>' \
+        '</att><att id="empty" /><att id="ignored"><unknown /></att></obj>'
+
+    def test_access(self):
+        o = fromxmlstr(TestLazyObject._document, lazy=True)
+        self.assertIsInstance(o, LazyObject)
+        self.assertEqual(o.__dict__, {'_classname': 'Config', '_uuid': '1234'})
+        self.assertEqual(o.device.hostname, 'vGateway')
+        self.assertEqual(list(o.__dict__), ['_classname', '_uuid', 'device'])
+        self.assertIsNone(o.device.location)
+        self.assertEqual(o.shares[0].name, 'public')
+        self.assertIsNone(o.empty)
+        self.assertFalse(hasattr(o, 'ignored'))
+        self.assertFalse(hasattr(o, 'missing'))
+
+    def test_round_trip(self):
+        eager = fromxmlstr(TestLazyObject._document)
+        o = fromxmlstr(TestLazyObject._document, lazy=True)
+        self.assertEqual(toxmlstr(o), toxmlstr(eager))
+        o = fromxmlstr(TestLazyObject._document, lazy=True)
+        self.assertEqual(tojsonstr(o, no_log=False), tojsonstr(eager, no_log=False))
+        o = fromxmlstr(TestLazyObject._document, lazy=True)
+        self.assertEqual(str(o), str(eager))
+
+    def test_str_nested(self):
+        o = Object()
+        o.config = fromxmlstr(TestLazyObject._document, lazy=True)
+        eager = Object()
+        eager.config = fromxmlstr(TestLazyObject._document)
+        self.assertEqual(str(o), str(eager))
+
+    def test_modify(self):
+        o = fromxmlstr(TestLazyObject._document, lazy=True)
+        o.empty = 'value'
+        o.added = 1
+        o.device.hostname = 'renamed'
+        materialize(o)
+        self.assertEqual(list(o.__dict__), ['_classname', '_uuid', 'device', 'shares', 'empty', 'added'])
+        self.assertEqual(o.empty, 'value')
+        self.assertIn(b'<val>renamed</val>', toxmlstr(o))
+
+    def test_delete(self):
+        o = fromxmlstr(TestLazyObject._document, lazy=True)
+        del o.shares
+        self.assertNotIn(b'shares', toxmlstr(o))
+
+    def test_deepcopy(self):
+        o = copy.deepcopy(fromxmlstr(TestLazyObject._document, lazy=True))
+        self.assertEqual(o.device.hostname, 'vGateway')
+        self.assertEqual(toxmlstr(o), toxmlstr(fromxmlstr(TestLazyObject._document)))
+
+    def test_eager_by_default(self):
+        self.assertNotIsInstance(fromxmlstr(TestLazyObject._document), LazyObject)
@@ -0,0 +1,139 @@
+import io
+import json
+from unittest import mock
+from http.server import BaseHTTPRequestHandler
+
+from cterasdk import config
+from cterasdk.client.cteraclient import CTERAClient
+from cterasdk.convert import fromxmlstr, fromxmlstream, tojsonstr, XMLStream, ParseException
+from cterasdk.core import query
+from cterasdk.lib import Iterator, Command
+from tests.ut import base_convert
+
+
+def _page(count, more):
+    objects = ''.join('<obj class="Log"><att id="id"><val>%s</val></att><att id="msg"><val>message %s</val></att>'
+                      '<att id="more" /></obj>' % (index, index) for index in range(count))
+    return ('<obj><att id="hasMore"><val>%s</val></att><att id="objects"><list>%s</list></att>'
+            '<att id="total"><val>%s</val></att></obj>' % (str(more).lower(), objects, count)).encode('utf-8')
+
+
+class QueryHandler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        self.rfile.read(int(self.headers['Content-Length']))
+        self._respond(_page(3, False))
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self._respond(b'<val>ok</val>')
+
+    def _respond(self, body):
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+class TestParseXMLStream(base_convert.TestXML):
+
+    def test_same_as_fromxmlstr(self):
+        documents = [
+            _page(5, True),
+            b'<list><val>1</val><val>2.5</val><val>true</val><obj uuid="1234"><att id="a"><list /></att></obj></list>',
+            b'<val>text</val>',
+            b'<obj><att id="a"><obj><att id="b"><list><obj class="C"><att id="d" /></obj></list></att></obj></att></obj>'
+        ]
+        for document in documents:
+            self.assertEqual(json.loads(tojsonstr(fromxmlstream(io.BytesIO(document)), no_log=False)),
+                             json.loads(tojsonstr(fromxmlstr(document.decode('utf-8')), no_log=False)))
+
+    def test_yield_members(self):
+        stream = XMLStream(io.BytesIO(_page(3, True)), ['objects'])
+        members = []
+        for member in stream:
+            members.append(member)
+        self.assertEqual([member.msg for member in members], ['message 0', 'message 1', 'message 2'])
+        self.assertEqual(members[0]._classname, 'Log')  # pylint: disable=protected-access
+        self.assertIsNone(members[0].more)
+        self.assertEqual(stream.value.objects, [])
+        self.assertTrue(stream.value.hasMore)
+        self.assertEqual(stream.value.total, 3)
+
+    def test_chunked_read(self):
+        source = io.BytesIO(_page(100, False))
+        self.patch_property('cterasdk.convert.parse.XMLStream.chunk_size', return_value=7)
+        self.assertEqual(len(list(XMLStream(source, ['objects']))), 100)
+
+    def test_close(self):
+        closed = []
+        stream = XMLStream(io.BytesIO(_page(3, False)), ['objects'], lambda: closed.append(True))
+        self.assertFalse(stream.value.hasMore)
+        self.assertEqual(closed, [True])
+
+    def test_abandon(self):
+        closed = []
+        members = iter(XMLStream(io.BytesIO(_page(3, False)), ['objects'], lambda: closed.append(True)))
+        next(members)
+        self.assertFalse(closed)
+        members.close()
+        self.assertEqual(closed, [True])
+
+    def test_empty(self):
+        self.assertIsNone(fromxmlstream(io.BytesIO(b'')))
+
+    def test_parse_error(self):
+        with self.assertRaises(ParseException):
+            fromxmlstream(io.BytesIO(b'<obj><att id="a"><val>1</val></obj>'))
+
+    def test_iterator(self):
+        pages = [_page(2, True), _page(1, False)]
+
+        def function(_param):
+            stream = XMLStream(io.BytesIO(pages.pop(0)), ['objects'])
+            return (lambda: stream.value.hasMore, stream)
+
+        param = query.QueryParamBuilder().build()
+        self.assertEqual([obj.id for obj in Iterator(Command(function), param)], [0, 1, 0])
+        self.assertEqual(param.startFrom, 100)
+
+
+class TestClientXMLStream(base_convert.TestXML):
+
+    def setUp(self):
+        super().setUp()
+        self._baseurl = self.serve(QueryHandler)
+
+    def test_db_stream(self):
+        client = CTERAClient('JSESSIONID')
+        stream = client.db_stream(self._baseurl, '/users', 'query', query.QueryParamBuilder().build(), ['objects'])
+        self.assertEqual([obj.id for obj in stream], [0, 1, 2])
+        self.assertFalse(stream.value.hasMore)
+        client.get(self._baseurl, '/status')
+        self.assertEqual(client.connection_stats().new_connections, 1)
+
+    def test_query_streaming(self):
+        client = CTERAClient('JSESSIONID')
+        host = mock.MagicMock()
+        host.db_stream.side_effect = lambda path, name, param, members: client.db_stream(self._baseurl, path, name, param, members)
+        with mock.patch.dict(config.http, streaming=True):
+            objects = list(query.iterator(host, '/users', query.QueryParamBuilder().build()))
+        self.assertEqual([obj.msg for obj in objects], ['message 0', 'message 1', 'message 2'])
+        host.db.assert_not_called()
+
+    def test_query_eager_when_streaming(self):
+        client = CTERAClient('JSESSIONID')
+        host = mock.MagicMock()
+        host.db.side_effect = lambda path, name, param: client.db(self._baseurl, path, name, param)
+        with mock.patch.dict(config.http, streaming=True):
+            hasMore, objects = query.query(host, '/users', query.QueryParamBuilder().build())
+            self.assertIs(hasMore, False)
+            self.assertEqual([obj.id for obj in objects], [0, 1, 2])
+            with mock.patch('builtins.print') as output:
+                self.assertIs(query.show(host, '/users', query.QueryParamBuilder().build()), False)
+        self.assertIn('message 0', output.call_args[0][0])
+        host.db_stream.assert_not_called()
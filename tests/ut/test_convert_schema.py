@@ -0,0 +1,64 @@
+import io
+
+from cterasdk import config
+from cterasdk.convert import fromxmlstr, XMLStream, materialize, schemas
+from cterasdk.convert.parse import ParseValue
+from tests.ut import base
+
+
+class TestParseValue(base.BaseTest):
+
+    def test_values(self):
+        for text, value in [('42', 42), (' 42 ', 42), ('-3', -3), ('12.5', 12.5), ('7.0', 7.0), ('true', True), (' false ', False),
+                            ('admin', 'admin'), (' admin ', 'admin'), ('10.0.0.1', '10.0.0.1'), ('6.0.589.0', '6.0.589.0'),
+                            ('2024-01-01T00:00:00', '2024-01-01T00:00:00'), ('', ''), (None, None)]:
+            self.assertEqual(ParseValue(text), value)
+            self.assertIs(type(ParseValue(text)), type(value))
+
+
+class TestParseTypedValue(base.BaseTest):
+
+    _document = '<obj><att id="objects"><list>' \
+        '<obj class="Device"><att id="name"><val>0042</val></att><att id="version"><val>7.0</val></att>' \
+        '<att id="uid"><val>15</val></att><att id="enabled"><val>true</val></att><att id="quota"><val>10</val></att>' \
+        '<att id="ip"><val>10.0.0.1</val></att><att id="description" /></obj>' \
+        '<obj class="Server"><att id="version"><val>7.0</val></att></obj>' \
+        '</list></att></obj>'
+
+    _expected = dict(name='0042', version='7.0', uid=15, enabled=True, quota=10.0, ip='10.0.0.1', description=None)
+
+    def setUp(self):
+        super().setUp()
+        schemas.register('Device', dict(name=str, version=str, uid=int, enabled=bool, quota=float, ip=int))
+        self.addCleanup(schemas.clear)
+
+    def test_parse(self):
+        device, server = fromxmlstr(TestParseTypedValue._document).objects
+        self._assert_device(device.__dict__)
+        self.assertEqual(server.version, 7.0)
+
+    def test_lazy(self):
+        config.codec['lazy'] = True
+        self.addCleanup(config.codec.__setitem__, 'lazy', False)
+        device, server = fromxmlstr(TestParseTypedValue._document).objects
+        self.assertEqual(device.version, '7.0')
+        self._assert_device(materialize(device).__dict__)
+        self.assertEqual(server.version, 7.0)
+
+    def test_stream(self):
+        device, server = XMLStream(io.BytesIO(TestParseTypedValue._document.encode('utf-8')), ['objects'])
+        self._assert_device(device.__dict__)
+        self.assertEqual(server.version, 7.0)
+
+    def test_unregister(self):
+        schemas.unregister('Device')
+        self.assertEqual(fromxmlstr(TestParseTypedValue._document).objects[0].version, 7.0)
+
+    def test_unsupported_type(self):
+        with self.assertRaises(ValueError):
+            schemas.register('Device', dict(created=list))
+
+    def _assert_device(self, attributes):
+        self.assertEqual(attributes, dict(_classname='Device', **TestParseTypedValue._expected))
+        for name, value in TestParseTypedValue._expected.items():
+            self.assertIs(type(attributes[name]), type(value))
@@ -0,0 +1,92 @@
+import asyncio
+import array
+import unittest
+
+from cterasdk.common import Object
+from cterasdk.core import query
+from cterasdk.lib import Iterator, AsyncIterator
+from cterasdk.lib.columns import Column, Columns, numpy, pyarrow
+from tests.ut import base
+
+
+def _device(name, version, usage, connected, license_type=None):
+    device = Object()
+    device.name = name
+    device.runningFirmware = version
+    device.usage = usage
+    device.connected = connected
+    if license_type is not None:
+        device.licenseSettings = Object()
+        device.licenseSettings.license = license_type
+    return device
+
+
+class TestColumns(base.BaseTest):
+
+    _fields = ['name', 'runningFirmware', 'usage', 'connected', 'licenseSettings.license']
+
+    def setUp(self):
+        super().setUp()
+        self._pages = [
+            (True, [_device('vGateway-1', '7.6.1.0', 10, True, 'EV16'), _device('vGateway-2', '7.6.1.0', 2.5, False)]),
+            (False, [_device('vGateway-3', '7.5.0.0', None, True, 'EV32')])
+        ]
+
+    def _iterator(self):
+        return Iterator(lambda _param: self._pages.pop(0), query.QueryParamBuilder().build())
+
+    def test_to_columns(self):
+        columns = self._iterator().to_columns(TestColumns._fields)
+        self.assertEqual(len(columns), 3)
+        self.assertEqual(list(columns['name']), ['vGateway-1', 'vGateway-2', 'vGateway-3'])
+        self.assertIs(columns['runningFirmware'][0], columns['runningFirmware'][1])  # interned
+        usage = columns['usage']
+        self.assertEqual((usage.type, usage.values, list(usage)), (float, array.array('d', [10, 2.5, 0]), [10.0, 2.5, None]))
+        self.assertEqual((columns['connected'].type, list(columns['connected'])), (bool, [True, False, True]))
+        self.assertEqual(list(columns['licenseSettings.license']), ['EV16', None, 'EV32'])
+
+    def test_async_to_columns(self):
+        async def function(_param):
+            return self._pages.pop(0)
+        columns = asyncio.run(AsyncIterator(function, query.QueryParamBuilder().build()).to_columns(['name']))
+        self.assertEqual(list(columns['name']), ['vGateway-1', 'vGateway-2', 'vGateway-3'])
+
+    def test_types(self):
+        columns = Columns(['uid', 'name'], dict(uid=float))
+        for uid, name in [(1, 'admin'), (None, 2)]:
+            o = Object()
+            o.uid, o.name = uid, name
+            columns.append(o)
+        self.assertEqual((columns['uid'].type, columns['uid'].values), (float, array.array('d', [1, 0])))
+        self.assertEqual((columns['name'].type, list(columns['name'])), (object, ['admin', 2]))
+
+    def test_nulls(self):
+        column = Column('uid')
+        for value in [None, None, 5]:
+            column.append(value)
+        self.assertEqual((column.type, column.values, column.nulls), (int, array.array('q', [0, 0, 5]), array.array('b', [1, 1, 0])))
+
+    def test_overflow(self):
+        column = Column('size')
+        for value in [1, None, 2 ** 63]:
+            column.append(value)
+        self.assertEqual((column.type, list(column)), (object, [1, None, 2 ** 63]))
+        column = Column('size', float)
+        for value in [1.5, 10 ** 400]:
+            column.append(value)
+        self.assertEqual((column.type, list(column)), (object, [1.5, 10 ** 400]))
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_to_numpy(self):
+        columns = self._iterator().to_columns(TestColumns._fields)
+        arrays = columns.to_numpy()
+        self.assertEqual(arrays['usage'].sum(), 12.5)
+        self.assertEqual(arrays['connected'].tolist(), [True, False, True])
+        self.assertEqual(arrays['name'].tolist(), ['vGateway-1', 'vGateway-2', 'vGateway-3'])
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_to_arrow(self):
+        columns = self._iterator().to_columns(TestColumns._fields)
+        table = columns.to_arrow()
+        self.assertEqual(table.column('usage').to_pylist(), [10.0, 2.5, None])
+        self.assertEqual(table.column('runningFirmware').to_pylist(), ['7.6.1.0', '7.6.1.0', '7.5.0.0'])
@@ -0,0 +1,166 @@
+import time
+import threading
+from unittest import mock
+
+from cterasdk import config
+from cterasdk.core import query
+from cterasdk.exception import CTERAException
+from cterasdk.lib import Iterator
+from tests.ut import base
+
+
+class TestIteratorPrefetch(base.BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self._pages = 10
+        self._calls = []
+        self._lock = threading.Lock()
+
+    def _function(self, param):
+        with self._lock:
+            self._calls.append(param.startFrom)
+        page = param.startFrom // param.countLimit
+        if page == 3 and self._pages < 0:
+            raise CTERAException('Failed to fetch page')
+        return (page < abs(self._pages) - 1, [page * 10 + index for index in range(3)])
+
+    def _iterator(self):
+        param = query.QueryParamBuilder().build()
+        return Iterator(self._function, param), param
+
+    def test_same_objects(self):
+        iterator, param = self._iterator()
+        expected = list(iterator)
+        self._calls = []
+        iterator, prefetch_param = self._iterator()
+        self.assertEqual(list(iterator.prefetch(2)), expected)
+        self.assertEqual(len(expected), 30)
+        self.assertEqual((prefetch_param.startFrom, len(self._calls)), (param.startFrom, 10))
+
+    def test_config(self):
+        with mock.patch.dict(config.http, prefetch=3):
+            iterator, _ = self._iterator()
+            self.assertEqual(list(iterator), list(self._iterator()[0]))
+            self.assertIsNotNone(iterator._fetcher)  # pylint: disable=protected-access
+
+    def test_bounded(self):
+        iterator, _ = self._iterator()
+        with iterator.prefetch(2):
+            next(iterator)
+            self._wait(4)
+            time.sleep(0.3)
+            self.assertEqual(len(self._calls), 4)  # the consumed page, two pending pages and a page waiting to be queued
+            for _ in range(3):
+                next(iterator)
+            self._wait(5)
+        time.sleep(0.3)
+        self.assertEqual(len(self._calls), 5)  # stopped once closed
+
+    def test_error(self):
+        self._pages = -10
+        iterator, _ = self._iterator()
+        objects = []
+        with self.assertRaises(CTERAException):
+            for obj in iterator.prefetch(2):
+                objects.append(obj)
+        self.assertEqual(len(objects), 9)
+        with self.assertRaises(CTERAException):
+            next(iterator)  # raised again, instead of waiting for a page
+
+    def test_closed(self):
+        iterator, _ = self._iterator()
+        with iterator.prefetch(2):
+            next(iterator)
+        self.assertEqual(list(iterator), [1, 2])  # the objects of the current page
+
+    def test_stream(self):
+        def function(param):
+            page = param.startFrom // param.countLimit
+            return (lambda: page < 2, iter([page]))
+        self.assertEqual(list(Iterator(function, query.QueryParamBuilder().build()).prefetch(1)), [0, 1, 2])
+
+    def test_abandoned(self):
+        iterator, _ = self._iterator()
+        for _ in iterator.prefetch(2):
+            break
+        self.assertTrue(iterator._fetcher._closed.is_set())  # pylint: disable=protected-access
+
+    def _wait(self, calls):
+        deadline = time.monotonic() + 5
+        while len(self._calls) < calls and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+
+class TestIteratorParallel(TestIteratorPrefetch):
+
+    def test_same_objects(self):
+        expected = list(self._iterator()[0])
+        self._calls = []
+        iterator, _ = self._iterator()
+        self.assertEqual(list(iterator.parallel(4)), expected)
+        self.assertEqual(sorted(self._calls), [page * 50 for page in range(len(self._calls))])
+        self.assertLessEqual(len(self._calls), 10 + 3)  # up to workers - 1 pages past the last page
+
+    def test_unordered(self):
+        expected = list(self._iterator()[0])
+        iterator, _ = self._iterator()
+        self.assertEqual(sorted(iterator.parallel(4, ordered=False)), sorted(expected))
+
+    def test_discard(self):
+        self._pages = 2
+        iterator, _ = self._iterator()
+        self.assertEqual(list(iterator.parallel(8)), [0, 1, 2, 10, 11, 12])
+
+    def test_config(self):
+        with mock.patch.dict(config.http, query_workers=3, query_ordered=True):
+            iterator, _ = self._iterator()
+            self.assertEqual(list(iterator), list(self._iterator()[0]))
+            self.assertIsNotNone(iterator._fetcher)  # pylint: disable=protected-access
+
+    def test_bounded(self):
+        iterator, _ = self._iterator()
+        with iterator.parallel(2):
+            next(iterator)
+            self._wait(3)
+            time.sleep(0.3)
+            self.assertEqual(len(self._calls), 3)  # the consumed page and two pages in progress
+
+    def test_error(self):
+        self._pages = -10
+        iterator, _ = self._iterator()
+        objects = []
+        with self.assertRaises(CTERAException):
+            for obj in iterator.parallel(2):
+                objects.append(obj)
+        self.assertEqual(len(objects), 9)
+        with self.assertRaises(CTERAException):
+            next(iterator)  # raised again, instead of reporting no more objects
+
+    def test_closed(self):
+        iterator, _ = self._iterator()
+        with iterator.parallel(2):
+            next(iterator)
+        self.assertEqual(list(iterator), [1, 2])  # the objects of the current page
+
+    def test_stream(self):
+        def function(param):
+            page = param.startFrom // param.countLimit
+            return (lambda: page < 2, iter([page]))
+        self.assertEqual(list(Iterator(function, query.QueryParamBuilder().build()).parallel(3)), [0, 1, 2])
+
+    def test_abandoned(self):
+        iterator, _ = self._iterator()
+        for _ in iterator.parallel(2):
+            break
+        executor = iterator._fetcher._executor  # pylint: disable=protected-access
+        self.assertTrue(executor._shutdown)  # pylint: disable=protected-access
+        executor.shutdown(wait=True)
+        self.assertFalse(any(thread.is_alive() for thread in executor._threads))  # pylint: disable=protected-access
+
+    def test_unordered_discard(self):
+        def function(param):
+            page = param.startFrom // param.countLimit
+            time.sleep(0.1 if page == 1 else 0)
+            return (page < 1, [page])  # pages past the last page have objects, and are fetched first
+        self.assertEqual(sorted(Iterator(function, query.QueryParamBuilder().build()).parallel(4, ordered=False)), [0, 1])